@@ -7,6 +7,9 @@ Created on Mon Apr 28 20:19:46 2025.
 Purpose: Create a Chessbot
 """
 
+# Imports
+import chess
+
 
 # Functions
 def fen_to_space(board):
@@ -26,3 +29,238 @@ def fen_to_space(board):
     for i in range(1, 9):
         board_fen = board_fen.replace(str(i), '-'*i)
     return board_fen
+
+
+def position_key(board):
+    """
+    Return a hashable key identifying the current position.
+
+    Two boards have the same key when the pieces, side to move, castling
+    rights and en passant square are the same. Move counters are ignored.
+
+    Arguments
+    ---------
+    board : the current board position.
+
+    Returns
+    -------
+    key: a tuple of the board's bitboards and state.
+    """
+    return (board.pawns, board.knights, board.bishops, board.rooks,
+            board.queens, board.kings, board.occupied_co[0],
+            board.occupied_co[1], board.turn, board.castling_rights,
+            board.ep_square)
+
+
+def position_hash(board):
+    """
+    Return a 64-bit hash of the current position.
+
+    The hash is built from the same fields as position_key. It only uses
+    integers, so it is the same in every process and can key tables shared
+    between processes.
+
+    Arguments
+    ---------
+    board : the current board position.
+
+    Returns
+    -------
+    key: an unsigned 64-bit integer.
+    """
+    return hash((board.pawns, board.knights, board.bishops, board.rooks,
+                 board.queens, board.kings, board.occupied_co[0],
+                 board.occupied_co[1], board.turn, board.castling_rights,
+                 board.ep_square or 0)) & 0xFFFFFFFFFFFFFFFF
+
+
+def encode_move(move):
+    """
+    Pack a move into 16 bits.
+
+    Bits 0-5 hold the from square, bits 6-11 the to square and bits 12-14 the
+    promotion piece type. A null move or None packs to 0.
+
+    Arguments
+    ---------
+    move : a chess.Move or None.
+
+    Returns
+    -------
+    code: an integer between 0 and 2**15 - 1.
+    """
+    if not move:
+        return 0
+    return (move.from_square | move.to_square << 6
+            | (move.promotion or 0) << 12)
+
+
+def decode_move(code):
+    """
+    Unpack a move packed by encode_move.
+
+    Arguments
+    ---------
+    code : an integer made by encode_move.
+
+    Returns
+    -------
+    move: a chess.Move, or None for 0.
+    """
+    if not code:
+        return None
+    return chess.Move(code & 63, code >> 6 & 63, code >> 12 or None)
+
+
+# Piece values used by static_exchange, in centipawns, indexed by piece type
+SEE_VALUES = (0, 100, 320, 330, 500, 900, 20000)
+
+
+def attackers_to(board, square, occupied):
+    """
+    Return the pieces of both colors attacking a square.
+
+    Sliding attacks are traced through the given occupancy rather than the
+    board's, so pieces lined up behind a removed piece are found.
+
+    Arguments
+    ---------
+    board : the current board position.
+    square : the square attacked.
+    occupied : the bitboard of squares treated as occupied.
+
+    Returns
+    -------
+    attackers: a bitboard of the attacking pieces still in occupied.
+    """
+    rooks = board.rooks | board.queens
+    bishops = board.bishops | board.queens
+    attackers = (
+        chess.BB_KNIGHT_ATTACKS[square] & board.knights
+        | chess.BB_KING_ATTACKS[square] & board.kings
+        | chess.BB_PAWN_ATTACKS[chess.WHITE][square] & board.pawns
+        & board.occupied_co[chess.BLACK]
+        | chess.BB_PAWN_ATTACKS[chess.BLACK][square] & board.pawns
+        & board.occupied_co[chess.WHITE]
+        | chess.BB_RANK_ATTACKS[square][chess.BB_RANK_MASKS[square]
+                                        & occupied] & rooks
+        | chess.BB_FILE_ATTACKS[square][chess.BB_FILE_MASKS[square]
+                                        & occupied] & rooks
+        | chess.BB_DIAG_ATTACKS[square][chess.BB_DIAG_MASKS[square]
+                                        & occupied] & bishops)
+    return attackers & occupied
+
+
+def static_exchange(board, move):
+    """
+    Return the material won by a move once all captures on its square end.
+
+    Both sides recapture on the target square with their least valuable
+    attacker, and either may stop when recapturing would lose material.
+    Attackers behind the pieces which have captured, such as a rook behind
+    a rook on the same file, join in as the line opens. Pins and checks are
+    ignored.
+
+    Arguments
+    ---------
+    board : the current board position, before the move.
+    move : the move to evaluate, usually a capture.
+
+    Returns
+    -------
+    gain: the material gained by the side to move, in centipawns.
+    """
+    to_square = move.to_square
+    occupied = board.occupied ^ chess.BB_SQUARES[move.from_square]
+    if board.is_en_passant(move):
+        victim = chess.PAWN
+        occupied ^= chess.BB_SQUARES[board.ep_square ^ 8]
+    else:
+        victim = board.piece_type_at(to_square)
+    gains = [SEE_VALUES[victim] if victim else 0]
+    # Value of the piece standing on the square, which the next capture wins
+    if move.promotion:
+        gains[0] += SEE_VALUES[move.promotion] - SEE_VALUES[chess.PAWN]
+        on_square = SEE_VALUES[move.promotion]
+    else:
+        on_square = SEE_VALUES[board.piece_type_at(move.from_square)]
+    occupied |= chess.BB_SQUARES[to_square]
+
+    side = not board.turn
+    piece_masks = (board.pawns, board.knights, board.bishops, board.rooks,
+                   board.queens, board.kings)
+    attackers = attackers_to(board, to_square, occupied)
+    while True:
+        ours = attackers & board.occupied_co[side]
+        if not ours:
+            break
+        for piece_type, mask in enumerate(piece_masks, 1):
+            if ours & mask:
+                break
+        if (piece_type == chess.KING
+                and attackers & board.occupied_co[not side]):
+            # The king may not capture into an attacked square
+            break
+        gains.append(on_square - gains[-1])
+        on_square = SEE_VALUES[piece_type]
+        occupied ^= (ours & mask) & -(ours & mask)
+        attackers = attackers_to(board, to_square, occupied)
+        side = not side
+
+    for index in range(len(gains) - 1, 0, -1):
+        gains[index - 1] = -max(-gains[index - 1], gains[index])
+    return gains[0]
+
+
+def has_free_move(board):
+    """
+    Check cheaply whether the side to move surely has a legal move.
+
+    When the side to move is not in check, a piece which does not share a
+    line with its own king cannot be pinned, so any move it can make is
+    legal. Only such pieces are looked at, so a False answer is not sure.
+
+    Arguments
+    ---------
+    board : the current board position, with the side to move not in check.
+
+    Returns
+    -------
+    free: True if a piece off its king's lines can move or a pawn off them
+          can be pushed.
+    """
+    color = board.turn
+    own = board.occupied_co[color]
+    rays = chess.BB_RAYS[board.king(color)]
+    pawns = board.pawns & own
+    for square in chess.scan_forward(own & ~board.kings & ~pawns):
+        if not rays[square] and board.attacks_mask(square) & ~own:
+            return True
+    free_pawns = 0
+    for square in chess.scan_forward(pawns):
+        if not rays[square]:
+            free_pawns |= chess.BB_SQUARES[square]
+    pushes = free_pawns << 8 if color else free_pawns >> 8
+    return bool(pushes & ~board.occupied & chess.BB_ALL)
+
+
+def is_losing_capture(board, move):
+    """
+    Check whether a capture loses material once the exchange is played out.
+
+    A capture of a piece worth at least the capturing piece can never lose
+    material, so the exchange is only resolved for the others.
+
+    Arguments
+    ---------
+    board : the current board position, before the move.
+    move : a capturing move.
+
+    Returns
+    -------
+    losing: True if static_exchange of the move is negative.
+    """
+    victim = board.piece_type_at(move.to_square) or chess.PAWN
+    if SEE_VALUES[victim] >= SEE_VALUES[board.piece_type_at(move.from_square)]:
+        return False
+    return static_exchange(board, move) < 0
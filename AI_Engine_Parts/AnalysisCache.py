@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 30 19:12:40 2026
+
+@author: Prior_Bayes
+"""
+
+# Imports
+import hashlib
+import sqlite3
+import sys
+from collections import namedtuple
+import chess
+from .AI_Engine_Functions import position_hash
+from .HeuristicEval import inf, neg_inf
+from .SharedHashTable import MATE_BOUND
+
+# A cached search result. pv is the expected line, starting with move.
+Analysis = namedtuple('Analysis', ['move', 'score', 'depth', 'pv'])
+
+
+def engine_fingerprint(engine) -> str:
+    """
+    Return a short string identifying how an engine is configured.
+
+    The fingerprint covers the class of each component and the attributes
+    its class lists in settings, such as lazy margins or mate solver limits.
+    Counters and other state an engine keeps as it runs are left out, since
+    they do not change the results. Position hashes come from Python's tuple
+    hash, so the Python version is included too.
+
+    Arguments
+    ---------
+    engine: a ChessEngine.
+
+    Returns
+    -------
+    fingerprint: a hex digest of the configuration.
+    """
+    search = engine.searchEng
+    parts = [f'python{sys.version_info[0]}.{sys.version_info[1]}']
+    for component in [search, search.pruner, search.orderer, search.terminal,
+                      engine.evalEng, engine.mateSolver]:
+        if component is None:
+            parts.append('None')
+            continue
+        settings = [(name, getattr(component, name))
+                    for name in component.settings]
+        parts.append(f'{type(component).__qualname__}{settings}')
+    return hashlib.sha1('|'.join(parts).encode()).hexdigest()[:16]
+
+
+class AnalysisCache:
+    """
+    A persistent cache of search results in a single SQLite file.
+
+    Results are keyed by position hash and engine fingerprint, and only the
+    deepest result for a key is kept. A lookup is satisfied by any result at
+    least as deep as the one asked for. Once the cache holds more than
+    max_entries results, the least recently used tenth is evicted.
+
+    The EPD of each position is stored with its result, so a position which
+    shares another's hash misses rather than getting the wrong answer, and a
+    cached move is only returned if it is legal in the position.
+
+    Like a transposition table, the cache ignores how a position was
+    reached, so draws by repetition depending on the game history are not
+    seen.
+
+    Methods
+    -------
+        probe: looks up a result at least as deep as a given depth.
+        store: saves a search result.
+        evict: removes the least recently used results.
+        clear: empties the cache.
+        close: closes the database.
+    """
+
+    def __init__(self, path, max_entries=100000):
+        """
+        Open the cache, creating the file if needed.
+
+        Arguments
+        ---------
+        path: the database file, or ':memory:' for a cache which is not kept.
+        max_entries: the number of results kept before eviction.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(path, timeout=30,
+                                          isolation_level=None)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        columns = [row[1] for row in self.connection.execute(
+            'PRAGMA table_info(analysis)')]
+        if columns and 'epd' not in columns:
+            # Written before positions were stored, so it cannot be checked
+            self.connection.execute('DROP TABLE analysis')
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS analysis ('
+            'hash INTEGER NOT NULL, config TEXT NOT NULL, '
+            'epd TEXT NOT NULL, depth INTEGER NOT NULL, move TEXT, '
+            'score REAL NOT NULL, pv TEXT NOT NULL, used INTEGER NOT NULL, '
+            'PRIMARY KEY (hash, config))')
+        self.connection.execute(
+            'CREATE INDEX IF NOT EXISTS analysis_used ON analysis (used)')
+        count, used = self.connection.execute(
+            'SELECT COUNT(*), MAX(used) FROM analysis').fetchone()
+        self.count = count
+        self.clock = used or 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        """Return the number of results in the cache."""
+        return self.count
+
+    def key(self, board: chess.Board) -> int:
+        """Return the position hash of a board as a signed SQLite integer."""
+        key = position_hash(board)
+        return key - (1 << 64) if key >> 63 else key
+
+    def probe(self, board: chess.Board, fingerprint: str, depth: int):
+        """
+        Look up a result at least as deep as depth.
+
+        Arguments
+        ---------
+        board: the position searched.
+        fingerprint: the engine_fingerprint of the engine asking.
+        depth: the depth of search wanted.
+
+        Returns
+        -------
+        analysis: an Analysis tuple, or None if there is no deep enough
+                  result for the position.
+        """
+        key = self.key(board)
+        row = self.connection.execute(
+            'SELECT epd, depth, move, score, pv FROM analysis '
+            'WHERE hash = ? AND config = ? AND depth >= ?',
+            (key, fingerprint, depth)).fetchone()
+        if row is not None:
+            epd, found_depth, move, score, pv = row
+            if move is not None:
+                move = chess.Move.from_uci(move)
+            if epd != board.epd() or not (move is None
+                                          or board.is_legal(move)):
+                row = None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.clock += 1
+        self.connection.execute(
+            'UPDATE analysis SET used = ? WHERE hash = ? AND config = ?',
+            (self.clock, key, fingerprint))
+        if score >= MATE_BOUND:
+            score = inf
+        elif score <= -MATE_BOUND:
+            score = neg_inf
+        return Analysis(move, score, found_depth,
+                        [chess.Move.from_uci(uci) for uci in pv.split()])
+
+    def store(self, board: chess.Board, fingerprint: str, depth: int, move,
+              score, pv=()):
+        """
+        Save a search result, unless a deeper one is already cached.
+
+        A result for another position with the same hash is replaced.
+
+        Arguments
+        ---------
+        board: the position searched.
+        fingerprint: the engine_fingerprint of the engine which searched.
+        depth: the depth searched.
+        move: the best move found, or None if there are no moves.
+        score: the score of the position.
+        pv: the expected line, starting with move.
+        """
+        key = self.key(board)
+        epd = board.epd()
+        row = self.connection.execute(
+            'SELECT epd, depth FROM analysis WHERE hash = ? AND config = ?',
+            (key, fingerprint)).fetchone()
+        if row is not None and row[0] == epd and row[1] > depth:
+            return
+        self.clock += 1
+        self.connection.execute(
+            'INSERT OR REPLACE INTO analysis VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (key, fingerprint, epd, depth,
+             None if move is None else move.uci(), float(score),
+             ' '.join(pv_move.uci() for pv_move in pv), self.clock))
+        if row is None:
+            self.count += 1
+            if self.count > self.max_entries:
+                self.evict(self.count - self.max_entries * 9 // 10)
+
+    def evict(self, number: int):
+        """Remove the number least recently used results."""
+        self.connection.execute(
+            'DELETE FROM analysis WHERE rowid IN '
+            '(SELECT rowid FROM analysis ORDER BY used LIMIT ?)', (number,))
+        self.count = self.connection.execute(
+            'SELECT COUNT(*) FROM analysis').fetchone()[0]
+
+    def clear(self):
+        """Remove every result."""
+        self.connection.execute('DELETE FROM analysis')
+        self.count = 0
+
+    def close(self):
+        """Close the database."""
+        self.connection.close()
@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Nov  2 18:41:07 2026
+
+@author: Prior_Bayes
+"""
+
+import chess
+
+
+def piece_attacks(piece_type: int, color: bool, square: int,
+                  occupied: int) -> int:
+    """
+    Return the squares a piece attacks, given the occupied squares.
+
+    Arguments
+    ---------
+    piece_type: the type of the piece.
+    color: the color of the piece.
+    square: the square the piece stands on.
+    occupied: the bitboard of occupied squares, which block sliders.
+
+    Returns
+    -------
+    attacks: the bitboard of attacked squares.
+    """
+    if piece_type == chess.PAWN:
+        return chess.BB_PAWN_ATTACKS[color][square]
+    if piece_type == chess.KNIGHT:
+        return chess.BB_KNIGHT_ATTACKS[square]
+    if piece_type == chess.KING:
+        return chess.BB_KING_ATTACKS[square]
+    attacks = 0
+    if piece_type != chess.ROOK:
+        attacks = chess.BB_DIAG_ATTACKS[square][
+            chess.BB_DIAG_MASKS[square] & occupied]
+    if piece_type != chess.BISHOP:
+        attacks |= (chess.BB_RANK_ATTACKS[square][
+                        chess.BB_RANK_MASKS[square] & occupied]
+                    | chess.BB_FILE_ATTACKS[square][
+                        chess.BB_FILE_MASKS[square] & occupied])
+    return attacks
+
+
+class AttackMap:
+    """
+    AttackMap keeps the attacks of both sides up to date during a search.
+
+    For every piece it stores the squares the piece attacks, and for each
+    side it keeps a bitboard of the attacked squares and the number of
+    pieces attacking each square. On a move, only the pieces whose attacks
+    change are updated: the moved piece, any captured piece or castling rook,
+    and the sliders whose rays reach the squares the move vacates or fills.
+    The changes are kept on a stack, so pop restores them without any
+    attack generation.
+
+    The map follows the search's push/pop like TerminalDetector. Evaluation
+    and ordering code calls sync before reading it, which restarts tracking
+    if the board has moved without the map.
+
+    Methods
+    -------
+        reset: computes the attacks of a board from scratch.
+        sync: makes sure the map describes a board.
+        push: updates the attacks for a move about to be made.
+        pop: restores the attacks of the previous position.
+        suspend: returns the tracked board and attacks.
+        resume: restores the state returned by suspend.
+        attacks_from: returns the squares attacked by the piece on a square.
+        attackers: returns the squares of one side's pieces attacking a
+                   square.
+        attacked_pieces: returns the squares of one side's pieces attacking
+                         an enemy piece.
+        space: counts the moves and pawn attacks into the enemy half.
+        king_attacks: counts the attacks on the squares around a king.
+    """
+
+    def __init__(self):
+        """Initialize an empty map."""
+        self.board = None
+        self.root_ply = 0
+        # Squares attacked by the piece on each square, by color
+        self.attacks = [[0] * 64, [0] * 64]
+        # Number of pieces of each color attacking each square
+        self.counts = [bytearray(64), bytearray(64)]
+        # Squares attacked at least once, by color
+        self.attacked = [0, 0]
+        # One list of (color, square, previous attacks) per pushed move
+        self.undo = []
+
+    def _set(self, color: bool, square: int, new: int):
+        """Replace the attacks of a piece and update the counts."""
+        old = self.attacks[color][square]
+        if old == new:
+            return
+        self.attacks[color][square] = new
+        counts = self.counts[color]
+        attacked = self.attacked[color]
+        # Walk the bits inline, as this runs for every piece a move touches
+        lost = old & ~new
+        while lost:
+            bit = lost & -lost
+            target = bit.bit_length() - 1
+            counts[target] -= 1
+            if not counts[target]:
+                attacked ^= bit
+            lost ^= bit
+        gained = new & ~old
+        self.attacked[color] = attacked | gained
+        while gained:
+            bit = gained & -gained
+            counts[bit.bit_length() - 1] += 1
+            gained ^= bit
+
+    def reset(self, board: chess.Board):
+        """
+        Start tracking a board, computing every piece's attacks.
+
+        Arguments
+        ---------
+        board: the board that will be pushed and popped during the search.
+        """
+        self.board = board
+        self.root_ply = len(board.move_stack)
+        self.attacks = [[0] * 64, [0] * 64]
+        self.counts = [bytearray(64), bytearray(64)]
+        self.attacked = [0, 0]
+        self.undo = []
+        occupied = board.occupied
+        for color in chess.COLORS:
+            for square in chess.scan_forward(board.occupied_co[color]):
+                self._set(color, square, piece_attacks(
+                    board.piece_type_at(square), color, square, occupied))
+
+    def sync(self, board: chess.Board):
+        """
+        Make sure the map describes a board, restarting tracking if not.
+
+        Arguments
+        ---------
+        board: the current board state.
+
+        Returns
+        -------
+        attack_map: the map itself.
+        """
+        if (board is not self.board
+                or len(board.move_stack) - self.root_ply != len(self.undo)):
+            self.reset(board)
+        return self
+
+    def push(self, board: chess.Board, move: chess.Move):
+        """
+        Update the attacks for a move that is about to be made.
+
+        Arguments
+        ---------
+        board: the board state before the move.
+        move: the move about to be made.
+        """
+        self.sync(board)
+        changes = []
+        self.undo.append(changes)
+        from_sq = move.from_square
+        to_sq = move.to_square
+        piece_type = board.piece_type_at(from_sq)
+        if piece_type is None:
+            # A null move leaves every piece where it is
+            return
+        color = board.turn
+        placed = [(to_sq, move.promotion or piece_type)]
+        removed = [(color, from_sq)]
+        if piece_type == chess.KING and board.is_castling(move):
+            rank = chess.square_rank(from_sq)
+            kingside = board.is_kingside_castling(move)
+            rook_from = board.castling_rights & chess.BB_RANKS[rank]
+            rook_from = chess.msb(rook_from) if kingside else chess.lsb(
+                rook_from)
+            rook_from = (to_sq if board.piece_type_at(to_sq) == chess.ROOK
+                         else rook_from)
+            removed.append((color, rook_from))
+            placed = [(chess.square(6 if kingside else 2, rank), chess.KING),
+                      (chess.square(5 if kingside else 3, rank), chess.ROOK)]
+        elif piece_type == chess.PAWN and board.is_en_passant(move):
+            removed.append((not color, to_sq ^ 8))
+        elif board.occupied_co[not color] & chess.BB_SQUARES[to_sq]:
+            removed.append((not color, to_sq))
+
+        changed = 0
+        for _, square in removed:
+            changed |= chess.BB_SQUARES[square]
+        for square, _ in placed:
+            changed |= chess.BB_SQUARES[square]
+        occupied = board.occupied & ~changed
+        for square, _ in placed:
+            occupied |= chess.BB_SQUARES[square]
+
+        attacks = self.attacks
+        for piece_color, square in removed:
+            changes.append((piece_color, square, attacks[piece_color][square]))
+            self._set(piece_color, square, 0)
+        # A slider's attacks change only if its rays reach a changed square
+        sliders = (board.bishops | board.rooks | board.queens) & ~changed
+        for square in chess.scan_forward(sliders):
+            slider_color = bool(board.occupied_co[chess.WHITE]
+                                & chess.BB_SQUARES[square])
+            if attacks[slider_color][square] & changed:
+                changes.append((slider_color, square,
+                                attacks[slider_color][square]))
+                self._set(slider_color, square, piece_attacks(
+                    board.piece_type_at(square), slider_color, square,
+                    occupied))
+        for square, placed_type in placed:
+            changes.append((color, square, attacks[color][square]))
+            self._set(color, square,
+                      piece_attacks(placed_type, color, square, occupied))
+
+    def pop(self):
+        """Restore the attacks of the previous position."""
+        for color, square, old in reversed(self.undo.pop()):
+            self._set(color, square, old)
+
+    def suspend(self) -> tuple:
+        """Return the tracked board and attacks, for resume."""
+        return (self.board, self.root_ply, self.attacks, self.counts,
+                self.attacked, self.undo)
+
+    def resume(self, state: tuple):
+        """Restore the tracked board and attacks from suspend."""
+        (self.board, self.root_ply, self.attacks, self.counts,
+         self.attacked, self.undo) = state
+
+    def attacks_from(self, square: int) -> int:
+        """Return the squares attacked by the piece on a square."""
+        return self.attacks[chess.WHITE][square] | self.attacks[
+            chess.BLACK][square]
+
+    def attackers(self, color: bool, square: int) -> int:
+        """
+        Return the squares of one side's pieces attacking a square.
+
+        Arguments
+        ---------
+        color: the attacking side.
+        square: the attacked square.
+
+        Returns
+        -------
+        attackers: a bitboard of the attacking pieces.
+        """
+        mask = chess.BB_SQUARES[square]
+        attacks = self.attacks[color]
+        return sum(chess.BB_SQUARES[origin] for origin in chess.scan_forward(
+            self.board.occupied_co[color]) if attacks[origin] & mask)
+
+    def attacked_pieces(self, color: bool) -> int:
+        """
+        Return the squares of one side's pieces attacking an enemy piece.
+
+        Arguments
+        ---------
+        color: the attacking side.
+
+        Returns
+        -------
+        attackers: a bitboard of the attacking pieces.
+        """
+        enemy = self.board.occupied_co[not color]
+        attacks = self.attacks[color]
+        attackers = 0
+        for square in chess.scan_forward(self.board.occupied_co[color]):
+            if attacks[square] & enemy:
+                attackers |= chess.BB_SQUARES[square]
+        return attackers
+
+    def space(self, color: bool) -> int:
+        """
+        Count one side's moves and pawn attacks into the enemy half.
+
+        Every pseudo-legal move of a piece other than a pawn to a square in
+        the enemy half counts once, as does every square there a pawn
+        attacks, even if it is empty or holds a friendly piece.
+
+        Arguments
+        ---------
+        color: the side whose space is counted.
+
+        Returns
+        -------
+        space: the number of moves and pawn attacks.
+        """
+        board = self.board
+        half = (chess.BB_RANK_5 | chess.BB_RANK_6 | chess.BB_RANK_7
+                | chess.BB_RANK_8) if color else (
+                    chess.BB_RANK_1 | chess.BB_RANK_2 | chess.BB_RANK_3
+                    | chess.BB_RANK_4)
+        own = board.occupied_co[color]
+        counts = self.counts[color]
+        space = sum(counts[square] for square in chess.scan_forward(
+            self.attacked[color] & half & ~own))
+        # Pawn attacks on friendly pieces are not moves, but count as space
+        pawns = board.pawns & own
+        if color:
+            left = (pawns & ~chess.BB_FILE_A) << 7
+            right = (pawns & ~chess.BB_FILE_H) << 9
+        else:
+            left = (pawns & ~chess.BB_FILE_A) >> 9
+            right = (pawns & ~chess.BB_FILE_H) >> 7
+        mask = half & own
+        return space + chess.popcount(left & mask) + chess.popcount(
+            right & mask)
+
+    def king_attacks(self, color: bool) -> int:
+        """
+        Count the enemy attacks on the squares around one side's king.
+
+        Arguments
+        ---------
+        color: the side whose king is attacked.
+
+        Returns
+        -------
+        attacks: the number of attacks on the king and its neighbours, with
+                 a square attacked twice counted twice.
+        """
+        king = self.board.king(color)
+        if king is None:
+            return 0
+        counts = self.counts[not color]
+        zone = chess.BB_KING_ATTACKS[king] | chess.BB_SQUARES[king]
+        return sum(counts[square] for square in chess.scan_forward(
+            zone & self.attacked[not color]))
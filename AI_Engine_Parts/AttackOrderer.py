@@ -5,14 +5,40 @@ Created on Fri Aug 29 23:33:19 2025
 @author: Prior_Bayes
 """
 import chess
+from .AI_Engine_Functions import is_losing_capture
 from .Orderer import Orderer
 
 
 class AttackOrderer(Orderer):
     """
     AttackOrder orders the moves by looking at attacking moves first.
+
+    With use_see, captures which win or trade material by static exchange
+    evaluation come first, then the other moves of attacking pieces, then the
+    quiet moves. Captures losing material are searched last.
+
+    Given an AttackMap kept in step with the search, usually the one an
+    evaluator tracks, the attackers are read from the map rather than
+    recomputed, and captures the opponent cannot answer skip the exchange
+    evaluation.
     """
 
+    settings = ('use_see',)
+
+    def __init__(self, use_see=False, attack_map=None):
+        """
+        Initialize the orderer.
+
+        Arguments
+        ---------
+        use_see: if True, captures are ordered by static exchange evaluation.
+                 Otherwise all moves of attacking pieces come first. Like
+                 MovePicker's use_see, this pays off with a quiescence search.
+        attack_map: an optional AttackMap to read the attacks from.
+        """
+        self.use_see = use_see
+        self.attack_map = attack_map
+
     def get_attackers(self, board: chess.Board) -> chess.SquareSet:
         """
         Get the squares with attacking pieces on them.
@@ -25,13 +51,15 @@ class AttackOrderer(Orderer):
         -------
         attackers: a SquareSet of the attacking pieces
         """
-        attackers = chess.SquareSet()
+        if self.attack_map is not None:
+            return chess.SquareSet(
+                self.attack_map.sync(board).attacked_pieces(board.turn))
+        attackers = 0
         # Check each enemy piece position
-        for square in chess.SquareSet(board.occupied_co[not board.turn]):
+        for square in chess.scan_forward(board.occupied_co[not board.turn]):
             # Find which of my pieces are attacking this enemy piece
-            my_attackers = board.attackers(board.turn, square)
-            attackers |= my_attackers
-        return attackers
+            attackers |= board.attackers_mask(board.turn, square)
+        return chess.SquareSet(attackers)
 
     def order_search(self, board: chess.Board) -> list[chess.Move]:
         """
@@ -46,12 +74,28 @@ class AttackOrderer(Orderer):
         search_order: a list ordered by the search order.
         """
         legal_moves = self.legal_moves_list(board)
-        attackers = self.get_attackers(board)
-
-        # Moves where the starting square is an attacker square get priority
-        capture_moves = [move for move in legal_moves
-                         if move.from_square in attackers]
-        quiet_moves = [move for move in legal_moves
-                       if move.from_square not in attackers]
+        attackers = self.get_attackers(board).mask
 
-        return capture_moves + quiet_moves
\ No newline at end of file
+        # Rank the moves: winning captures, other moves of attacking pieces,
+        # quiet moves and then losing captures. Each rank is packed above the
+        # move's index, so one sort of plain integers orders the list.
+        # Squares the opponent attacks, if the map knows them. A capture
+        # cannot lose material unless the opponent attacks the target, or
+        # the origin, from which a slider could x-ray onto the target.
+        defended = (chess.BB_ALL if self.attack_map is None
+                    else self.attack_map.attacked[not board.turn])
+        order = []
+        for index, move in enumerate(legal_moves):
+            if not attackers & chess.BB_SQUARES[move.from_square]:
+                rank = 1
+            elif not self.use_see or not board.is_capture(move):
+                rank = 2
+            elif (defended & (chess.BB_SQUARES[move.to_square]
+                              | chess.BB_SQUARES[move.from_square])
+                  and is_losing_capture(board, move)):
+                rank = 0
+            else:
+                rank = 3
+            order.append(rank << 8 | 255 - index)
+        order.sort(reverse=True)
+        return [legal_moves[255 - (packed & 255)] for packed in order]
@@ -6,7 +6,18 @@ Created on Sun Jul 27 19:00:28 2025
 """
 
 # Imports
+import time
+from collections import namedtuple
+from .AnalysisCache import engine_fingerprint
 from .Pruner import Pruner
+from .SearchEng import SearchTimeout
+from .HeuristicEval import inf, neg_inf
+
+# A progress report from ChessEngine.iter_search. complete is True once the
+# search at that depth has finished, and False for a new best root move found
+# part way through it.
+SearchUpdate = namedtuple('SearchUpdate', ['move', 'score', 'depth', 'nodes',
+                                           'elapsed', 'complete'])
 
 
 class ChessEngine:
@@ -19,7 +30,8 @@ class ChessEngine:
     the logic used to determine what move to make.
     """
 
-    def __init__(self, search, evaluation, pruner=Pruner):
+    def __init__(self, search, evaluation, pruner=Pruner, mate_solver=None,
+                 cache=None, session=None):
         """
         Initialize the engine with specific components.
 
@@ -27,18 +39,234 @@ class ChessEngine:
         ---------
             search: The engine's search component.
             evaluation: The engine's board evaluation component.
+            mate_solver: An optional MateSolver. If given, it looks for a
+                         forced mate before every search, and the search is
+                         skipped when one is found.
+            cache: An optional AnalysisCache. find_best_move returns cached
+                   results at least as deep as asked for, and saves the
+                   results of its searches.
+            session: An optional GameSession. find_best_move keeps the
+                     search's hints warm from one move of the game to the
+                     next through it. If the session has a path and the file
+                     exists, its saved state is loaded.
         """
         self.searchEng = search
         self.evalEng = evaluation
+        self.mateSolver = mate_solver
+        self.cache = cache
+        self.session = session
+        if self.evalEng.incremental:
+            self.searchEng.add_tracker(self.evalEng)
         self.white = True
         self.black = False
         self.depth = 4
+        # Deepest search finished by the last call to find_best_move or
+        # iter_search, and the line expected by find_best_move
+        self.completed_depth = 0
+        self.pv = []
+        if session is not None and session.path is not None:
+            session.load(self)
+
+    def evaluate(self, board, alpha=neg_inf, beta=inf):
+        """
+        Return the evaluation score of the given board.
+
+        Checkmate is scored as a win for the side giving mate. Otherwise the
+        evaluator scores the position within the alpha-beta window, so lazy
+        evaluators can stop early once the score falls outside it. The
+        search finds checkmate itself, so it calls the evaluator's
+        score_window directly.
+        """
+        if board.is_checkmate():
+            return neg_inf if board.turn else inf
+        return self.evalEng.score_window(board, alpha, beta)
+
+    def solve_mate(self, board, deadline=None, node_limit=None):
+        """
+        Look for a forced mate with the mate solver, if there is one.
+
+        Arguments
+        ---------
+        board: the current board state.
+        deadline: the time.perf_counter() value at which to give up, or
+                  None.
+        node_limit: the number of nodes the mate search may take, or None.
+
+        Returns
+        -------
+        best_move: A tuple with the first move of the mate and the mate score
+                   for the side to move, or None if no mate was found.
+        """
+        if self.mateSolver is None:
+            return None
+        mate = self.mateSolver.solve(board, deadline, node_limit)
+        if mate is None:
+            return None
+        line, _ = mate
+        self.pv = line
+        return (line[0], inf if board.turn else neg_inf)
+
+    def fingerprint(self):
+        """Return the engine_fingerprint of the engine's configuration."""
+        return engine_fingerprint(self)
+
+    def find_best_move(self, board, depth, time_limit=None):
+        """
+        Use the composed search engine to find the best move.
+
+        With a time limit, the search deepens one ply at a time through
+        iter_search and returns the latest best move found before the limit.
+        Afterwards, pv holds the line the engine expects.
+
+        With a cache, a cached result at least as deep as depth is returned
+        without searching. Otherwise the deepest finished search is saved.
+
+        With a session, the hints of earlier searches in the game are aged
+        and the previous line is reused before searching, and the new line
+        is recorded afterwards.
+
+        Arguments
+        ---------
+        board: the current board state.
+        depth: how many ply deep the search goes.
+        time_limit: the number of seconds the search may take, or None.
+
+        Returns
+        -------
+        best_move: A tuple with the best move and associated score.
+        """
+        self.searchEng.nodes = 0
+        self.pv = []
+        if self.session is not None:
+            self.session.start(self, board)
+        if self.cache is not None:
+            fingerprint = self.fingerprint()
+            cached = self.cache.probe(board, fingerprint, depth)
+            if cached is not None:
+                self.completed_depth = cached.depth
+                self.pv = cached.pv
+                if self.session is not None:
+                    self.session.finish(self, board)
+                return (cached.move, cached.score)
+
+        if time_limit is None:
+            best_move = self.solve_mate(board)
+            if best_move is None:
+                hyp_board = board.copy()
+                self.evalEng.reset(hyp_board)
+                self.searchEng.terminal.reset(hyp_board)
+                best_move = self.searchEng.search(
+                    hyp_board, self.evalEng.score_window, depth)
+            self.completed_depth = depth
+            finished = best_move
+        else:
+            best_move = None
+            finished = None
+            for update in self.iter_search(board, depth, time_limit):
+                best_move = (update.move, update.score)
+                if update.complete:
+                    finished = best_move
+        if best_move is not None and self.pv[:1] != [best_move[0]]:
+            self.pv = self.searchEng.principal_variation(board, best_move[0],
+                                                         depth)
 
-    def evaluate(self, board):
-        """Return the evaluation score of the given board."""
-        return self.evalEng.score_pos(board)
+        if self.cache is not None and finished is not None:
+            move, score = finished
+            pv = self.pv if self.pv[:1] == [move] else [move]
+            self.cache.store(board, fingerprint, self.completed_depth, move,
+                             score, pv if move is not None else [])
+        if self.session is not None:
+            self.session.finish(self, board)
+        return best_move
+
+    def find_best_moves(self, board, depth, count=3):
+        """
+        Find the best few moves and their scores, for analysis.
+
+        Arguments
+        ---------
+        board: the current board state.
+        depth: how many ply deep the search goes.
+        count: how many moves to return.
 
-    def find_best_move(self, board, depth):
-        """Use the composed search engine to find the best move."""
+        Returns
+        -------
+        lines: a list of up to count (move, score) tuples, best first.
+        """
+        self.searchEng.nodes = 0
         hyp_board = board.copy()
-        return self.searchEng.search(hyp_board, self.evaluate, depth)
+        self.evalEng.reset(hyp_board)
+        lines = self.searchEng.search_multipv(
+            hyp_board, self.evalEng.score_window, depth, count)
+        self.completed_depth = depth
+        return lines
+
+    def iter_search(self, board, depth, time_limit=None, node_limit=None):
+        """
+        Search one ply deeper at a time, yielding progress as it is made.
+
+        An update is yielded whenever a new best root move is found and when
+        each depth finishes. Each carries the move, score, depth, nodes
+        searched so far and seconds elapsed. The caller may stop iterating at
+        any point and keep the latest update. The depth 1 search always
+        finishes, so there is always a move when one exists. If the mate
+        solver finds a forced mate first, it is yielded as the only update.
+        The mate search counts towards the time and node limits.
+
+        Arguments
+        ---------
+        board: the current board state.
+        depth: the deepest search to run.
+        time_limit: the number of seconds the search may take, or None.
+        node_limit: the number of nodes the search may take, or None. Like
+                    the time limit, it does not apply to depth 1.
+
+        Returns
+        -------
+        updates: a generator of SearchUpdate tuples.
+        """
+        start = time.perf_counter()
+        deadline = None if time_limit is None else start + time_limit
+        self.searchEng.nodes = 0
+        self.completed_depth = 0
+        mate = self.solve_mate(board, deadline, node_limit)
+        if mate is not None:
+            self.completed_depth = depth
+            yield SearchUpdate(mate[0], mate[1], depth, 0,
+                               time.perf_counter() - start, True)
+            return
+        latest = None
+        for current_depth in range(1, depth + 1):
+            hyp_board = board.copy()
+            self.evalEng.reset(hyp_board)
+            if latest is not None:
+                self.searchEng.deadline = deadline
+                self.searchEng.node_limit = node_limit
+            root = self.searchEng.iter_root(
+                hyp_board, self.evalEng.score_window, current_depth)
+            try:
+                while True:
+                    try:
+                        move, score = next(root)
+                    except StopIteration as finished:
+                        move, score = finished.value
+                        break
+                    if latest is None or move != latest.move:
+                        latest = SearchUpdate(
+                            move, score, current_depth, self.searchEng.nodes,
+                            time.perf_counter() - start, False)
+                        yield latest
+            except SearchTimeout:
+                return
+            finally:
+                self.searchEng.deadline = None
+                self.searchEng.node_limit = None
+            self.completed_depth = current_depth
+            latest = SearchUpdate(move, score, current_depth,
+                                  self.searchEng.nodes,
+                                  time.perf_counter() - start, True)
+            yield latest
+            if deadline is not None and time.perf_counter() > deadline:
+                return
+            if node_limit is not None and self.searchEng.nodes > node_limit:
+                return
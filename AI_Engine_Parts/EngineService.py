@@ -0,0 +1,407 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Oct 22 19:26:51 2026
+
+@author: Prior_Bayes
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import chess
+from .AlphaBetaPruner import AlphaBetaPruner
+from .ChessEngine import ChessEngine
+from .HeuristicEval import HeuristicEval
+from .MovePicker import MovePicker
+from .SearchEng import SearchEng
+
+
+def default_engine():
+    """Build the engine used by EngineService when none is given."""
+    return ChessEngine(SearchEng(AlphaBetaPruner(), MovePicker(use_see=True),
+                                 quiescence_depth=4),
+                       HeuristicEval(lazy=True))
+
+
+# Engines owned by this worker process, one per game, most recent last
+_worker_engines = OrderedDict()
+_worker_factory = default_engine
+_worker_max_games = 64
+
+
+def _init_worker(engine_factory, max_games):
+    """Set up a worker process of EngineService."""
+    global _worker_factory, _worker_max_games
+    _worker_factory = engine_factory
+    _worker_max_games = max_games
+
+
+def _worker_search(game, fen, depth, time_limit):
+    """
+    Search a position with the engine kept for its game.
+
+    Runs in a worker process. Each game keeps its own engine, so its move
+    ordering tables and caches carry over between the game's requests. The
+    least recently used engine is dropped when the worker holds too many.
+
+    Returns
+    -------
+    result: a tuple of (move in UCI notation or None, score, depth reached,
+            nodes searched).
+    """
+    engine = _worker_engines.pop(game, None)
+    if engine is None:
+        engine = _worker_factory()
+    _worker_engines[game] = engine
+    while len(_worker_engines) > _worker_max_games:
+        _worker_engines.popitem(last=False)
+
+    move, score = engine.find_best_move(chess.Board(fen), depth, time_limit)
+    return (move.uci() if move else None, score, engine.completed_depth,
+            engine.searchEng.nodes)
+
+
+class EngineService:
+    """
+    An asyncio service which searches moves for many games at once.
+
+    Clients connect over a local TCP socket and send one JSON request per
+    line, for example {"id": 1, "game": "g1", "fen": "...", "depth": 4,
+    "time": 1.0}. Each reply is one JSON line carrying the same id, with the
+    move, score, depth reached and nodes searched, or an error.
+
+    Searches run in a pool of worker processes, one process per core by
+    default. A game stays on the worker which first searched for it, and
+    its requests wait for that worker when it is busy, so the game's
+    engine, ordering tables and caches are never split between workers. A
+    new game goes to any free worker, so no core sits idle while new games
+    queue for a busy one. At most max_pending requests are admitted at
+    once. Further requests wait for a free place until their deadline,
+    which pushes back on clients instead of oversubscribing the cores. A
+    request's deadline covers the time it spends waiting and the search
+    itself, which is given whatever time remains. A search which overruns
+    its deadline is answered with an error straight away, and its worker is
+    handed back once the search finishes.
+
+    Methods
+    -------
+        start: starts listening and the worker processes.
+        close: stops listening, drops the clients and shuts down the
+               workers.
+        worker_for: returns the worker a new game prefers.
+        acquire_worker: waits for the game's worker, or any free worker for
+                        a new game.
+        release_worker: hands a worker back.
+        release_later: hands a worker back once its search finishes.
+        request_move: searches a move for a game.
+        handle_client: serves one client connection.
+    """
+
+    def __init__(self, engine_factory=default_engine, workers=None,
+                 max_pending=None, deadline=5.0, max_depth=32,
+                 max_games=64, host='127.0.0.1', port=0):
+        """
+        Initialize the service.
+
+        Arguments
+        ---------
+        engine_factory: a picklable function building a new ChessEngine.
+        workers: the number of worker processes, by default one per core.
+        max_pending: the number of requests admitted at once, by default
+                     twice the number of workers.
+        deadline: the default number of seconds a request may take.
+        max_depth: the deepest search a request may ask for.
+        max_games: the number of game engines kept by each worker.
+        host: the address to listen on.
+        port: the port to listen on, or 0 to pick a free one.
+        """
+        self.engine_factory = engine_factory
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.workers
+        self.deadline = deadline
+        self.max_depth = max_depth
+        self.max_games = max_games
+        self.host = host
+        self.port = port
+        self.executors = []
+        # Indices of the idle workers, and the worker each game stays on
+        self.free = set()
+        self.freed = None
+        self.homes = OrderedDict()
+        self.slots = None
+        self.server = None
+        self.clients = set()
+        # Tasks handing back the workers of overrunning searches
+        self.releases = set()
+        self.stats = {'served': 0, 'busy': 0, 'late': 0, 'failed': 0}
+
+    async def start(self):
+        """
+        Start the worker processes and listen for clients.
+
+        Returns
+        -------
+        address: a tuple of the host and port being listened on.
+        """
+        self.executors = [
+            ProcessPoolExecutor(max_workers=1, initializer=_init_worker,
+                                initargs=(self.engine_factory,
+                                          self.max_games))
+            for _ in range(self.workers)]
+        self.free = set(range(self.workers))
+        self.freed = asyncio.Condition()
+        self.slots = asyncio.Semaphore(self.max_pending)
+        self.server = await asyncio.start_server(self.handle_client,
+                                                 self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return (self.host, self.port)
+
+    async def close(self):
+        """Stop listening, drop the clients and shut down the workers."""
+        if self.server is not None:
+            self.server.close()
+        for client in list(self.clients):
+            client.cancel()
+        await asyncio.gather(*self.clients, return_exceptions=True)
+        if self.server is not None:
+            await self.server.wait_closed()
+        for executor in self.executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self.executors = []
+
+    def worker_for(self, game: str) -> int:
+        """Return the index of the worker a new game prefers."""
+        return zlib.crc32(game.encode()) % self.workers
+
+    async def acquire_worker(self, game: str, timeout: float):
+        """
+        Wait for the game's worker to be free.
+
+        A game which has not been searched yet, or whose worker has been
+        forgotten, takes any free worker, preferring worker_for(game).
+
+        Arguments
+        ---------
+        game: the id of the game.
+        timeout: the number of seconds to wait.
+
+        Returns
+        -------
+        index: the index of the worker, which is no longer free.
+
+        Raises
+        ------
+        asyncio.TimeoutError: if no worker is free in time.
+        """
+        async with self.freed:
+            home = self.homes.get(game)
+            if home is None:
+                await asyncio.wait_for(
+                    self.freed.wait_for(lambda: self.free), timeout)
+                index = self.worker_for(game)
+                if index not in self.free:
+                    index = min(self.free)
+            else:
+                await asyncio.wait_for(
+                    self.freed.wait_for(lambda: home in self.free), timeout)
+                index = home
+            self.free.remove(index)
+            self.homes[game] = index
+            self.homes.move_to_end(game)
+            while len(self.homes) > self.max_games * self.workers:
+                self.homes.popitem(last=False)
+        return index
+
+    async def release_worker(self, index: int):
+        """Hand a worker back and wake the requests waiting for workers."""
+        async with self.freed:
+            self.free.add(index)
+            # Waiters may want a particular worker, so wake them all
+            self.freed.notify_all()
+
+    def release_later(self, future, index: int):
+        """Hand a worker back once the search running on it finishes."""
+        def finished(_):
+            task = asyncio.create_task(self.release_worker(index))
+            self.releases.add(task)
+            task.add_done_callback(self.releases.discard)
+
+        future.add_done_callback(finished)
+
+    async def request_move(self, game, fen, depth, time_limit=None):
+        """
+        Search a move for a game within a deadline.
+
+        Arguments
+        ---------
+        game: the id of the game.
+        fen: the position to search.
+        depth: the deepest search wanted.
+        time_limit: the number of seconds allowed, or None for the default.
+
+        Returns
+        -------
+        reply: a dict with the move, score, depth and nodes, or an error.
+        """
+        loop = asyncio.get_running_loop()
+        time_limit = self.deadline if time_limit is None else time_limit
+        deadline = loop.time() + time_limit
+        depth = max(1, min(int(depth), self.max_depth))
+        chess.Board(fen)
+
+        try:
+            await asyncio.wait_for(self.slots.acquire(), time_limit)
+        except asyncio.TimeoutError:
+            self.stats['busy'] += 1
+            return {'error': 'busy'}
+        try:
+            try:
+                index = await self.acquire_worker(
+                    game, max(deadline - loop.time(), 0))
+            except asyncio.TimeoutError:
+                self.stats['busy'] += 1
+                return {'error': 'busy'}
+            try:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    self.stats['busy'] += 1
+                    return {'error': 'busy'}
+                future = loop.run_in_executor(
+                    self.executors[index], _worker_search, game, fen, depth,
+                    remaining)
+                # The search returns after its deadline once the current
+                # node finishes, so allow it a little longer
+                try:
+                    move, score, reached, nodes = await asyncio.wait_for(
+                        asyncio.shield(future), remaining + 1.0)
+                except asyncio.TimeoutError:
+                    # Answer now, and keep the worker busy until the search
+                    # is over
+                    self.stats['late'] += 1
+                    self.release_later(future, index)
+                    index = None
+                    return {'error': 'deadline'}
+                except Exception as error:
+                    self.stats['failed'] += 1
+                    return {'error': f'search failed: {error}'}
+            finally:
+                if index is not None:
+                    await self.release_worker(index)
+        finally:
+            self.slots.release()
+        self.stats['served'] += 1
+        return {'move': move, 'score': score, 'depth': reached,
+                'nodes': nodes}
+
+    async def handle_request(self, line, writer):
+        """Answer one request line and write the reply."""
+        request = {}
+        try:
+            request = json.loads(line)
+            reply = await self.request_move(
+                str(request['game']), request['fen'],
+                request.get('depth', 4), request.get('time'))
+        except (ValueError, KeyError, TypeError) as error:
+            request = request if isinstance(request, dict) else {}
+            self.stats['failed'] += 1
+            reply = {'error': f'bad request: {error}'}
+        reply['id'] = request.get('id')
+        reply['game'] = request.get('game')
+        writer.write((json.dumps(reply) + '\n').encode())
+        await writer.drain()
+
+    async def handle_client(self, reader, writer):
+        """
+        Serve one client connection.
+
+        Requests on a connection are answered concurrently, so replies may
+        arrive out of order and are matched by id. When the service closes,
+        the connection and its outstanding requests are cancelled.
+        """
+        client = asyncio.current_task()
+        self.clients.add(client)
+        tasks = set()
+        try:
+            while line := await reader.readline():
+                task = asyncio.create_task(self.handle_request(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self.clients.discard(client)
+            writer.close()
+
+
+class EngineClient:
+    """
+    A client for EngineService.
+
+    Methods
+    -------
+        connect: opens the connection.
+        close: closes the connection.
+        request_move: asks the service for a move.
+    """
+
+    def __init__(self):
+        """Initialize an unconnected client."""
+        self.reader = None
+        self.writer = None
+        self.ids = itertools.count(1)
+        self.waiting = {}
+        self.listener = None
+
+    async def connect(self, host, port):
+        """Open the connection to the service."""
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        self.listener = asyncio.create_task(self.listen())
+
+    async def close(self):
+        """Close the connection."""
+        self.writer.close()
+        await self.writer.wait_closed()
+        await self.listener
+
+    async def listen(self):
+        """Hand each reply to the request waiting for it."""
+        while line := await self.reader.readline():
+            reply = json.loads(line)
+            future = self.waiting.pop(reply['id'], None)
+            if future is not None and not future.done():
+                future.set_result(reply)
+        for future in self.waiting.values():
+            future.set_exception(ConnectionError('connection closed'))
+        self.waiting.clear()
+
+    async def request_move(self, game, fen, depth=4, time_limit=None):
+        """
+        Ask the service for a move.
+
+        Arguments
+        ---------
+        game: the id of the game.
+        fen: the position to search.
+        depth: the deepest search wanted.
+        time_limit: the number of seconds allowed, or None for the default.
+
+        Returns
+        -------
+        reply: the service's reply as a dict.
+        """
+        request_id = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[request_id] = future
+        request = {'id': request_id, 'game': game, 'fen': fen,
+                   'depth': depth, 'time': time_limit}
+        self.writer.write((json.dumps(request) + '\n').encode())
+        await self.writer.drain()
+        return await future
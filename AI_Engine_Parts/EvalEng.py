@@ -31,11 +31,25 @@ class EvalEng:
     This class allows users to configure the engine's behavior by supplying
     different components at initialization time.
 
+    Evaluators which keep running totals set incremental to True. The search
+    engine then calls push and pop around every move it makes, so the totals
+    stay in step with the board.
+
     Methods
     -------
         score_pos: Checks whether subclass has implemented scoring function.
+        score_window: Scores a position given the search window.
+        reset: Starts tracking a board.
+        push: Updates tracked state for a move about to be made.
+        pop: Restores tracked state after a move is taken back.
+        suspend: Returns the tracked state, to be resumed later.
+        resume: Restores tracked state returned by suspend.
     """
 
+    incremental = False
+    # Attributes which change the scores, for engine_fingerprint
+    settings = ()
+
     def score_pos(self, board: chess.Board):
         """
         score_pos scores a position to see which player has the advantage.
@@ -45,6 +59,64 @@ class EvalEng:
         """
         raise NotImplementedError("Subclasses must implement score_pos")
 
+    def score_window(self, board: chess.Board, alpha, beta):
+        """
+        Score a position knowing the search's current alpha-beta window.
+
+        By default, the window is ignored and the full score is returned. Lazy
+        evaluators may return early once the score is known to fall outside
+        the window. It is only called by the search, which finds checkmate
+        and draws itself, so unlike score_pos it need not check for them.
+
+        Arguments
+        ---------
+        board: the current board state.
+        alpha: the score white is already guaranteed.
+        beta: the score black is already guaranteed.
+
+        Returns
+        -------
+        score: the score of the position.
+        """
+        return self.score_pos(board)
+
+    def reset(self, board: chess.Board):
+        """
+        Start tracking a board.
+
+        By default, nothing is tracked. Incremental evaluators rebuild their
+        running totals here.
+        """
+
+    def push(self, board: chess.Board, move: chess.Move):
+        """
+        Update tracked state for a move that is about to be made.
+
+        By default, nothing is tracked.
+        """
+
+    def pop(self):
+        """
+        Restore tracked state after a move is taken back.
+
+        By default, nothing is tracked.
+        """
+
+    def suspend(self):
+        """
+        Return the tracked state, so another search can use the evaluator.
+
+        By default, nothing is tracked and None is returned.
+        """
+        return None
+
+    def resume(self, state):
+        """
+        Restore tracked state returned by suspend.
+
+        By default, nothing is tracked.
+        """
+
     def pawn_control_squares(self, board, color):
         """
         Return list of controlled squares.
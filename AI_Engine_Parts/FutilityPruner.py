@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Nov  1 17:46:21 2026
+
+@author: Prior_Bayes
+"""
+
+import chess
+from .AlphaBetaPruner import AlphaBetaPruner
+from .AI_Engine_Functions import SEE_VALUES
+
+
+class FutilityPruner(AlphaBetaPruner):
+    """
+    FutilityPruner adds futility and delta pruning to alpha-beta pruning.
+
+    Near the horizon, a quiet move rarely changes the score by more than a
+    small margin. When the static evaluation plus that margin still cannot
+    reach alpha (or beta, for black), the quiet moves of the node are
+    futile, and the search skips them after the first. Captures,
+    promotions and checking moves are always searched, and nodes in check
+    are never futile, so mates within the horizon are still found.
+
+    Delta pruning does the same for the quiescence search. A capture is
+    skipped when even winning the captured piece plus a margin cannot
+    reach alpha (or beta).
+
+    Margins are in the evaluation's units, which are pawns for the
+    evaluators in this package.
+
+    Methods
+    -------
+    futility_margin: Returns the futility margin for a depth.
+    can_skip: Determine whether a move may be skipped at a futile node.
+    delta_prune: Determine whether a quiescence capture should be skipped.
+    """
+
+    settings = ('margins', 'delta_margin')
+
+    def __init__(self, margins=(3, 5), delta_margin=2):
+        """
+        Initialize the pruner.
+
+        Arguments
+        ---------
+        margins: the futility margins of nodes 1, 2, ... ply from the
+                 horizon. Deeper nodes are never futile.
+        delta_margin: the margin added to the captured piece's value in
+                      delta pruning, or None to turn delta pruning off.
+        """
+        self.margins = tuple(margins)
+        self.delta_margin = delta_margin
+        # Number of moves skipped by each kind of pruning
+        self.pruned = {'futility': 0, 'delta': 0}
+
+    def futility_margin(self, depth):
+        """
+        Return how much a quiet move may raise the score at a depth.
+
+        Arguments
+        ---------
+        depth: the plies left to search at the node.
+
+        Returns
+        -------
+        margin: the margin, or None if the node is too far from the horizon.
+        """
+        if 0 < depth <= len(self.margins):
+            return self.margins[depth - 1]
+        return None
+
+    def can_skip(self, board: chess.Board, move: chess.Move) -> bool:
+        """
+        Determine whether a move may be skipped at a futile node.
+
+        Arguments
+        ---------
+        board: the current board state, before the move.
+        move: the move to be searched.
+
+        Returns
+        -------
+        skip: True if the move is quiet and does not give check.
+        """
+        if (move.promotion or board.is_capture(move)
+                or board.gives_check(move)):
+            return False
+        self.pruned['futility'] += 1
+        return True
+
+    def delta_prune(self, board: chess.Board, move: chess.Move, score,
+                    alpha, beta) -> bool:
+        """
+        Determine whether a quiescence capture should be skipped.
+
+        Arguments
+        ---------
+        board: the current board state, before the capture.
+        move: the capture.
+        score: the static evaluation of the position.
+        alpha: the score white is already guaranteed.
+        beta: the score black is already guaranteed.
+
+        Returns
+        -------
+        skip: True if the capture cannot bring the score into the window.
+        """
+        if self.delta_margin is None or board.is_check():
+            return False
+        victim = board.piece_type_at(move.to_square) or chess.PAWN
+        gain = SEE_VALUES[victim] / 100 + self.delta_margin
+        if move.promotion:
+            gain += (SEE_VALUES[move.promotion] - SEE_VALUES[chess.PAWN]) / 100
+        if board.turn:
+            futile = score + gain <= alpha
+        else:
+            futile = score - gain >= beta
+        if futile:
+            self.pruned['delta'] += 1
+        return futile
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Nov  7 18:46:03 2026
+
+@author: Prior_Bayes
+"""
+
+# Imports
+import json
+import os
+import chess
+from .AI_Engine_Functions import position_key, encode_move
+
+# Format of the files written by GameSession.save
+SESSION_VERSION = 1
+
+
+def reachable(key, root) -> bool:
+    """
+    Check whether a position could still arise in the game after a root.
+
+    Captures and promotions only ever remove material, and castling rights
+    are never regained, so a position with more pieces or pawns of either
+    side, or a castling right the root lacks, can never be reached again.
+
+    Arguments
+    ---------
+    key: the position_key of the position.
+    root: the position_key of the root.
+
+    Returns
+    -------
+    reachable: False if the position can never arise again.
+    """
+    if key[9] & ~root[9]:
+        return False
+    for color in (6, 7):
+        if (chess.popcount(key[color]) > chess.popcount(root[color])
+                or chess.popcount(key[0] & key[color])
+                > chess.popcount(root[0] & root[color])):
+            return False
+    return True
+
+
+class GameSession:
+    """
+    GameSession keeps an engine's search state warm between moves of a game.
+
+    The engine's hash moves and killer moves already outlive a search, but
+    nothing told them the game had moved on. Given to a ChessEngine, the
+    session is started before every find_best_move, and ages the state left
+    by the previous search. Hash moves of positions which can no longer
+    arise are dropped, as are the killers of plies already played. When
+    the position continues the line the previous search expected, the rest
+    of that line is stored as the hash moves along it, so the next search
+    tries it first at every ply. After the search, the session records the
+    root and principal variation for the next move.
+
+    The state can be saved to a JSON file and loaded into a new engine, so a
+    restarted process resumes warm.
+
+    Methods
+    -------
+        start: ages the engine's state for a new root position.
+        finish: records the root and line of a finished search.
+        expected_line: returns the rest of the previous line, if followed.
+        age: drops the hints which can no longer be used.
+        save: writes the engine's session state to a file.
+        load: reads state written by save into an engine.
+    """
+
+    def __init__(self, path=None):
+        """
+        Initialize the session.
+
+        Arguments
+        ---------
+        path: an optional file for save and load. A ChessEngine given the
+              session loads it when the file exists.
+        """
+        self.path = path
+        # The position key, ply and principal variation of the last search
+        self.root = None
+        self.ply = None
+        self.pv = []
+        # Hash moves dropped by aging, and moves of the previous line reused
+        self.aged = 0
+        self.reused = 0
+
+    def start(self, engine, board: chess.Board):
+        """
+        Age the engine's state and seed it with the previous line.
+
+        Arguments
+        ---------
+        engine: the ChessEngine about to search.
+        board: the root board of the search.
+        """
+        search = engine.searchEng
+        self.age(search, board)
+        line = self.expected_line(board)
+        if not line:
+            return
+        hyp_board = board.copy(stack=False)
+        for move in line:
+            search.hash_moves[position_key(hyp_board)] = encode_move(move)
+            hyp_board.push(move)
+        self.reused += len(line)
+
+    def finish(self, engine, board: chess.Board):
+        """
+        Record the root and principal variation of a finished search.
+
+        Arguments
+        ---------
+        engine: the ChessEngine which searched.
+        board: the root board of the search.
+        """
+        self.root = position_key(board)
+        self.ply = len(board.move_stack)
+        self.pv = list(engine.pv)
+
+    def expected_line(self, board: chess.Board) -> list:
+        """
+        Return the rest of the previous line, if the game has followed it.
+
+        Arguments
+        ---------
+        board: the new root board.
+
+        Returns
+        -------
+        line: the moves of the previous principal variation after those
+              played since its root, or an empty list if the game left it.
+        """
+        if self.root is None:
+            return []
+        played = len(board.move_stack) - self.ply
+        if not 0 <= played < len(self.pv):
+            return []
+        if board.move_stack[len(board.move_stack) - played:] != (
+                self.pv[:played]):
+            return []
+        hyp_board = board.copy()
+        for _ in range(played):
+            hyp_board.pop()
+        if position_key(hyp_board) != self.root:
+            return []
+        return self.pv[played:]
+
+    def age(self, search, board: chess.Board):
+        """
+        Drop the hints which can no longer be used from a new root.
+
+        Arguments
+        ---------
+        search: the engine's SearchEng.
+        board: the new root board.
+        """
+        root = position_key(board)
+        stale = [key for key in search.hash_moves if not reachable(key, root)]
+        for key in stale:
+            del search.hash_moves[key]
+        self.aged += len(stale)
+        ply = len(board.move_stack)
+        killers = search.killers
+        if self.ply is None or not 0 <= ply - self.ply < len(killers):
+            played = range(len(killers))
+        else:
+            played = range(self.ply, ply)
+        for past in played:
+            pair = killers[past % len(killers)]
+            pair[0] = pair[1] = 0
+
+    def save(self, engine, path=None):
+        """
+        Write the engine's session state to a JSON file.
+
+        Arguments
+        ---------
+        engine: the ChessEngine whose state is saved.
+        path: the file to write, by default the session's path.
+        """
+        search = engine.searchEng
+        state = {'version': SESSION_VERSION,
+                 'root': self.root, 'ply': self.ply,
+                 'pv': [move.uci() for move in self.pv],
+                 'hash_moves': [[*key, code]
+                                for key, code in search.hash_moves.items()],
+                 'killers': [list(pair) for pair in search.killers]}
+        with open(path or self.path, 'w') as output:
+            json.dump(state, output)
+
+    def load(self, engine, path=None) -> bool:
+        """
+        Read state written by save into an engine.
+
+        Arguments
+        ---------
+        engine: the ChessEngine to load the state into.
+        path: the file to read, by default the session's path.
+
+        Returns
+        -------
+        loaded: False if the file does not exist or is of another version.
+        """
+        path = path or self.path
+        if not os.path.exists(path):
+            return False
+        with open(path) as saved:
+            state = json.load(saved)
+        if state.get('version') != SESSION_VERSION:
+            return False
+        search = engine.searchEng
+        search.hash_moves.update((tuple(entry[:-1]), entry[-1])
+                                 for entry in state['hash_moves'])
+        for pair, codes in zip(search.killers, state['killers']):
+            pair[0], pair[1] = codes
+        self.root = None if state['root'] is None else tuple(state['root'])
+        self.ply = state['ply']
+        self.pv = [chess.Move.from_uci(uci) for uci in state['pv']]
+        return True
@@ -5,34 +5,223 @@ Created on Fri Aug 29 23:35:12 2025
 @author: Prior_Bayes
 """
 import chess
+from .AI_Engine_Functions import encode_move, decode_move
 from .Orderer import Orderer
+from .PSTEval import (PSTEval, PST_MG, PST_EG, PHASE_WEIGHTS,
+                      MAX_PHASE)
 
 
 class GreedyOrderer(Orderer):
     """
     An orderer which traverses the tree by looking at best options first.
 
+    Each child is scored by how the piece-square totals of a PSTEval change
+    with the move, which is worked out without making the move. The whole
+    node is scored in one pass and sorted best first for the side to move,
+    after the hash move.
+
+    When the evaluator is the engine's own, the score of a child is exactly
+    what the evaluation would return for it. The search then asks
+    leaf_score for the scores of horizon nodes rather than evaluating them
+    again.
+
     It inherits from Orderer.
+
+    Methods
+    -------
+    current_totals: Returns the running totals of the current position.
+    child_totals: Works out the totals after every move in one pass.
+    pick_moves: Yields the hash move and then the moves best first.
+    order_search: Returns the moves best first.
+    leaf_score: Returns the score of a child just yielded, if known.
     """
 
-    def order_search(self, board: chess.Board, eval_func) -> list[chess.Move]:
+    uses_hints = True
+    settings = ('scores_leaves',)
+
+    def __init__(self, evaluator=None):
+        """
+        Initialize the orderer.
+
+        Arguments
+        ---------
+        evaluator: a PSTEval to score moves with. Pass the engine's own
+                   evaluator to reuse the scores at the horizon. By default,
+                   the orderer scores with a private PSTEval and the scores
+                   only order the moves.
+        """
+        self.scores_leaves = evaluator is not None
+        self.evaluator = evaluator if evaluator is not None else PSTEval()
+        # The board, ply, move and score of the child yielded last
+        self.last_child = None
+        # Number of moves scored, and horizon nodes scored by the orderer
+        self.scored = 0
+        self.leaf_hits = 0
+
+    def current_totals(self, board: chess.Board) -> tuple:
+        """
+        Return the running totals of the current position.
+
+        The evaluator's stack is used when it is tracking the board, as it is
+        when the evaluator is the engine's own. Otherwise the board is
+        scanned.
+
+        Arguments
+        ---------
+        board: the current board state.
+
+        Returns
+        -------
+        totals: a tuple of (middlegame score, endgame score, phase).
+        """
+        evaluator = self.evaluator
+        if (board is evaluator.board
+                and len(board.move_stack) - evaluator.root_ply
+                == len(evaluator.stack) - 1):
+            return evaluator.stack[-1]
+        return evaluator.full_scan(board)
+
+    def child_totals(self, board: chess.Board, moves) -> list:
+        """
+        Work out the running totals after every move of a position.
+
+        Moves are scored in one pass, with the tables and board lookups
+        shared between them. Ordinary moves and captures only touch two or
+        three table entries, so they are worked out inline. Castling, en
+        passant and promotions go through the evaluator's move_delta.
+
+        Arguments
+        ---------
+        board: the current board state.
+        moves: the moves to score.
+
+        Returns
+        -------
+        children: a list with a tuple of (middlegame score, endgame score,
+                  phase) for each move.
+        """
+        mg, eg, phase = self.current_totals(board)
+        move_delta = self.evaluator.move_delta
+        piece_type_at = board.piece_type_at
+        color = board.turn
+        row_offset = 0 if color else 6
+        own = board.occupied_co[color]
+        enemy = board.occupied_co[not color]
+        ep_square = board.ep_square
+        children = []
+        for move in moves:
+            from_sq = move.from_square
+            to_sq = move.to_square
+            piece_type = piece_type_at(from_sq)
+            if (move.promotion
+                    or (piece_type == chess.PAWN and to_sq == ep_square)
+                    or (piece_type == chess.KING
+                        and (abs(from_sq - to_sq) == 2
+                             or own & chess.BB_SQUARES[to_sq]))):
+                children.append(move_delta(board, move, (mg, eg, phase)))
+                continue
+            row = (piece_type - 1 + row_offset) * 64
+            child_mg = mg + PST_MG[row + to_sq] - PST_MG[row + from_sq]
+            child_eg = eg + PST_EG[row + to_sq] - PST_EG[row + from_sq]
+            child_phase = phase
+            if enemy & chess.BB_SQUARES[to_sq]:
+                captured = piece_type_at(to_sq)
+                row = (captured + 5 - row_offset) * 64
+                child_mg -= PST_MG[row + to_sq]
+                child_eg -= PST_EG[row + to_sq]
+                child_phase -= PHASE_WEIGHTS[captured]
+            children.append((child_mg, child_eg, child_phase))
+        self.scored += len(moves)
+        return children
+
+    def pick_moves(self, board: chess.Board, hash_move=0, killers=()):
+        """
+        Yield the hash move and then the other moves, best first.
+
+        The blended score of a child is its middlegame and endgame totals
+        weighted by the phase, over a constant. The weighted sum is an exact
+        integer, so it is packed above each move's index, negated for black,
+        and one sort of plain integers orders the moves. Only the children
+        which are yielded are blended into a score, which is kept for
+        leaf_score.
+
+        Arguments
+        ---------
+        board: the current board state.
+        hash_move: the best move found for this position earlier, packed by
+                   encode_move, or 0.
+        killers: packed quiet moves which caused cutoffs at the same ply.
+                 They are not used, as the scores already rank quiet moves.
+
+        Returns
+        -------
+        moves: a generator of moves in search order.
+        """
+        blend = self.evaluator.blend
+        ply = len(board.move_stack) + 1
+        if hash_move:
+            move = decode_move(hash_move)
+            if board.is_legal(move):
+                self.last_child = (board, ply, move, blend(
+                    self.child_totals(board, [move])[0]))
+                yield move
+            else:
+                hash_move = 0
+
+        moves = list(board.generate_legal_moves())
+        children = self.child_totals(board, moves)
+        sign = 1 if board.turn else -1
+        order = []
+        for index, (mg, eg, phase) in enumerate(children):
+            phase = min(phase, MAX_PHASE)
+            weighted = mg * phase + eg * (MAX_PHASE - phase)
+            order.append(sign * weighted << 8 | 255 - index)
+        order.sort(reverse=True)
+        for packed in order:
+            index = 255 - (packed & 255)
+            move = moves[index]
+            if hash_move and encode_move(move) == hash_move:
+                continue
+            self.last_child = (board, ply, move, blend(children[index]))
+            yield move
+
+    def order_search(self, board: chess.Board) -> list[chess.Move]:
         """
         Determine the order of moves to be searched.
 
-        This function determines the search order by evaluating the current
-        score of each position. The move it checks first at each tree is the
+        This function determines the search order by evaluating the score
+        of each child position. The move it checks first at each tree is the
         move which provides the best immediate value.
 
         Arguments
         ---------
         board: the current board state.
-        eval_func: the function which scores a given position.
 
         Returns
         -------
         search_order: a list ordered by the search order.
         """
-        unsorted_legal_moves = self.legal_moves_list(board)
-        legal_move_scores = [(eval_func(move), move)
-                             for move in unsorted_legal_moves]
-        return sorted(legal_move_scores, reverse=board.Turn)
+        return list(self.pick_moves(board))
+
+    def leaf_score(self, board: chess.Board):
+        """
+        Return the score of the position after the move yielded last.
+
+        Arguments
+        ---------
+        board: the current board state.
+
+        Returns
+        -------
+        score: the score worked out while ordering, or None if the board is
+               not the child of the move yielded last, or the scores come
+               from a private evaluator.
+        """
+        last_child = self.last_child
+        if (not self.scores_leaves or last_child is None
+                or board is not last_child[0]
+                or len(board.move_stack) != last_child[1]
+                or board.move_stack[-1] != last_child[2]):
+            return None
+        self.leaf_hits += 1
+        return last_child[3]
@@ -8,11 +8,64 @@ Created on Fri Aug 29 23:37:49 2025
 import chess
 from .EvalEng import EvalEng
 from .AI_Engine_Functions import fen_to_space
+from .AttackMap import AttackMap
+from .PawnHashTable import PawnHashTable
 
 # These are supposed to represent infinity, assuming nothing will be higher
 inf = 2**63 - 1
 neg_inf = -2**63
 
+# Pawn-structure scores for each island, doubled, isolated and passed pawn
+PAWN_STRUCTURE_VALUES = (-0.1, -0.2, -0.15, 0.3)
+
+
+def build_file_set_masks():
+    """Return the bitboard covering the files of every 8-bit file set."""
+    masks = [0] * 256
+    for files in range(256):
+        for file in range(8):
+            if files >> file & 1:
+                masks[files] |= chess.BB_FILES[file]
+    return masks
+
+
+def build_passed_masks():
+    """Return, per color and square, where enemy pawns stop a passed pawn."""
+    masks = [[0] * 64, [0] * 64]
+    for square in chess.SQUARES:
+        file = chess.square_file(square)
+        rank = chess.square_rank(square)
+        span = FILE_SET_MASKS[(0b111 << file >> 1) & 0xFF]
+        masks[chess.WHITE][square] = span & ~((1 << 8 * (rank + 1)) - 1)
+        masks[chess.BLACK][square] = span & ((1 << 8 * rank) - 1)
+    return masks
+
+
+# The bitboard covering every file in an 8-bit set of files
+FILE_SET_MASKS = build_file_set_masks()
+
+# Squares which must be free of enemy pawns for a pawn to be passed
+PASSED_MASKS = build_passed_masks()
+
+
+def file_set(pawns: int) -> int:
+    """
+    Fold a pawn bitboard onto one rank.
+
+    Arguments
+    ---------
+    pawns: a bitboard of pawns.
+
+    Returns
+    -------
+    files: an 8-bit set with bit n set if there is a pawn on file n.
+    """
+    pawns |= pawns >> 32
+    pawns |= pawns >> 16
+    pawns |= pawns >> 8
+    return pawns & 0xFF
+
+
 class HeuristicEval(EvalEng):
     """
     HeuristicEval attempts to evaluate the position using chess heuristics.
@@ -25,10 +78,55 @@ class HeuristicEval(EvalEng):
         current_material: calculatest the material score of the position.
         current_space: calculates the number of opponent's squares controlled.
         current_development: counts the number of pieces developed.
-        current_pawnshain: counts the number of pawn-cahins.
+        current_pawnisland: counts the number of pawn islands.
+        current_pawn_structure: scores the pawn structure.
+        current_king_safety: counts the attacks on the enemy king's zone.
+        score_window: scores lazily, skipping terms outside the window.
+        reset, push, pop: keep the attack map in step with the search.
+        suspend, resume: save and restore the attack map's state.
 
     """
 
+    settings = ('lazy', 'lazy_margins', 'weights')
+
+    def __init__(self, lazy=False, lazy_margins=(4, 10, 12),
+                 pawn_table_size=2**14, attack_map=None,
+                 weights=(1, 0.2, 0.2, 0, 0)):
+        """
+        Initialize the evaluator.
+
+        Arguments
+        ---------
+        lazy: if True, score_window computes the terms from cheapest to most
+              expensive and stops once the score is outside the window.
+        lazy_margins: the largest difference expected from the development,
+                      space and king-safety terms, before weighting. These
+                      are typical bounds rather than hard ones, so larger
+                      margins give scores closer to score_pos at the cost of
+                      speed.
+        pawn_table_size: the number of slots in the pawn hash table.
+        attack_map: an optional AttackMap. If given, the evaluator becomes
+                    incremental and keeps the map in step with the search,
+                    and the space and king-safety terms read from it. The
+                    same map may be given to AttackOrderer.
+        weights: the relative value of material, space and development,
+                 with a fourth weight for pawn structure and a fifth for
+                 king safety. The scoring methods use these unless given
+                 others. Pawn structure and king safety are left out by
+                 default. A nonzero fourth weight turns pawn structure on,
+                 backed by the pawn hash table, and a nonzero fifth weight
+                 turns king safety on, read from the attack map if there is
+                 one.
+        """
+        self.pawn_table = PawnHashTable(pawn_table_size)
+        self.attack_map = attack_map
+        self.incremental = attack_map is not None
+        self.lazy = lazy
+        self.lazy_margins = lazy_margins
+        self.weights = tuple(weights)
+        # Number of lazy evaluations finished after each term
+        self.lazy_exits = {'material': 0, 'development': 0, 'space': 0}
+
     def current_material(self, board):
         """
         Calculate the current material score.
@@ -73,7 +171,13 @@ class HeuristicEval(EvalEng):
         A tuple where the first position is the white space score and the
         second is the black space score.
         """
+        if self.attack_map is not None:
+            attack_map = self.attack_map.sync(board)
+            return (attack_map.space(chess.WHITE),
+                    attack_map.space(chess.BLACK))
         score = []
+        # Moves are generated for each side in turn, so restore the turn after
+        turn = board.turn
         for color in ['white', 'black']:
             if color == 'white':
                 board.turn = True
@@ -101,9 +205,35 @@ class HeuristicEval(EvalEng):
             result += ''.join(pawn_controls)
 
             score.append(sum(result.count(moves) for moves in opponent_rows))
+        board.turn = turn
         score = tuple(score)
         return score
 
+    def current_king_safety(self, board):
+        """
+        Calculate the pressure each side puts on the enemy king.
+
+        Every attack on the enemy king's square or a square next to it
+        counts once, so a square attacked by two pieces counts twice.
+
+        Arguments
+        ---------
+        board: the current board space.
+
+        Returns
+        -------
+        attacks: A tuple where the first position is the number of white
+                 attacks on the black king's zone and the second is the
+                 number of black attacks on the white king's zone.
+        """
+        if self.attack_map is not None:
+            attack_map = self.attack_map.sync(board)
+        else:
+            attack_map = AttackMap()
+            attack_map.reset(board)
+        return (attack_map.king_attacks(chess.BLACK),
+                attack_map.king_attacks(chess.WHITE))
+
     def current_development(self, board):
         """
         Calculate the current development.
@@ -144,7 +274,10 @@ class HeuristicEval(EvalEng):
 
     def current_pawnisland(self, board):
         """
-        Current_pawnchain calculates the current number of pawn chains.
+        Calculate the current number of pawn islands.
+
+        An island is a group of pawns on adjacent files with no friendly pawns
+        on the files either side.
 
         Arguments
         ---------
@@ -152,51 +285,214 @@ class HeuristicEval(EvalEng):
 
         Returns
         -------
-        chain_num: An integer representing the pawn chain number.
+        islands: A tuple where the first position is the number of white pawn
+                 islands and the second is the number of black pawn islands.
+        """
+        islands = []
+        for color in [chess.WHITE, chess.BLACK]:
+            files = file_set(board.pieces_mask(chess.PAWN, color))
+            # Count the files which start a run of pawn files
+            islands.append(chess.popcount(files & ~(files << 1)))
+        return tuple(islands)
+
+    def pawn_structure(self, white_pawns: int, black_pawns: int) -> tuple:
+        """
+        Count the pawn-structure features of both sides.
+
+        Arguments
+        ---------
+        white_pawns: the bitboard of white pawns.
+        black_pawns: the bitboard of black pawns.
+
+        Returns
+        -------
+        structure: A tuple with one tuple per side, white first. Each holds
+                   the number of islands, doubled, isolated and passed pawns.
+        """
+        structure = []
+        for color, pawns, enemy in [(chess.WHITE, white_pawns, black_pawns),
+                                    (chess.BLACK, black_pawns, white_pawns)]:
+            files = file_set(pawns)
+            islands = chess.popcount(files & ~(files << 1))
+            doubled = chess.popcount(pawns) - chess.popcount(files)
+            lonely = files & ~((files << 1) | (files >> 1))
+            isolated = chess.popcount(pawns & FILE_SET_MASKS[lonely])
+            passed = 0
+            for square in chess.scan_forward(pawns):
+                if not enemy & PASSED_MASKS[color][square]:
+                    passed += 1
+            structure.append((islands, doubled, isolated, passed))
+        return tuple(structure)
+
+    def current_pawn_structure(self, board):
         """
-        # Get all squares with white pawns
-        white_pawn_squares = [square for square, piece
-                              in board.piece_map().items()
-                              if piece.piece_type == chess.PAWN
-                              and piece.color == chess.WHITE]
+        Calculate the current pawn-structure score.
 
-        # Get all squares with black pawns
-        black_pawn_squares = [square for square, piece
-                              in board.piece_map().items()
-                              if piece.piece_type == chess.PAWN
-                              and piece.color == chess.BLACK]
+        Islands, doubled and isolated pawns are penalised and passed pawns are
+        rewarded. Scores are looked up in the pawn hash table first, so each
+        pawn configuration is only scored once.
 
-        white_col = [int(square[1:]) for square in white_pawn_squares]
-        black_col = [int(square[1:]) for square in black_pawn_squares]
+        Arguments
+        ---------
+        board: the current board space.
 
-        if not white_col:
-            white_pawn_chains = 0
-        else:
-            white_empt_columns = set(white_col) - {1: 8}
+        Returns
+        -------
+        scores: A tuple where the first position is the white pawn-structure
+                score and the second is the black pawn-structure score.
+        """
+        white_pawns = board.pieces_mask(chess.PAWN, chess.WHITE)
+        black_pawns = board.pieces_mask(chess.PAWN, chess.BLACK)
+        scores = self.pawn_table.probe(white_pawns, black_pawns)
+        if scores is None:
+            scores = tuple(
+                sum(count * value for count, value
+                    in zip(counts, PAWN_STRUCTURE_VALUES))
+                for counts in self.pawn_structure(white_pawns, black_pawns))
+            self.pawn_table.store(white_pawns, black_pawns, scores)
+        return scores
 
-    def score_pos(self, board, weights=[1, 0.2, 0.2]):
+    def score_pos(self, board, weights=None):
         """
         Scores a position.
 
         It scores based on multiple categories:
-        material, development, squares controlled, king safety, etc.
+        material, development, squares controlled, pawn structure, king
+        safety, etc.
 
         It takes two arguments:
         board: The current board space.
-        weights: The relative value of different points
+        weights: The relative value of different points, by default the
+                 evaluator's weights. The fourth weight scores pawn
+                 structure and an optional fifth king safety.
 
         It returns:
         A numerical score of the position, where 0 means it is equal, a
         negative means it favors black, and a positive means it favors
         white.
         """
+        if board.is_checkmate():
+            return neg_inf if board.turn else inf
+        return self.score_terms(board, weights)
+
+    def score_terms(self, board, weights=None):
+        """
+        Score a position from its terms, without checking for checkmate.
+
+        Arguments
+        ---------
+        board: The current board space.
+        weights: The relative value of different points, by default the
+                 evaluator's weights, with a fourth weight for pawn
+                 structure and an optional fifth weight for king safety.
+                 Terms weighted 0 are not computed.
+
+        Returns
+        -------
+        score: A numerical score of the position.
+        """
+        if weights is None:
+            weights = self.weights
         white_mat, black_mat = self.current_material(board)
         white_spac, black_spac = self.current_space(board)
         white_dev, black_dev = self.current_development(board)
-        if board.is_checkmate():
-            score = neg_inf if board.turn else inf
-        else:
-            score = (weights[0] * (white_mat - black_mat)
-                     + weights[1] * (white_spac - black_spac)
-                     + weights[2] * (white_dev - black_dev))
-        return score
\ No newline at end of file
+        score = (weights[0] * (white_mat - black_mat)
+                 + weights[1] * (white_spac - black_spac)
+                 + weights[2] * (white_dev - black_dev))
+        if weights[3]:
+            white_pawn, black_pawn = self.current_pawn_structure(board)
+            score += weights[3] * (white_pawn - black_pawn)
+        if len(weights) > 4 and weights[4]:
+            white_king, black_king = self.current_king_safety(board)
+            score += weights[4] * (white_king - black_king)
+        return score
+
+    def score_window(self, board, alpha, beta, weights=None):
+        """
+        Score a position lazily given the search's alpha-beta window.
+
+        The terms are computed in order of cost: material and pawn
+        structure, development and then space. After each term, if the score
+        plus or minus the largest change the remaining terms could make is
+        still outside the window, the partial score is returned. The search
+        would cut the node either way, so the expensive space term is skipped
+        in most leaves. Checkmate is not looked for, since the search finds
+        it when generating moves. Outside the search, use score_pos or
+        ChessEngine.evaluate.
+
+        Arguments
+        ---------
+        board: The current board space.
+        alpha: the score white is already guaranteed.
+        beta: the score black is already guaranteed.
+        weights: The relative value of different points, by default the
+                 evaluator's weights, with a fourth weight for pawn
+                 structure and an optional fifth weight for king safety.
+                 Terms weighted 0 are not computed.
+
+        Returns
+        -------
+        score: A numerical score of the position. It is exact when it falls
+               inside the window and a bound otherwise.
+        """
+        if weights is None:
+            weights = self.weights
+        if not self.lazy:
+            return self.score_terms(board, weights)
+
+        king_weight = weights[4] if len(weights) > 4 else 0
+        dev_margin = weights[2] * self.lazy_margins[0]
+        # Space and king safety are computed together, last
+        space_margin = weights[1] * self.lazy_margins[1]
+        if king_weight:
+            space_margin += king_weight * self.lazy_margins[2]
+
+        white_mat, black_mat = self.current_material(board)
+        score = weights[0] * (white_mat - black_mat)
+        if weights[3]:
+            white_pawn, black_pawn = self.current_pawn_structure(board)
+            score += weights[3] * (white_pawn - black_pawn)
+        margin = dev_margin + space_margin
+        if score + margin <= alpha or score - margin >= beta:
+            self.lazy_exits['material'] += 1
+            return score
+
+        white_dev, black_dev = self.current_development(board)
+        score += weights[2] * (white_dev - black_dev)
+        if score + space_margin <= alpha or score - space_margin >= beta:
+            self.lazy_exits['development'] += 1
+            return score
+
+        white_spac, black_spac = self.current_space(board)
+        score += weights[1] * (white_spac - black_spac)
+        if king_weight:
+            white_king, black_king = self.current_king_safety(board)
+            score += king_weight * (white_king - black_king)
+        self.lazy_exits['space'] += 1
+        return score
+
+    def reset(self, board: chess.Board):
+        """Start tracking a board with the attack map, if there is one."""
+        if self.attack_map is not None:
+            self.attack_map.reset(board)
+
+    def push(self, board: chess.Board, move: chess.Move):
+        """Update the attack map for a move that is about to be made."""
+        if self.attack_map is not None:
+            self.attack_map.push(board, move)
+
+    def pop(self):
+        """Restore the attack map of the previous position."""
+        if self.attack_map is not None:
+            self.attack_map.pop()
+
+    def suspend(self):
+        """Return the attack map's state, if there is one, for resume."""
+        if self.attack_map is not None:
+            return self.attack_map.suspend()
+        return None
+
+    def resume(self, state):
+        """Restore the attack map's state from suspend."""
+        if self.attack_map is not None:
+            self.attack_map.resume(state)
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 25 16:08:44 2026
+
+@author: Prior_Bayes
+"""
+
+# Imports
+import time
+from array import array
+import numpy as np
+from .AI_Engine_Functions import encode_move, decode_move, position_hash
+from .SearchEng import SearchEng, SearchTimeout
+from .SharedHashTable import EXACT, LOWER, UPPER
+from .TerminalDetector import TerminalDetector
+
+# What the task does next: start a node, try a node's next move, or hand a
+# finished node's score back to its parent
+ENTER = 0
+NEXT = 1
+RETURN = 2
+
+
+class SearchTask:
+    """
+    One alpha-beta search run from an explicit stack instead of recursion.
+
+    Each ply of the search has a slot in preallocated lists holding its
+    depth, bounds, move generator, number of moves tried, current move and
+    best move. The current and best moves are packed into 16-bit arrays.
+    The task can be stepped for a number of nodes, suspended and resumed
+    later, so one thread can interleave many searches. Each task has its
+    own TerminalDetector, since interleaved tasks push different moves. The
+    engine's trackers are shared, so a task saves their state with suspend
+    when it stops part way and restores it with resume when it goes on.
+    Trackers without suspend and resume cannot be shared by interleaved
+    tasks. A task nested inside another search, such as one started at a
+    child of iter_root, leaves the trackers tracking the outer search.
+
+    Methods
+    -------
+    step: runs the search for up to a number of nodes.
+    run: runs the search to the end.
+    """
+
+    def __init__(self, engine, board, eval_func, depth, alpha, beta,
+                 reset=True):
+        """
+        Initialize the task at the root of the search.
+
+        Arguments
+        ---------
+        engine: the IterativeSearchEng running the task.
+        board: the board to search, which the task pushes and pops.
+        eval_func: the function which scores a given position.
+        depth: how many ply deep the search goes.
+        alpha: the score white is already guaranteed.
+        beta: the score black is already guaranteed.
+        reset: if True, the engine's trackers start tracking the board on
+               the first step. Otherwise they are left as they are, for a
+               task run inside a search which already tracks the board.
+        """
+        self.engine = engine
+        self.board = board
+        self.eval_func = eval_func
+        size = depth + 1
+        self.depth = [0] * size
+        self.alpha = [0] * size
+        self.beta = [0] * size
+        self.moves = [None] * size
+        self.move_index = [0] * size
+        # Moves of each ply packed by encode_move, 0 for none
+        self.current = array('H', bytes(2 * size))
+        self.best = array('H', bytes(2 * size))
+        self.cutoff = [False] * size
+        self.futile = [False] * size
+        self.key = [None] * size
+        self.ply = [0] * size
+        # Transposition table key and starting bounds of each ply
+        self.table_key = [0] * size
+        self.alpha_start = [0] * size
+        self.beta_start = [0] * size
+        self.depth[0] = depth
+        self.alpha[0] = alpha
+        self.beta[0] = beta
+        self.sp = 0
+        self.action = ENTER
+        self.value = None
+        self.result = None
+        self.done = False
+        self.nodes = 0
+        self.terminal = TerminalDetector(engine.terminal.repetitions,
+                                         engine.terminal.halfmove_limit)
+        self.terminal.reset(board)
+        # The trackers' state while the task is suspended, None before the
+        # first step
+        self.tracker_states = None
+        self.reset = reset
+
+    def step(self, max_nodes=None):
+        """
+        Run the search until it finishes or has entered max_nodes nodes.
+
+        Arguments
+        ---------
+        max_nodes: the number of nodes to search before suspending, or None
+                   to search to the end.
+
+        Returns
+        -------
+        result: the (best move, score) tuple once the search has finished,
+                otherwise None.
+
+        Raises
+        ------
+        SearchTimeout: if the engine's deadline or node limit has passed.
+        RuntimeError: if another task ran since this one was suspended and
+                      a tracker cannot save its state.
+        """
+        engine = self.engine
+        self.resume_trackers()
+        orderer = engine.orderer
+        pruner = engine.pruner
+        board = self.board
+        eval_func = self.eval_func
+        budget = max_nodes
+        sp = self.sp
+        action = self.action
+        value = self.value
+        best_move = None
+        # make_move and unmake_move keep the engine's detector in step
+        terminal = engine.terminal
+        engine.terminal = self.terminal
+        try:
+            return self._step(engine, orderer, pruner, board, eval_func,
+                              budget, sp, action, value, best_move)
+        finally:
+            engine.terminal = terminal
+            if not self.done:
+                self.tracker_states = [
+                    tracker.suspend() if hasattr(tracker, 'suspend')
+                    else None for tracker in engine.trackers]
+
+    def resume_trackers(self):
+        """
+        Put the engine's trackers back in the state this task left them.
+
+        On the first step of a task with reset, the trackers start tracking
+        the task's board.
+
+        Raises
+        ------
+        RuntimeError: if another task ran since this one was suspended and
+                      a tracker cannot restore its state.
+        """
+        engine = self.engine
+        previous = engine.active_task
+        engine.active_task = self
+        if self.tracker_states is None:
+            if self.reset:
+                for tracker in engine.trackers:
+                    if hasattr(tracker, 'reset'):
+                        tracker.reset(self.board)
+            return
+        for tracker, state in zip(engine.trackers, self.tracker_states):
+            if hasattr(tracker, 'resume'):
+                tracker.resume(state)
+            elif previous is not self:
+                raise RuntimeError(f'{type(tracker).__name__} cannot be '
+                                   f'shared by interleaved search tasks')
+
+    def _step(self, engine, orderer, pruner, board, eval_func, budget, sp,
+              action, value, best_move):
+        """Run the state machine of step with the task's detector in use."""
+        while not self.done:
+            if action == ENTER:
+                if budget is not None:
+                    if budget == 0:
+                        break
+                    budget -= 1
+                self.nodes += 1
+                engine.nodes += 1
+                if ((engine.deadline is not None and not engine.nodes & 255
+                        and time.perf_counter() > engine.deadline)
+                        or (engine.node_limit is not None
+                            and engine.nodes > engine.node_limit)):
+                    self.sp, self.action = sp, action
+                    raise SearchTimeout
+                if sp and self.terminal.is_draw(board):
+                    value = 0
+                    best_move = None
+                    action = RETURN
+                    continue
+                if self.depth[sp] == 0:
+                    value = engine.leaf_score(board, eval_func,
+                                              self.alpha[sp], self.beta[sp])
+                    best_move = None
+                    action = RETURN
+                    continue
+                table_move = 0
+                if engine.table is not None:
+                    table_key = position_hash(board)
+                    entry = engine.table.probe(table_key)
+                    if entry is not None:
+                        table_depth, table_score, bound, table_move = entry
+                        if table_depth >= self.depth[sp] and (
+                                bound == EXACT
+                                or (bound == LOWER
+                                    and table_score >= self.beta[sp])
+                                or (bound == UPPER
+                                    and table_score <= self.alpha[sp])):
+                            value = table_score
+                            best_move = decode_move(table_move)
+                            action = RETURN
+                            continue
+                    self.table_key[sp] = table_key
+                    self.alpha_start[sp] = self.alpha[sp]
+                    self.beta_start[sp] = self.beta[sp]
+                self.move_index[sp] = 0
+                self.best[sp] = 0
+                self.cutoff[sp] = False
+                self.key[sp], self.ply[sp], self.moves[sp] = (
+                    engine.hinted_moves(board, table_move))
+                self.futile[sp] = engine.futile_node(
+                    board, eval_func, self.depth[sp], self.alpha[sp],
+                    self.beta[sp])
+                action = NEXT
+
+            elif action == NEXT:
+                move = None
+                if not self.cutoff[sp]:
+                    move = next(self.moves[sp], None)
+                    if self.futile[sp] and self.move_index[sp]:
+                        while (move is not None
+                               and pruner.can_skip(board, move)):
+                            move = next(self.moves[sp], None)
+                if move is not None:
+                    self.move_index[sp] += 1
+                    self.current[sp] = encode_move(move)
+                    engine.make_move(board, move)
+                    child = sp + 1
+                    self.depth[child] = self.depth[sp] - 1
+                    self.alpha[child] = self.alpha[sp]
+                    self.beta[child] = self.beta[sp]
+                    sp = child
+                    action = ENTER
+                    continue
+                # The node has no moves left, or was cut off
+                self.moves[sp] = None
+                if not self.move_index[sp]:
+                    # Move generation found no moves, so the game is over
+                    value = engine.no_moves_score(board)
+                    best_move = None
+                else:
+                    best_move = decode_move(self.best[sp])
+                    if orderer.uses_hints and best_move is not None:
+                        engine.store_hints(board, self.key[sp], self.ply[sp],
+                                           best_move, self.cutoff[sp])
+                    value = (self.alpha[sp] if board.turn
+                             else self.beta[sp])
+                    if engine.table is not None:
+                        if value <= self.alpha_start[sp]:
+                            bound = UPPER
+                        elif value >= self.beta_start[sp]:
+                            bound = LOWER
+                        else:
+                            bound = EXACT
+                        engine.table.store(self.table_key[sp],
+                                           self.depth[sp], value, bound,
+                                           self.best[sp])
+                action = RETURN
+
+            else:
+                if sp == 0:
+                    self.result = (best_move, value)
+                    self.done = True
+                    break
+                sp -= 1
+                engine.unmake_move(board)
+                if board.turn:
+                    if value > self.alpha[sp]:
+                        self.alpha[sp] = value
+                        self.best[sp] = self.current[sp]
+                else:
+                    if value < self.beta[sp]:
+                        self.beta[sp] = value
+                        self.best[sp] = self.current[sp]
+                if pruner.should_prune(self.alpha[sp], self.beta[sp]):
+                    self.cutoff[sp] = True
+                action = NEXT
+
+        self.sp = sp
+        self.action = action
+        self.value = value
+        return self.result
+
+    def run(self):
+        """Run the search to the end and return (best move, score)."""
+        return self.step()
+
+
+class IterativeSearchEng(SearchEng):
+    """
+    A search engine which searches from an explicit stack.
+
+    It searches the same tree in the same order as SearchEng.search and
+    gives identical results, but without a Python frame per node. A search
+    can also be started as a SearchTask, which can be paused after a number
+    of nodes and resumed later. Tasks started on the same engine share its
+    ordering hints and transposition table, so interleaved searches may
+    break ties differently from searches run one at a time, but find the
+    same scores.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the engine as SearchEng does."""
+        super().__init__(*args, **kwargs)
+        # The task which stepped last
+        self.active_task = None
+
+    def start(self, board, eval_func, depth=2, alpha=-np.inf, beta=np.inf):
+        """
+        Start a search which can be run a few nodes at a time.
+
+        Arguments
+        ---------
+        board: the board to search, which the task pushes and pops.
+        eval_func: the function which scores a given position. It is called
+                   with the board, alpha and beta.
+        depth: how many ply deep the search goes.
+        alpha: the score white is already guaranteed.
+        beta: the score black is already guaranteed.
+
+        Returns
+        -------
+        task: a SearchTask positioned at the root.
+        """
+        return SearchTask(self, board, eval_func, depth, alpha, beta)
+
+    def search(self, board, eval_func, depth=2, alpha=-np.inf, beta=np.inf):
+        """
+        Search finds the best guaranteed board within a certain depth.
+
+        Like SearchEng.search, it leaves the trackers as they are, since it
+        is also called at the children of iter_root and search_multipv while
+        the trackers follow the outer search.
+
+        Arguments
+        ---------
+        board: the current board space.
+        eval_func: the function which scores a given position. It is called
+                   with the board, alpha and beta.
+        depth: how many ply deep the search goes.
+        alpha: the score white is already guaranteed.
+        beta: the score black is already guaranteed.
+
+        Returns
+        -------
+        best_move: A tuple with the best move and associated score.
+        """
+        return SearchTask(self, board, eval_func, depth, alpha, beta,
+                          reset=False).run()
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 27 20:03:58 2026
+
+@author: Prior_Bayes
+"""
+
+# Imports
+import multiprocessing
+import time
+import chess
+from .EngineService import default_engine
+from .SharedHashTable import SharedHashTable
+
+
+def _helper_search(table_name, table_size, fen, depth, engine_factory, nodes,
+                   index):
+    """
+    Search a position in a helper process, sharing results through a table.
+
+    The helper's node count is written to nodes[index] after every update,
+    since the helper is stopped without warning once the main search ends.
+    """
+    table = SharedHashTable(table_size, name=table_name)
+    engine = engine_factory()
+    engine.searchEng.table = table
+    try:
+        for update in engine.iter_search(chess.Board(fen), depth):
+            nodes[index] = update.nodes
+    finally:
+        table.close()
+
+
+class LazySMP:
+    """
+    Lazy SMP runs the same search in several processes at once.
+
+    Python threads cannot search in parallel because of the GIL, so the
+    helpers are separate processes. They all search the same position with
+    iterative deepening and share a SharedHashTable, so a cutoff found by
+    one process is seen by the others. Half of the helpers aim one ply
+    deeper than the main search, so the processes drift apart instead of
+    searching the same nodes in lockstep. The main search decides the move,
+    and the helpers are stopped once it finishes.
+
+    Methods
+    -------
+        find_best_move: searches a position with the helpers.
+        scaling: runs the same search with different helper counts.
+        report_scaling: formats the results of scaling as a table.
+    """
+
+    def __init__(self, engine_factory=default_engine, helpers=3,
+                 table_size=2**20):
+        """
+        Initialize the searcher.
+
+        Arguments
+        ---------
+        engine_factory: a picklable function building a new ChessEngine.
+        helpers: the number of helper processes.
+        table_size: the number of entries in the shared table.
+        """
+        self.engine_factory = engine_factory
+        self.helpers = helpers
+        self.table_size = table_size
+        self.stats = {}
+
+    def find_best_move(self, board, depth):
+        """
+        Search a position with the main process and the helpers.
+
+        Afterwards, stats holds the elapsed time, the nodes searched by the
+        main process and in total, the nodes per second and the time at
+        which the main search finished each depth.
+
+        Arguments
+        ---------
+        board: the current board state.
+        depth: how many ply deep the main search goes.
+
+        Returns
+        -------
+        best_move: A tuple with the best move and associated score.
+        """
+        context = multiprocessing.get_context()
+        table = SharedHashTable(self.table_size)
+        nodes = context.Array('q', max(self.helpers, 1), lock=False)
+        processes = [
+            context.Process(target=_helper_search, daemon=True,
+                            args=(table.name, table.size, board.fen(),
+                                  depth + index % 2, self.engine_factory,
+                                  nodes, index))
+            for index in range(self.helpers)]
+        engine = self.engine_factory()
+        engine.searchEng.table = table
+
+        start = time.perf_counter()
+        try:
+            for process in processes:
+                process.start()
+            time_to_depth = {}
+            best_move = None
+            for update in engine.iter_search(board, depth):
+                best_move = (update.move, update.score)
+                if update.complete:
+                    time_to_depth[update.depth] = update.elapsed
+            elapsed = time.perf_counter() - start
+        finally:
+            for process in processes:
+                process.terminate()
+            for process in processes:
+                process.join()
+            table.close()
+
+        total_nodes = engine.searchEng.nodes + sum(nodes[:self.helpers])
+        self.stats = {'helpers': self.helpers,
+                      'elapsed': elapsed,
+                      'main_nodes': engine.searchEng.nodes,
+                      'nodes': total_nodes,
+                      'nps': total_nodes / elapsed if elapsed else 0.0,
+                      'time_to_depth': time_to_depth}
+        return best_move
+
+    def scaling(self, board, depth, helper_counts=(0, 1, 2, 3)):
+        """
+        Run the same search with different numbers of helpers.
+
+        Arguments
+        ---------
+        board: the current board state.
+        depth: how many ply deep the main search goes.
+        helper_counts: the helper counts to try.
+
+        Returns
+        -------
+        rows: a list with the stats of each run.
+        """
+        rows = []
+        helpers = self.helpers
+        try:
+            for count in helper_counts:
+                self.helpers = count
+                self.find_best_move(board, depth)
+                rows.append(self.stats)
+        finally:
+            self.helpers = helpers
+        return rows
+
+    def report_scaling(self, rows):
+        """
+        Format the results of scaling as a table.
+
+        Speedups are relative to the first row, usually the run without
+        helpers.
+
+        Arguments
+        ---------
+        rows: the list returned by scaling.
+
+        Returns
+        -------
+        report: the table as a string.
+        """
+        base = rows[0]
+        lines = ['helpers  time(s)  nodes/s  nps-scale  time-to-depth '
+                 'speedup']
+        for row in rows:
+            depth = max(row['time_to_depth'])
+            speedup = (base['time_to_depth'][depth]
+                       / row['time_to_depth'][depth])
+            lines.append(f"{row['helpers']:7d}  {row['elapsed']:7.2f}  "
+                         f"{row['nps']:7.0f}  "
+                         f"{row['nps'] / base['nps']:9.2f}  {speedup:.2f}")
+        return '\n'.join(lines)
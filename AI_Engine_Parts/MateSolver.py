@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 28 19:17:22 2026
+
+@author: Prior_Bayes
+"""
+
+import time
+import chess
+
+# Proof and disproof numbers at or above this are treated as infinite
+PN_INF = 10**9
+
+
+class PNNode:
+    """
+    A node of the proof-number tree.
+
+    OR nodes have the attacker to move and are proven if any child is.
+    AND nodes have the defender to move and are proven if every child is.
+    """
+
+    __slots__ = ('move', 'parent', 'children', 'proof', 'disproof',
+                 'is_or', 'ply')
+
+    def __init__(self, move, parent, is_or, ply):
+        """Initialize an unexpanded node."""
+        self.move = move
+        self.parent = parent
+        self.children = None
+        self.proof = 1
+        self.disproof = 1
+        self.is_or = is_or
+        self.ply = ply
+
+
+class MateSolver:
+    """
+    MateSolver finds forced mates with proof-number search.
+
+    Proof-number search grows the tree towards the moves which are cheapest
+    to prove or disprove, rather than evaluating every leaf to a fixed depth.
+    Positions are never scored, only checked for checkmate, so forced mates
+    are found far faster than with a full search.
+
+    Mates are searched for one move length at a time, so the first proof
+    found is the shortest mate, and the search stops as soon as it is found.
+    The tree is capped at max_nodes nodes, or fewer when solve is given a
+    node limit, and solve may also be given a deadline. Once either is
+    reached the search gives up and reports no mate.
+
+    Methods
+    -------
+        solve: finds a forced mate for the side to move.
+    """
+
+    # Attributes which change which mates are found, for engine_fingerprint
+    settings = ('max_moves', 'max_nodes')
+
+    def __init__(self, max_moves=3, max_nodes=200000):
+        """
+        Initialize the solver.
+
+        Arguments
+        ---------
+        max_moves: the longest mate to look for, in moves of the attacker.
+        max_nodes: the most nodes the tree may hold.
+        """
+        self.max_moves = max_moves
+        self.max_nodes = max_nodes
+        self.nodes = 0
+
+    def evaluate(self, board: chess.Board, node: PNNode, limit: int):
+        """
+        Set the proof and disproof numbers of a new node.
+
+        Arguments
+        ---------
+        board: the board at the node.
+        node: the new node.
+        limit: the last ply at which the attacker may give mate.
+        """
+        if node.is_or:
+            count = board.legal_moves.count()
+            if not count or node.ply >= limit:
+                node.proof, node.disproof = PN_INF, 0
+            else:
+                node.proof, node.disproof = 1, count
+        else:
+            count = board.legal_moves.count()
+            if not count:
+                if board.is_check():
+                    node.proof, node.disproof = 0, PN_INF
+                else:
+                    node.proof, node.disproof = PN_INF, 0
+            elif node.ply >= limit or board.is_insufficient_material():
+                node.proof, node.disproof = PN_INF, 0
+            else:
+                node.proof, node.disproof = count, 1
+
+    def expand(self, board: chess.Board, node: PNNode, limit: int):
+        """
+        Create and evaluate the children of a node.
+
+        Arguments
+        ---------
+        board: the board at the node.
+        node: the node to expand.
+        limit: the last ply at which the attacker may give mate.
+        """
+        node.children = []
+        for move in board.legal_moves:
+            child = PNNode(move, node, not node.is_or, node.ply + 1)
+            board.push(move)
+            self.evaluate(board, child, limit)
+            board.pop()
+            node.children.append(child)
+        self.nodes += len(node.children)
+
+    def update(self, node: PNNode):
+        """Recompute the proof numbers of a node from its children."""
+        proofs = [child.proof for child in node.children]
+        disproofs = [child.disproof for child in node.children]
+        if node.is_or:
+            node.proof = min(proofs)
+            node.disproof = min(sum(disproofs), PN_INF)
+        else:
+            node.proof = min(sum(proofs), PN_INF)
+            node.disproof = min(disproofs)
+
+    def prove(self, board: chess.Board, limit: int, max_nodes=None,
+              deadline=None) -> PNNode:
+        """
+        Run proof-number search with a fixed mate length.
+
+        Arguments
+        ---------
+        board: the position, with the attacker to move.
+        limit: the last ply at which the attacker may give mate.
+        max_nodes: the node count at which to give up, by default
+                   max_nodes.
+        deadline: the time.perf_counter() value at which to give up, or
+                  None.
+
+        Returns
+        -------
+        root: the root of the tree, proven if root.proof is 0.
+        """
+        if max_nodes is None:
+            max_nodes = self.max_nodes
+        root = PNNode(None, None, True, 0)
+        self.evaluate(board, root, limit)
+        while root.proof and root.disproof and self.nodes < max_nodes:
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+            # Walk down to the most-proving node
+            node = root
+            while node.children is not None:
+                if node.is_or:
+                    node = min(node.children, key=lambda c: c.proof)
+                else:
+                    node = min(node.children, key=lambda c: c.disproof)
+                board.push(node.move)
+            self.expand(board, node, limit)
+            # Update the ancestors, taking back the moves on the way up
+            while node is not None:
+                self.update(node)
+                if node.parent is not None:
+                    board.pop()
+                node = node.parent
+        return root
+
+    def distance(self, node: PNNode) -> int:
+        """Return the plies until mate from a proven node, with best play."""
+        if node.children is None:
+            return 0
+        distances = [self.distance(child) for child in node.children
+                     if child.proof == 0]
+        return 1 + (min(distances) if node.is_or else max(distances))
+
+    def solve(self, board: chess.Board, deadline=None, node_limit=None):
+        """
+        Find a forced mate for the side to move.
+
+        Arguments
+        ---------
+        board: the current board state.
+        deadline: the time.perf_counter() value at which to give up, or
+                  None.
+        node_limit: the number of nodes the search may take, if fewer than
+                    max_nodes, or None.
+
+        Returns
+        -------
+        mate: None if no mate was found within max_moves, the node limits
+              and the deadline.
+              Otherwise a tuple of the mating line, as a list of moves with
+              the defender's longest resistance, and the mate distance in
+              moves.
+        """
+        self.nodes = 0
+        max_nodes = self.max_nodes
+        if node_limit is not None:
+            max_nodes = min(max_nodes, node_limit)
+        hyp_board = board.copy(stack=False)
+        for moves in range(1, self.max_moves + 1):
+            root = self.prove(hyp_board, 2 * moves - 1, max_nodes, deadline)
+            if root.proof == 0:
+                line = []
+                node = root
+                while node.children:
+                    proven = [child for child in node.children
+                              if child.proof == 0]
+                    pick = min if node.is_or else max
+                    node = pick(proven, key=self.distance)
+                    line.append(node.move)
+                return (line, (len(line) + 1) // 2)
+            if self.nodes >= max_nodes or (
+                    deadline is not None and time.perf_counter() > deadline):
+                break
+        return None
@@ -0,0 +1,375 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Nov  5 19:37:26 2026
+
+@author: Prior_Bayes
+"""
+
+# Imports
+import itertools
+import os
+import sys
+import tracemalloc
+from collections import namedtuple
+
+# The memory cost of a profiled search. peak is the most memory the search
+# held above what was allocated before it. at_peak and retained map each
+# component to a (bytes, blocks) tuple, at the sampled peak and after the
+# search. caches maps each cache to an (entries, bytes) tuple.
+MemoryReport = namedtuple('MemoryReport', ['nodes', 'peak', 'at_peak',
+                                           'retained', 'caches', 'shrinks'])
+
+
+def deep_size(obj) -> int:
+    """
+    Return the bytes used by an object and the tuples and numbers it holds.
+
+    Arguments
+    ---------
+    obj: a number, or a tuple of numbers and tuples, such as a table entry.
+
+    Returns
+    -------
+    size: the size in bytes. Shared objects are counted every time.
+    """
+    size = sys.getsizeof(obj)
+    if isinstance(obj, tuple):
+        size += sum(deep_size(item) for item in obj)
+    return size
+
+
+def sampled_size(container, items, count=None, sample=16) -> int:
+    """
+    Estimate the bytes used by a container from a sample of its entries.
+
+    Arguments
+    ---------
+    container: a list or dictionary.
+    items: an iterable of its entries.
+    count: the number of entries, by default the length of the container.
+    sample: how many entries to measure with deep_size.
+
+    Returns
+    -------
+    size: the size of the container plus the estimated size of its entries.
+    """
+    measured = [deep_size(item) for item in itertools.islice(items, sample)]
+    if not measured:
+        return sys.getsizeof(container)
+    if count is None:
+        count = len(container)
+    return sys.getsizeof(container) + sum(measured) * count // len(measured)
+
+
+class MemoryProfiler:
+    """
+    MemoryProfiler measures and caps the memory an engine uses.
+
+    Profiling is opt-in, since it slows the search down. profile runs a
+    search under tracemalloc and attributes every allocation to the engine
+    component whose code made it, following the call stack out of helper
+    functions and python-chess. While profiling, the profiler follows the
+    search's push/pop and samples the traced memory, keeping a breakdown
+    of the highest sample, so the report shows which components hold the
+    memory at the peak as well as what they keep afterwards.
+
+    The cap does not need tracemalloc. Every few thousand moves, the sizes
+    of the caches the engine owns in this process are estimated, and while
+    they exceed the cap, each cache is halved. The transposition table is
+    shared memory of a fixed size and the analysis cache lives on disk, so
+    they are reported but neither counted nor shrunk.
+
+    Methods
+    -------
+        components: returns the engine's components by name.
+        cache_sizes: estimates the entries and bytes of each cache.
+        shrink: halves the caches the profiler can shrink.
+        enforce_cap: shrinks the caches until they fit the cap.
+        shrinkable_bytes: estimates the bytes the cap applies to.
+        push: samples memory and checks the cap during a search.
+        pop: does nothing, as samples are not undone.
+        suspend, resume: do nothing, as nothing is tracked per search.
+        profile: searches a position under tracemalloc.
+        breakdown: groups the memory of a snapshot by component.
+        report: formats a MemoryReport as a table.
+    """
+
+    def __init__(self, engine, cap=None, interval=4096, frames=8):
+        """
+        Attach the profiler to an engine.
+
+        Arguments
+        ---------
+        engine: the ChessEngine to measure.
+        cap: the most bytes the engine's shrinkable caches may hold, or None.
+        interval: how many moves the search makes between samples.
+        frames: how many frames of each allocation's call stack are kept
+                while profiling. Each frame slows the search down further,
+                and allocations whose kept frames are all outside the
+                engine's components are grouped as other.
+        """
+        self.engine = engine
+        self.cap = cap
+        self.interval = interval
+        self.frames = frames
+        self.shrinks = 0
+        self.moves = 0
+        self.sampling = False
+        self.high = 0
+        self.peak_snapshot = None
+        self.files = {}
+        engine.searchEng.add_tracker(self)
+
+    def components(self) -> dict:
+        """
+        Return the engine's components by name.
+
+        Returns
+        -------
+        components: a dictionary of component names and objects, without
+                    the components which are not set.
+        """
+        engine = self.engine
+        search = engine.searchEng
+        components = {'engine': engine, 'search': search,
+                      'orderer': search.orderer, 'pruner': search.pruner,
+                      'terminal': search.terminal,
+                      'evaluation': engine.evalEng,
+                      'mate solver': engine.mateSolver,
+                      'transposition table': search.table,
+                      'analysis cache': engine.cache}
+        return {name: component for name, component in components.items()
+                if component is not None}
+
+    def component_files(self) -> dict:
+        """Return the component name of each source file of the engine."""
+        files = {}
+        for name, component in self.components().items():
+            for cls in type(component).__mro__[:-1]:
+                module = sys.modules.get(cls.__module__)
+                path = getattr(module, '__file__', None)
+                if path is not None:
+                    files.setdefault(os.path.abspath(path), name)
+        return files
+
+    def cache_sizes(self) -> dict:
+        """
+        Estimate the entries and bytes of each cache the engine owns.
+
+        Returns
+        -------
+        caches: a dictionary of (entries, bytes) tuples by cache name. The
+                analysis cache gives the size of its database file.
+        """
+        search = self.engine.searchEng
+        caches = {}
+        hash_moves = search.hash_moves
+        caches['hash moves'] = (len(hash_moves),
+                                sampled_size(hash_moves, hash_moves.items()))
+        caches['killers'] = (len(search.killers), sys.getsizeof(
+            search.killers) + sum(sys.getsizeof(killers)
+                                  for killers in search.killers))
+        pawn_table = getattr(self.engine.evalEng, 'pawn_table', None)
+        if pawn_table is not None:
+            filled = (slot for slot in pawn_table.slots if slot is not None)
+            caches['pawn table'] = (len(pawn_table),
+                                    sampled_size(pawn_table.slots, filled,
+                                                 len(pawn_table)))
+        terminal = search.terminal
+        caches['terminal'] = (len(terminal.hashes),
+                              sampled_size(terminal.hashes, terminal.hashes)
+                              + sampled_size(terminal.counts,
+                                             terminal.counts.items()))
+        if search.table is not None:
+            caches['transposition table'] = (len(search.table),
+                                             search.table.nbytes)
+        cache = self.engine.cache
+        if cache is not None:
+            on_disk = (os.path.getsize(cache.path)
+                       if os.path.exists(cache.path) else 0)
+            caches['analysis cache'] = (len(cache), on_disk)
+        return caches
+
+    def shrinkable_bytes(self) -> int:
+        """Return the estimated bytes of the caches the cap applies to."""
+        caches = self.cache_sizes()
+        return sum(caches[name][1] for name in ['hash moves', 'pawn table']
+                   if name in caches)
+
+    def shrink(self) -> bool:
+        """
+        Halve the caches the profiler can shrink.
+
+        The engine keeps at most half as many hash moves from now on, and
+        the newest of those it has are kept. The pawn table is resized to
+        half as many slots, down to the two it needs at least.
+
+        Returns
+        -------
+        shrunk: False if the caches were already as small as they can be.
+        """
+        search = self.engine.searchEng
+        shrunk = False
+        if search.max_hash_moves > 1:
+            search.max_hash_moves //= 2
+            shrunk = True
+        hash_moves = search.hash_moves
+        if len(hash_moves) > search.max_hash_moves:
+            newest = list(hash_moves.items())[-search.max_hash_moves:]
+            hash_moves.clear()
+            hash_moves.update(newest)
+            shrunk = True
+        pawn_table = getattr(self.engine.evalEng, 'pawn_table', None)
+        if pawn_table is not None and pawn_table.size > 2:
+            pawn_table.resize(pawn_table.size // 2)
+            shrunk = True
+        if shrunk:
+            self.shrinks += 1
+        return shrunk
+
+    def enforce_cap(self) -> bool:
+        """
+        Shrink the caches until they fit the cap.
+
+        Returns
+        -------
+        fits: True if the caches fit the cap, or there is none. False if the
+              cap is smaller than the caches can be made, in which case they
+              are left as small as they can be.
+        """
+        if self.cap is None:
+            return True
+        while self.shrinkable_bytes() > self.cap:
+            if not self.shrink():
+                return False
+        return True
+
+    def push(self, board, move):
+        """
+        Count a move of the search, sampling memory every interval moves.
+
+        Arguments
+        ---------
+        board: the board state before the move.
+        move: the move about to be made.
+        """
+        self.moves += 1
+        if self.moves % self.interval:
+            return
+        self.enforce_cap()
+        if self.sampling:
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self.high:
+                self.high = current
+                self.peak_snapshot = tracemalloc.take_snapshot()
+
+    def pop(self):
+        """Do nothing, as samples are not undone."""
+
+    def suspend(self):
+        """Return None, as nothing is tracked per search."""
+        return None
+
+    def resume(self, state):
+        """Do nothing, as nothing is tracked per search."""
+
+    def profile(self, board, depth, time_limit=None) -> MemoryReport:
+        """
+        Search a position under tracemalloc.
+
+        Arguments
+        ---------
+        board: the position to search.
+        depth: how many ply deep the search goes.
+        time_limit: the number of seconds the search may take, or None.
+
+        Returns
+        -------
+        report: a MemoryReport of the search.
+        """
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start(self.frames)
+        self.files = self.component_files()
+        before = tracemalloc.take_snapshot()
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        self.high = 0
+        self.peak_snapshot = None
+        self.sampling = True
+        try:
+            self.engine.find_best_move(board, depth, time_limit)
+        finally:
+            self.sampling = False
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            if not tracing:
+                tracemalloc.stop()
+        at_peak = ({} if self.peak_snapshot is None
+                   else self.breakdown(self.peak_snapshot, before))
+        self.peak_snapshot = None
+        return MemoryReport(self.engine.searchEng.nodes, peak - start,
+                            at_peak, self.breakdown(after, before),
+                            self.cache_sizes(), self.shrinks)
+
+    def breakdown(self, snapshot, before) -> dict:
+        """
+        Group the memory allocated since an earlier snapshot by component.
+
+        Each allocation belongs to the innermost frame of its call stack in
+        a component's source file. Allocations made outside any component
+        are grouped as other.
+
+        Arguments
+        ---------
+        snapshot: the tracemalloc snapshot to break down.
+        before: the snapshot taken before the search.
+
+        Returns
+        -------
+        usage: a dictionary of (bytes, blocks) tuples by component.
+        """
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        snapshot = snapshot.filter_traces(ignore)
+        before = before.filter_traces(ignore)
+        usage = {}
+        for stat in snapshot.compare_to(before, 'traceback'):
+            name = 'other'
+            for frame in reversed(stat.traceback):
+                name = self.files.get(os.path.abspath(frame.filename))
+                if name is not None:
+                    break
+            name = name or 'other'
+            size, blocks = usage.get(name, (0, 0))
+            usage[name] = (size + stat.size_diff, blocks + stat.count_diff)
+        return usage
+
+    @staticmethod
+    def report(report: MemoryReport) -> str:
+        """
+        Format a MemoryReport as a table.
+
+        Arguments
+        ---------
+        report: the MemoryReport of a profiled search.
+
+        Returns
+        -------
+        table: the report, with bytes and blocks per node by component.
+        """
+        nodes = max(report.nodes, 1)
+        lines = [f'nodes {report.nodes}, peak {report.peak} bytes '
+                 f'({report.peak / nodes:.0f} per node), '
+                 f'shrinks {report.shrinks}',
+                 f"{'component':<22}{'peak bytes':>12}{'per node':>10}"
+                 f"{'kept bytes':>12}{'blocks/node':>13}"]
+        for name in sorted(set(report.at_peak) | set(report.retained)):
+            peak_bytes, _ = report.at_peak.get(name, (0, 0))
+            kept_bytes, kept_blocks = report.retained.get(name, (0, 0))
+            lines.append(f'{name:<22}{peak_bytes:>12}'
+                         f'{peak_bytes / nodes:>10.1f}{kept_bytes:>12}'
+                         f'{kept_blocks / nodes:>13.2f}')
+        lines.append(f"{'cache':<22}{'entries':>12}{'bytes':>12}")
+        for name, (entries, size) in report.caches.items():
+            lines.append(f'{name:<22}{entries:>12}{size:>12}')
+        return '\n'.join(lines)
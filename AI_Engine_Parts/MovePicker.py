@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 21 18:40:27 2026
+
+@author: Prior_Bayes
+"""
+import chess
+from .AI_Engine_Functions import (is_losing_capture, encode_move,
+                                  decode_move)
+from .Orderer import Orderer
+
+
+class MovePicker(Orderer):
+    """
+    MovePicker yields moves in stages, generating each stage on demand.
+
+    The stages are the hash move, captures ordered by most valuable victim
+    and least valuable attacker, killer moves and then the quiet moves. With
+    use_see, captures which lose material by static exchange evaluation are
+    held back until after the quiet moves. The search consumes the moves
+    lazily, so after a beta cutoff the later stages are never generated.
+    Each stage generates a disjoint set of legal moves, so the moves of a
+    node are generated at most once.
+
+    Methods
+    -------
+    capture_score: Scores a capture for ordering.
+    pick_moves: Yields the moves in stages.
+    order_search: Returns all moves in stage order.
+    """
+
+    uses_hints = True
+    settings = ('use_see',)
+
+    def __init__(self, use_see=False):
+        """
+        Initialize the count of generated stages.
+
+        Arguments
+        ---------
+        use_see: if True, captures losing material are searched last. This
+                 pays off with a quiescence search. Without one, losing
+                 captures next to the horizon look like they win and often
+                 cause the cutoffs.
+        """
+        self.use_see = use_see
+        self.generated = {'captures': 0, 'quiets': 0}
+
+    def capture_score(self, board: chess.Board, move: chess.Move) -> int:
+        """
+        Score a capture by most valuable victim, least valuable attacker.
+
+        Arguments
+        ---------
+        board: the current board state.
+        move: a capturing move.
+
+        Returns
+        -------
+        score: a larger number for captures to be searched first.
+        """
+        victim = board.piece_type_at(move.to_square) or chess.PAWN
+        attacker = board.piece_type_at(move.from_square)
+        return victim * 8 - attacker
+
+    def pick_moves(self, board: chess.Board, hash_move=0, killers=()):
+        """
+        Yield the legal moves in stages.
+
+        Captures are sorted by packing each score above the capture's index
+        into one integer, so the sort compares plain integers.
+
+        Arguments
+        ---------
+        board: the current board state.
+        hash_move: the best move found for this position earlier, packed by
+                   encode_move, or 0.
+        killers: packed quiet moves which caused cutoffs at the same ply.
+
+        Returns
+        -------
+        moves: a generator of moves in search order.
+        """
+        if hash_move:
+            move = decode_move(hash_move)
+            if board.is_legal(move):
+                yield move
+            else:
+                hash_move = 0
+
+        self.generated['captures'] += 1
+        captures = list(board.generate_legal_captures())
+        order = [self.capture_score(board, move) << 8 | 255 - index
+                 for index, move in enumerate(captures)]
+        order.sort(reverse=True)
+        losing = []
+        for packed in order:
+            move = captures[255 - (packed & 255)]
+            if encode_move(move) == hash_move:
+                continue
+            if self.use_see and is_losing_capture(board, move):
+                losing.append(move)
+            else:
+                yield move
+
+        searched = [hash_move]
+        for code in killers:
+            if code and code not in searched:
+                move = decode_move(code)
+                if not board.is_capture(move) and board.is_legal(move):
+                    searched.append(code)
+                    yield move
+
+        # Moves to empty squares, less en passant, are the quiet moves. Only
+        # moves to the target squares of searched moves or the en passant
+        # square need a closer look.
+        self.generated['quiets'] += 1
+        suspects = 0
+        for code in searched:
+            suspects |= chess.BB_SQUARES[code >> 6 & 63] if code else 0
+        if board.ep_square is not None:
+            suspects |= chess.BB_SQUARES[board.ep_square]
+        for move in board.generate_legal_moves(
+                chess.BB_ALL, ~board.occupied_co[not board.turn]):
+            if not (suspects & chess.BB_SQUARES[move.to_square]
+                    and (encode_move(move) in searched
+                         or board.is_en_passant(move))):
+                yield move
+
+        yield from losing
+
+    def order_search(self, board: chess.Board) -> list[chess.Move]:
+        """
+        Order moves by stage, without hints.
+
+        Arguments
+        ---------
+        board: the current board state.
+
+        Returns
+        -------
+        search_order: a list ordered by the search order.
+        """
+        return list(self.pick_moves(board))
@@ -7,6 +7,29 @@ Created on Sun Jul 27 16:38:12 2025
 import chess
 
 class Orderer:
+    """
+    Orders the moves to be searched.
+
+    The search engine asks the orderer for moves through pick_moves, which
+    it consumes lazily. Orderers which set uses_hints to True are also given
+    the hash move and killer moves of the node, packed by encode_move.
+    Orderers which set scores_leaves to True score the children while
+    ordering, and the search asks leaf_score for the scores of horizon
+    nodes before evaluating them.
+
+    Methods
+    -------
+    legal_moves_list: Returns the legal moves as a list.
+    order_search: Returns the moves in search order.
+    pick_moves: Yields the moves in search order.
+    leaf_score: Returns the score of a child worked out while ordering.
+    """
+
+    uses_hints = False
+    scores_leaves = False
+    # Attributes which change the moves searched, for engine_fingerprint
+    settings = ()
+
     def legal_moves_list(self, board: chess.Board):
         """
         Legal_moves_list takes the moves generator and returns a list of moves.
@@ -34,3 +57,39 @@ class Orderer:
         search_order: a list ordered by the search order.
         """
         return self.legal_moves_list(board)
+
+    def pick_moves(self, board: chess.Board, hash_move=0, killers=()):
+        """
+        Yield the moves to be searched in order.
+
+        By default, the hints are ignored and the moves of order_search are
+        yielded.
+
+        Arguments
+        ---------
+        board: the current board state.
+        hash_move: the best move found for this position earlier, packed by
+                   encode_move, or 0.
+        killers: packed quiet moves which caused cutoffs at the same ply.
+
+        Returns
+        -------
+        moves: a generator of moves in search order.
+        """
+        yield from self.order_search(board)
+
+    def leaf_score(self, board: chess.Board):
+        """
+        Return the score of a child worked out while ordering.
+
+        By default, children are not scored.
+
+        Arguments
+        ---------
+        board: the current board state.
+
+        Returns
+        -------
+        score: the score of the position, or None if it is not known.
+        """
+        return None
@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 20:12:41 2026
+
+@author: Prior_Bayes
+"""
+
+import chess
+from .EvalEng import EvalEng
+from .HeuristicEval import inf, neg_inf
+
+# Middlegame and endgame piece values in centipawns, indexed by piece type
+MG_VALUES = [0, 82, 337, 365, 477, 1025, 0]
+EG_VALUES = [0, 94, 281, 297, 512, 936, 0]
+
+# Contribution of each piece type to the game phase (24 = full middlegame)
+PHASE_WEIGHTS = [0, 0, 1, 1, 2, 4, 0]
+MAX_PHASE = 24
+
+# Piece-square tables from white's point of view, written rank 8 first so
+# they read like a board diagram. Values are in centipawns.
+MG_PAWN = [
+      0,   0,   0,   0,   0,   0,   0,   0,
+     98, 134,  61,  95,  68, 126,  34, -11,
+     -6,   7,  26,  31,  65,  56,  25, -20,
+    -14,  13,   6,  21,  23,  12,  17, -23,
+    -27,  -2,  -5,  12,  17,   6,  10, -25,
+    -26,  -4,  -4, -10,   3,   3,  33, -12,
+    -35,  -1, -20, -23, -15,  24,  38, -22,
+      0,   0,   0,   0,   0,   0,   0,   0]
+EG_PAWN = [
+      0,   0,   0,   0,   0,   0,   0,   0,
+    178, 173, 158, 134, 147, 132, 165, 187,
+     94, 100,  85,  67,  56,  53,  82,  84,
+     32,  24,  13,   5,  -2,   4,  17,  17,
+     13,   9,  -3,  -7,  -7,  -8,   3,  -1,
+      4,   7,  -6,   1,   0,  -5,  -1,  -8,
+     13,   8,   8,  10,  13,   0,   2,  -7,
+      0,   0,   0,   0,   0,   0,   0,   0]
+MG_KNIGHT = [
+    -167, -89, -34, -49,  61, -97, -15, -107,
+     -73, -41,  72,  36,  23,  62,   7,  -17,
+     -47,  60,  37,  65,  84, 129,  73,   44,
+      -9,  17,  19,  53,  37,  69,  18,   22,
+     -13,   4,  16,  13,  28,  19,  21,   -8,
+     -23,  -9,  12,  10,  19,  17,  25,  -16,
+     -29, -53, -12,  -3,  -1,  18, -14,  -19,
+    -105, -21, -58, -33, -17, -28, -19,  -23]
+EG_KNIGHT = [
+    -58, -38, -13, -28, -31, -27, -63, -99,
+    -25,  -8, -25,  -2,  -9, -25, -24, -52,
+    -24, -20,  10,   9,  -1,  -9, -19, -41,
+    -17,   3,  22,  22,  22,  11,   8, -18,
+    -18,  -6,  16,  25,  16,  17,   4, -18,
+    -23,  -3,  -1,  15,  10,  -3, -20, -22,
+    -42, -20, -10,  -5,  -2, -20, -23, -44,
+    -29, -51, -23, -15, -22, -18, -50, -64]
+MG_BISHOP = [
+    -29,   4, -82, -37, -25, -42,   7,  -8,
+    -26,  16, -18, -13,  30,  59,  18, -47,
+    -16,  37,  43,  40,  35,  50,  37,  -2,
+     -4,   5,  19,  50,  37,  37,   7,  -2,
+     -6,  13,  13,  26,  34,  12,  10,   4,
+      0,  15,  15,  15,  14,  27,  18,  10,
+      4,  15,  16,   0,   7,  21,  33,   1,
+    -33,  -3, -14, -21, -13, -12, -39, -21]
+EG_BISHOP = [
+    -14, -21, -11,  -8,  -7,  -9, -17, -24,
+     -8,  -4,   7, -12,  -3, -13,  -4, -14,
+      2,  -8,   0,  -1,  -2,   6,   0,   4,
+     -3,   9,  12,   9,  14,  10,   3,   2,
+     -6,   3,  13,  19,   7,  10,  -3,  -9,
+    -12,  -3,   8,  10,  13,   3,  -7, -15,
+    -14, -18,  -7,  -1,   4,  -9, -15, -27,
+    -23,  -9, -23,  -5,  -9, -16,  -5, -17]
+MG_ROOK = [
+     32,  42,  32,  51,  63,   9,  31,  43,
+     27,  32,  58,  62,  80,  67,  26,  44,
+     -5,  19,  26,  36,  17,  45,  61,  16,
+    -24, -11,   7,  26,  24,  35,  -8, -20,
+    -36, -26, -12,  -1,   9,  -7,   6, -23,
+    -45, -25, -16, -17,   3,   0,  -5, -33,
+    -44, -16, -20,  -9,  -1,  11,  -6, -71,
+    -19, -13,   1,  17,  16,   7, -37, -26]
+EG_ROOK = [
+     13,  10,  18,  15,  12,  12,   8,   5,
+     11,  13,  13,  11,  -3,   3,   8,   3,
+      7,   7,   7,   5,   4,  -3,  -5,  -3,
+      4,   3,  13,   1,   2,   1,  -1,   2,
+      3,   5,   8,   4,  -5,  -6,  -8, -11,
+     -4,   0,  -5,  -1,  -7, -12,  -8, -16,
+     -6,  -6,   0,   2,  -9,  -9, -11,  -3,
+     -9,   2,   3,  -1,  -5, -13,   4, -20]
+MG_QUEEN = [
+    -28,   0,  29,  12,  59,  44,  43,  45,
+    -24, -39,  -5,   1, -16,  57,  28,  54,
+    -13, -17,   7,   8,  29,  56,  47,  57,
+    -27, -27, -16, -16,  -1,  17,  -2,   1,
+     -9, -26,  -9, -10,  -2,  -4,   3,  -3,
+    -14,   2, -11,  -2,  -5,   2,  14,   5,
+    -35,  -8,  11,   2,   8,  15,  -3,   1,
+     -1, -18,  -9,  10, -15, -25, -31, -50]
+EG_QUEEN = [
+     -9,  22,  22,  27,  27,  19,  10,  20,
+    -17,  20,  32,  41,  58,  25,  30,   0,
+    -20,   6,   9,  49,  47,  35,  19,   9,
+      3,  22,  24,  45,  57,  40,  57,  36,
+    -18,  28,  19,  47,  31,  34,  39,  23,
+    -16, -27,  15,   6,   9,  17,  10,   5,
+    -22, -23, -30, -16, -16, -23, -36, -32,
+    -33, -28, -22, -43,  -5, -32, -20, -41]
+MG_KING = [
+    -65,  23,  16, -15, -56, -34,   2,  13,
+     29,  -1, -20,  -7,  -8,  -4, -38, -29,
+     -9,  24,   2, -16, -20,   6,  22, -22,
+    -17, -20, -12, -27, -30, -25, -14, -36,
+    -49,  -1, -27, -39, -46, -44, -33, -51,
+    -14, -14, -22, -46, -44, -30, -15, -27,
+      1,   7,  -8, -64, -43, -16,   9,   8,
+    -15,  36,  12, -54,   8, -28,  24,  14]
+EG_KING = [
+    -74, -35, -18, -18, -11,  15,   4, -17,
+    -12,  17,  14,  17,  17,  38,  23,  11,
+     10,  17,  23,  15,  20,  45,  44,  13,
+     -8,  22,  24,  27,  26,  33,  26,   3,
+    -18,  -4,  21,  24,  27,  23,   9, -11,
+    -19,  -3,  11,  21,  23,  16,   7,  -9,
+    -27, -11,   4,  13,  14,   4,  -5, -17,
+    -53, -34, -21, -11, -28, -14, -24, -43]
+
+
+def piece_index(piece_type, color):
+    """
+    Return the row of a piece in the flat piece-square tables.
+
+    White pieces occupy rows 0-5 and black pieces rows 6-11, in piece type
+    order (pawn, knight, bishop, rook, queen, king).
+    """
+    return piece_type - 1 + (0 if color else 6)
+
+
+def build_tables(values, tables):
+    """
+    Build one flat piece-square table indexed by piece_index * 64 + square.
+
+    The material value is folded into every entry and black entries are
+    negated, so summing the entries of every piece on the board gives the
+    score from white's point of view.
+
+    Arguments
+    ---------
+    values: the material value of each piece type.
+    tables: the per piece type tables, written rank 8 first.
+
+    Returns
+    -------
+    flat: a list with 12 * 64 entries.
+    """
+    flat = [0] * (12 * 64)
+    for piece_type, table in zip(chess.PIECE_TYPES, tables):
+        for square in chess.SQUARES:
+            # Tables are drawn rank 8 first, so white needs flipping
+            white_row = piece_index(piece_type, chess.WHITE) * 64
+            black_row = piece_index(piece_type, chess.BLACK) * 64
+            flat[white_row + square] = (values[piece_type]
+                                        + table[square ^ 56])
+            flat[black_row + square] = -(values[piece_type]
+                                         + table[square])
+    return flat
+
+
+PST_MG = build_tables(MG_VALUES, [MG_PAWN, MG_KNIGHT, MG_BISHOP,
+                                  MG_ROOK, MG_QUEEN, MG_KING])
+PST_EG = build_tables(EG_VALUES, [EG_PAWN, EG_KNIGHT, EG_BISHOP,
+                                  EG_ROOK, EG_QUEEN, EG_KING])
+
+
+class PSTEval(EvalEng):
+    """
+    PSTEval scores a position with tapered piece-square tables.
+
+    Every piece gets a middlegame and an endgame value depending on the square
+    it stands on. The two totals are blended by the game phase, which is
+    worked out from the remaining non-pawn material. The tables are
+    precomputed into flat lists, so a full scan is one lookup per piece.
+
+    When attached to a search engine, PSTEval keeps a stack of running totals
+    in step with push/pop, so scoring a leaf does not rescan the board.
+
+    Methods
+    -------
+        full_scan: computes the running totals from scratch.
+        move_delta: computes the running totals after a move.
+        reset: starts tracking a board.
+        push: updates the running totals for a move about to be made.
+        pop: restores the running totals of the previous position.
+        suspend: returns the tracked board and running totals.
+        resume: restores the state returned by suspend.
+        score_pos: scores the position.
+    """
+
+    incremental = True
+
+    def __init__(self):
+        """Initialize the evaluator with an empty running total stack."""
+        self.stack = []
+        self.board = None
+        self.root_ply = 0
+
+    def full_scan(self, board: chess.Board) -> tuple:
+        """
+        Compute the running totals of a position from scratch.
+
+        Arguments
+        ---------
+        board: the current board state.
+
+        Returns
+        -------
+        totals: a tuple of (middlegame score, endgame score, phase).
+        """
+        mg = 0
+        eg = 0
+        phase = 0
+        for color in chess.COLORS:
+            for piece_type in chess.PIECE_TYPES:
+                row = piece_index(piece_type, color) * 64
+                for square in chess.scan_forward(
+                        board.pieces_mask(piece_type, color)):
+                    mg += PST_MG[row + square]
+                    eg += PST_EG[row + square]
+                    phase += PHASE_WEIGHTS[piece_type]
+        return (mg, eg, phase)
+
+    def move_delta(self, board: chess.Board, move: chess.Move,
+                   totals: tuple) -> tuple:
+        """
+        Compute the running totals after a move without making it.
+
+        Arguments
+        ---------
+        board: the board state before the move.
+        move: the move about to be made.
+        totals: the running totals of the current position.
+
+        Returns
+        -------
+        totals: the running totals after the move.
+        """
+        mg, eg, phase = totals
+        from_sq = move.from_square
+        to_sq = move.to_square
+        color = board.turn
+        piece_type = board.piece_type_at(from_sq)
+        if piece_type is None:
+            # A null move leaves the material where it is
+            return totals
+        row = piece_index(piece_type, color) * 64
+        mg -= PST_MG[row + from_sq]
+        eg -= PST_EG[row + from_sq]
+
+        if piece_type == chess.KING and board.is_castling(move):
+            rook_row = piece_index(chess.ROOK, color) * 64
+            rank = chess.square_rank(from_sq)
+            kingside = board.is_kingside_castling(move)
+            rook_from = board.castling_rights & chess.BB_RANKS[rank]
+            rook_from = chess.msb(rook_from) if kingside else chess.lsb(
+                rook_from)
+            rook_from = (to_sq if board.piece_type_at(to_sq) == chess.ROOK
+                         else rook_from)
+            rook_to = chess.square(5 if kingside else 3, rank)
+            to_sq = chess.square(6 if kingside else 2, rank)
+            mg += PST_MG[rook_row + rook_to] - PST_MG[rook_row + rook_from]
+            eg += PST_EG[rook_row + rook_to] - PST_EG[rook_row + rook_from]
+        else:
+            captured_sq = to_sq
+            if piece_type == chess.PAWN and board.is_en_passant(move):
+                captured_sq = to_sq - 8 if color else to_sq + 8
+            captured = board.piece_type_at(captured_sq)
+            if captured:
+                cap_row = piece_index(captured, not color) * 64
+                mg -= PST_MG[cap_row + captured_sq]
+                eg -= PST_EG[cap_row + captured_sq]
+                phase -= PHASE_WEIGHTS[captured]
+            if move.promotion:
+                phase += PHASE_WEIGHTS[move.promotion]
+                row = piece_index(move.promotion, color) * 64
+
+        mg += PST_MG[row + to_sq]
+        eg += PST_EG[row + to_sq]
+        return (mg, eg, phase)
+
+    def reset(self, board: chess.Board):
+        """
+        Start tracking a board, usually the root of a search.
+
+        Arguments
+        ---------
+        board: the board that will be pushed and popped during the search.
+        """
+        self.board = board
+        self.root_ply = len(board.move_stack)
+        self.stack = [self.full_scan(board)]
+
+    def push(self, board: chess.Board, move: chess.Move):
+        """
+        Update the running totals for a move that is about to be made.
+
+        Arguments
+        ---------
+        board: the board state before the move.
+        move: the move about to be made.
+        """
+        self.stack.append(self.move_delta(board, move, self.stack[-1]))
+
+    def pop(self):
+        """Restore the running totals of the previous position."""
+        self.stack.pop()
+
+    def suspend(self) -> tuple:
+        """Return the tracked board and running totals, for resume."""
+        return (self.board, self.root_ply, self.stack)
+
+    def resume(self, state: tuple):
+        """Restore the tracked board and running totals from suspend."""
+        self.board, self.root_ply, self.stack = state
+
+    def blend(self, totals: tuple) -> float:
+        """
+        Blend middlegame and endgame totals by the game phase.
+
+        Arguments
+        ---------
+        totals: a tuple of (middlegame score, endgame score, phase).
+
+        Returns
+        -------
+        score: the tapered score in pawns.
+        """
+        mg, eg, phase = totals
+        phase = min(phase, MAX_PHASE)
+        return (mg * phase + eg * (MAX_PHASE - phase)) / (MAX_PHASE * 100)
+
+    def score_pos(self, board: chess.Board) -> float:
+        """
+        Score a position using the tapered piece-square tables.
+
+        If the board is the one being tracked and the stack is in step with it,
+        the running totals are used. Otherwise the board is scanned.
+
+        Arguments
+        ---------
+        board: the current board state.
+
+        Returns
+        -------
+        score: a numerical score of the position, where 0 means it is equal, a
+               negative means it favors black, and a positive means it favors
+               white.
+        """
+        if board.is_checkmate():
+            return neg_inf if board.turn else inf
+        return self.score_window(board, neg_inf, inf)
+
+    def score_window(self, board: chess.Board, alpha, beta) -> float:
+        """
+        Score a position for the search.
+
+        The window is ignored, since the running totals are already cheap.
+        Checkmate is left to the search, as in HeuristicEval.score_window.
+        """
+        if (board is self.board
+                and len(board.move_stack) - self.root_ply
+                == len(self.stack) - 1):
+            return self.blend(self.stack[-1])
+        return self.blend(self.full_scan(board))
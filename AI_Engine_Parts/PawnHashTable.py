@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 20 19:02:33 2026
+
+@author: Prior_Bayes
+"""
+
+
+class PawnHashTable:
+    """
+    A fixed-size hash table for pawn-structure scores.
+
+    Pawn structure depends only on where the pawns stand, and pawns rarely
+    move between sibling nodes of the search. The table is keyed by the white
+    and black pawn bitboards, so the structure is scored once per pawn
+    configuration rather than once per leaf. When two configurations share a
+    slot, the newer one replaces the older.
+
+    Methods
+    -------
+        probe: looks up the entry for a pawn configuration.
+        store: saves the entry for a pawn configuration.
+        clear: empties the table.
+        resize: changes the number of slots, keeping what fits.
+    """
+
+    def __init__(self, size=2**14):
+        """
+        Initialize an empty table.
+
+        Arguments
+        ---------
+        size: the number of slots, rounded up to a power of two.
+        """
+        self.size = 1 << max(size - 1, 1).bit_length()
+        self.mask = self.size - 1
+        self.slots = [None] * self.size
+        self.filled = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        """Return the number of filled slots."""
+        return self.filled
+
+    def probe(self, white_pawns: int, black_pawns: int):
+        """
+        Look up the entry for a pawn configuration.
+
+        Arguments
+        ---------
+        white_pawns: the bitboard of white pawns.
+        black_pawns: the bitboard of black pawns.
+
+        Returns
+        -------
+        entry: the stored entry, or None if it is not in the table.
+        """
+        slot = self.slots[hash((white_pawns, black_pawns)) & self.mask]
+        if (slot is not None and slot[0] == white_pawns
+                and slot[1] == black_pawns):
+            self.hits += 1
+            return slot[2]
+        self.misses += 1
+        return None
+
+    def store(self, white_pawns: int, black_pawns: int, entry):
+        """
+        Save the entry for a pawn configuration.
+
+        Arguments
+        ---------
+        white_pawns: the bitboard of white pawns.
+        black_pawns: the bitboard of black pawns.
+        entry: the value to store.
+        """
+        index = hash((white_pawns, black_pawns)) & self.mask
+        if self.slots[index] is None:
+            self.filled += 1
+        self.slots[index] = (white_pawns, black_pawns, entry)
+
+    def clear(self):
+        """Empty the table and reset the hit counters."""
+        self.slots = [None] * self.size
+        self.filled = 0
+        self.hits = 0
+        self.misses = 0
+
+    def resize(self, size: int):
+        """
+        Change the number of slots, keeping the entries which still fit.
+
+        Entries are moved to their slots in the new table. When two share a
+        slot, the one from the later slot of the old table is kept.
+
+        Arguments
+        ---------
+        size: the new number of slots, rounded up to a power of two.
+        """
+        slots = self.slots
+        self.size = 1 << max(size - 1, 1).bit_length()
+        self.mask = self.size - 1
+        self.slots = [None] * self.size
+        self.filled = 0
+        for slot in slots:
+            if slot is not None:
+                self.store(*slot)
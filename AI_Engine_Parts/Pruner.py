@@ -13,8 +13,14 @@ class Pruner:
     Methods
     -------
     should_prune: Determine whether a tree should be pruned.
+    futility_margin: Returns the futility margin for a depth.
+    can_skip: Determine whether a move may be skipped at a futile node.
+    delta_prune: Determine whether a quiescence capture should be skipped.
     """
 
+    # Attributes which change what is pruned, for engine_fingerprint
+    settings = ()
+
     def should_prune(self, alpha, beta):
         """
         Determine whether a tree should be pruned.
@@ -23,3 +29,28 @@ class Pruner:
         determine pruning logic.
         """
         return False
+
+    def futility_margin(self, depth):
+        """
+        Return how much a quiet move may raise the score at a depth.
+
+        By default, it is None, so no node is futile. Other implementations
+        return a margin for nodes near the horizon.
+        """
+        return None
+
+    def can_skip(self, board, move):
+        """
+        Determine whether a move may be skipped at a futile node.
+
+        By default, it is set to False.
+        """
+        return False
+
+    def delta_prune(self, board, move, score, alpha, beta):
+        """
+        Determine whether a capture in the quiescence search should be skipped.
+
+        By default, it is set to False.
+        """
+        return False
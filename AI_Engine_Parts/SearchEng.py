@@ -6,8 +6,23 @@ Created on Sun Jul 27 16:42:38 2025
 """
 
 # Imports
+import time
+from array import array
+import chess
 import numpy as np
-from .Orderer import Orderer
+from .AI_Engine_Functions import (position_key, position_hash,
+                                  is_losing_capture, has_free_move,
+                                  SEE_VALUES, encode_move, decode_move)
+from .HeuristicEval import inf, neg_inf
+from .SharedHashTable import EXACT, LOWER, UPPER, MATE_BOUND
+from .TerminalDetector import TerminalDetector
+
+# Killer moves are kept for this many plies, reused round-robin by game ply
+MAX_PLY = 256
+
+
+class SearchTimeout(Exception):
+    """Raised inside a search once its deadline or node limit has passed."""
 
 
 class SearchEng:
@@ -18,7 +33,11 @@ class SearchEng:
     different components at initialization time.
     """
 
-    def __init__(self, pruner, orderer):
+    # Attributes which change the search results, for engine_fingerprint
+    settings = ('quiescence_depth', 'see_pruning')
+
+    def __init__(self, pruner, orderer, table=None, terminal=None,
+                 quiescence_depth=0, see_pruning=True):
         """
         Initialize the search engine with a pruner and orderer.
 
@@ -26,9 +45,288 @@ class SearchEng:
         ---------
         pruner : The search engine's pruning component.
         orderer : The search engine's move ordering component.'
+        table : An optional transposition table, such as SharedHashTable.
+                search stores every node's score and bound in it and cuts
+                off nodes already searched deep enough.
+        terminal : The TerminalDetector used to spot draws. By default, one
+                   drawing on threefold repetition and the fifty-move rule.
+        quiescence_depth : How many plies of captures are searched past the
+                           horizon. 0 evaluates the horizon directly.
+        see_pruning : If True, the quiescence search skips captures which
+                      lose material by static exchange evaluation.
         """
         self.pruner = pruner
         self.orderer = orderer
+        self.table = table
+        self.terminal = terminal or TerminalDetector()
+        self.quiescence_depth = quiescence_depth
+        self.see_pruning = see_pruning
+        # Captures skipped by the quiescence search for losing material
+        self.see_skips = 0
+        self.trackers = []
+        # Move ordering hints, used by orderers with uses_hints set. Moves
+        # are stored packed by encode_move, and 0 means no move.
+        self.hash_moves = {}
+        self.killers = [array('H', (0, 0)) for _ in range(MAX_PLY)]
+        self.max_hash_moves = 2**18
+        # Node count of the current search, and when it must stop
+        self.nodes = 0
+        self.deadline = None
+        self.node_limit = None
+
+    def add_tracker(self, tracker):
+        """
+        Keep a component in step with every move the search makes.
+
+        Arguments
+        ---------
+        tracker: an object with push(board, move) and pop() methods.
+        """
+        if tracker not in self.trackers:
+            self.trackers.append(tracker)
+
+    def make_move(self, board, move):
+        """
+        Make a move on the board and notify the trackers.
+
+        Trackers are notified before the move is pushed, so they can look at
+        the pieces on the from and to squares.
+        """
+        for tracker in self.trackers:
+            tracker.push(board, move)
+        board.push(move)
+        self.terminal.push(board)
+
+    def unmake_move(self, board):
+        """Take back the last move on the board and notify the trackers."""
+        board.pop()
+        self.terminal.pop()
+        for tracker in self.trackers:
+            tracker.pop()
+
+    def leaf_score(self, board, eval_func, alpha, beta, depth=None):
+        """
+        Score a node at the search horizon.
+
+        Only a side in check can be checkmated, so moves are generated for
+        leaves in check. Other leaves are only searched for a legal move,
+        to spot stalemate, when has_free_move cannot find one cheaply.
+        Leaves which are not over go to the quiescence search, or straight
+        to the evaluation if it is turned off. If the orderer
+        scored the leaf while ordering its parent, that score is used
+        instead of the evaluation.
+
+        Arguments
+        ---------
+        depth: the plies of captures left to search, by default
+               quiescence_depth.
+        """
+        if board.is_check():
+            if not any(board.generate_legal_moves()):
+                return neg_inf if board.turn else inf
+        elif not has_free_move(board) and not any(
+                board.generate_legal_moves()):
+            # Stalemate is a draw
+            return 0
+        if depth is None:
+            depth = self.quiescence_depth
+        score = None
+        if self.orderer.scores_leaves:
+            score = self.orderer.leaf_score(board)
+        if depth:
+            return self.quiesce(board, eval_func, alpha, beta, depth, score)
+        if score is not None:
+            return score
+        return eval_func(board, alpha, beta)
+
+    def quiesce(self, board, eval_func, alpha, beta, depth, stand_pat=None):
+        """
+        Search captures past the horizon until the position is quiet.
+
+        The side to move may stand pat on the evaluation instead of
+        capturing, so only captures that improve on it matter. Captures are
+        tried by most valuable victim, and with see_pruning, captures losing
+        material by static exchange evaluation are skipped. The pruner may
+        also skip captures which cannot reach the window (delta pruning).
+
+        Arguments
+        ---------
+        board: the current board space.
+        eval_func: the function which scores a given position.
+        alpha: the score white is already guaranteed.
+        beta: the score black is already guaranteed.
+        depth: how many more plies of captures may be searched.
+        stand_pat: the evaluation of the position, if already known.
+
+        Returns
+        -------
+        score: the score of the position once the captures are resolved.
+        """
+        if stand_pat is None:
+            stand_pat = eval_func(board, alpha, beta)
+        score = stand_pat
+        if board.turn:
+            if score >= beta:
+                return score
+            alpha = max(alpha, score)
+        else:
+            if score <= alpha:
+                return score
+            beta = min(beta, score)
+
+        # Sort the captures by packing each score above its index
+        captures = list(board.generate_legal_captures())
+        order = [(SEE_VALUES[board.piece_type_at(move.to_square)
+                             or chess.PAWN]
+                  - board.piece_type_at(move.from_square)) << 8 | 255 - index
+                 for index, move in enumerate(captures)]
+        order.sort(reverse=True)
+        for packed in order:
+            move = captures[255 - (packed & 255)]
+            if self.pruner.delta_prune(board, move, stand_pat, alpha, beta):
+                continue
+            if self.see_pruning and is_losing_capture(board, move):
+                self.see_skips += 1
+                continue
+            self.nodes += 1
+            self.make_move(board, move)
+            if self.terminal.is_draw(board):
+                value = 0
+            else:
+                value = self.leaf_score(board, eval_func, alpha, beta,
+                                        depth - 1)
+            self.unmake_move(board)
+            if board.turn:
+                if value > score:
+                    score = value
+                    if score >= beta:
+                        break
+                    alpha = max(alpha, score)
+            else:
+                if value < score:
+                    score = value
+                    if score <= alpha:
+                        break
+                    beta = min(beta, score)
+        return score
+
+    def futile_node(self, board, eval_func, depth, alpha, beta):
+        """
+        Check whether the quiet moves of a node cannot reach the window.
+
+        The pruner gives the margin a quiet move may gain at this depth. The
+        root, nodes in check and nodes whose bound is not yet a real score
+        are never futile.
+
+        Returns
+        -------
+        futile: True if the static evaluation plus the margin still falls
+                short of alpha for white, or of beta for black.
+        """
+        margin = self.pruner.futility_margin(depth)
+        if margin is None or not self.terminal.depth() or board.is_check():
+            return False
+        if board.turn:
+            if not abs(alpha) < MATE_BOUND:
+                return False
+            return eval_func(board, alpha - margin, beta) + margin <= alpha
+        if not abs(beta) < MATE_BOUND:
+            return False
+        return eval_func(board, alpha, beta + margin) - margin >= beta
+
+    def no_moves_score(self, board):
+        """Score a node where move generation found no moves."""
+        if board.is_check():
+            return neg_inf if board.turn else inf
+        # Stalemate is a draw
+        return 0
+
+    def store_hints(self, board, key, ply, move, cutoff):
+        """
+        Remember the best move of a node for ordering later searches.
+
+        The move becomes the hash move of the position. If it caused a cutoff
+        and is quiet, it also becomes a killer move for its ply.
+
+        Arguments
+        ---------
+        board: the current board space.
+        key: the position key of the board.
+        ply: the number of moves made on the board.
+        move: the best move found.
+        cutoff: True if the move caused a cutoff.
+        """
+        if len(self.hash_moves) >= self.max_hash_moves:
+            self.hash_moves.clear()
+        code = encode_move(move)
+        self.hash_moves[key] = code
+        if cutoff and not board.is_capture(move):
+            killers = self.killers[ply % MAX_PLY]
+            if code != killers[0] and code != killers[1]:
+                killers[1] = killers[0]
+                killers[0] = code
+
+    def clear_hints(self):
+        """Forget the hash moves and killer moves."""
+        self.hash_moves.clear()
+        for killers in self.killers:
+            killers[0] = killers[1] = 0
+
+    def hinted_moves(self, board, table_move=0):
+        """
+        Start the orderer's moves for a node, with its hints if it uses them.
+
+        Arguments
+        ---------
+        board: the current board space.
+        table_move: the packed move found in the transposition table, which
+                    is preferred to the hash move.
+
+        Returns
+        -------
+        key: the position key of the board, or None without hints.
+        ply: the number of moves made on the board, or None without hints.
+        moves: a generator of moves in search order.
+        """
+        if not self.orderer.uses_hints:
+            return (None, None, self.orderer.pick_moves(board))
+        key = position_key(board)
+        ply = len(board.move_stack)
+        return (key, ply, self.orderer.pick_moves(
+            board, table_move or self.hash_moves.get(key, 0),
+            self.killers[ply % MAX_PLY]))
+
+    def principal_variation(self, board, move, depth):
+        """
+        Recover the line the search expects, starting with the best move.
+
+        The line follows the hash moves, or the table's moves, from the root.
+        It stops at the first position with no stored move, or an illegal
+        one left by another search of the same position.
+
+        Arguments
+        ---------
+        board: the root board of the search.
+        move: the best move found at the root.
+        depth: the longest line to return.
+
+        Returns
+        -------
+        line: a list of moves.
+        """
+        line = []
+        hyp_board = board.copy()
+        while (move is not None and len(line) < depth
+               and hyp_board.is_legal(move)):
+            line.append(move)
+            hyp_board.push(move)
+            code = self.hash_moves.get(position_key(hyp_board), 0)
+            if not code and self.table is not None:
+                entry = self.table.probe(position_hash(hyp_board))
+                if entry is not None:
+                    code = entry[3]
+            move = decode_move(code)
+        return line
 
     def minimax(self, board_node, eval_func):
         """
@@ -46,23 +344,26 @@ class SearchEng:
         best_move: A tuple with the best move and associated score.
         """
         hyp_board = board_node.copy()
-        legal_moves = Orderer.legal_moves_list(board_node)
+        legal_moves = self.orderer.legal_moves_list(board_node)
 
         scores = []
 
         # This layer of for loop scores all of the current player's moves - MAX
         for move in legal_moves:
-            hyp_board.push_san(move)
-            opp_legal_moves = Orderer.legal_moves_list(hyp_board)
+            hyp_board.push(move)
+            opp_legal_moves = self.orderer.legal_moves_list(hyp_board)
 
             # This is a list of the scores after the opponent makes each move
             response_scores = []
 
             # This layer of for loop scores all of the opponent's moves - MIN
             for opp_move in opp_legal_moves:
-                hyp_board.push_san(opp_move)
+                hyp_board.push(opp_move)
                 response_scores.append(eval_func(hyp_board))
                 hyp_board.pop()
+            # With no replies the game is over, so score the position itself
+            if not response_scores:
+                response_scores.append(eval_func(hyp_board))
             # Assume opponent makes best move by minimizes the score
             scores.append(min(response_scores))
             hyp_board.pop()
@@ -88,44 +389,213 @@ class SearchEng:
         Arguments
         ---------
         board: the current board space.
-        eval_func: the function which scores a given position.
+        eval_func: the function which scores a given position. It is called
+                   with the board, alpha and beta.
         depth: how many ply deep the search goes.
+        alpha: the score white is already guaranteed.
+        beta: the score black is already guaranteed.
 
         Returns
         -------
         best_move: A tuple with the best move and associated score.
+
+        Raises
+        ------
+        SearchTimeout: if deadline is set and has passed, or node_limit is
+                       set and more nodes have been searched. The board is
+                       left part way through the search.
         """
         white = True
         best_move = None
-        if depth == 0 or board.is_game_over():
-            return (None, eval_func(board))
+        self.nodes += 1
+        if (self.deadline is not None and not self.nodes & 255
+                and time.perf_counter() > self.deadline):
+            raise SearchTimeout
+        if self.node_limit is not None and self.nodes > self.node_limit:
+            raise SearchTimeout
+        if self.terminal.is_draw(board):
+            return (None, 0)
+        if depth == 0:
+            return (None, self.leaf_score(board, eval_func, alpha, beta))
 
-        legal_moves = self.orderer.order_search(board)
+        table_move = 0
+        if self.table is not None:
+            table_key = position_hash(board)
+            entry = self.table.probe(table_key)
+            if entry is not None:
+                table_depth, table_score, bound, table_move = entry
+                if table_depth >= depth and (
+                        bound == EXACT
+                        or (bound == LOWER and table_score >= beta)
+                        or (bound == UPPER and table_score <= alpha)):
+                    return (decode_move(table_move), table_score)
+            alpha_start = alpha
+            beta_start = beta
 
+        hints = self.orderer.uses_hints
+        key, ply, legal_moves = self.hinted_moves(board, table_move)
+
+        futile = self.futile_node(board, eval_func, depth, alpha, beta)
+        searched = False
+        cutoff = False
         if board.turn is white:
             for move in legal_moves:
-                board.push(move)
-                _, value = self.search(board, eval_func, depth - 1)
-                board.pop()
+                if futile and searched and self.pruner.can_skip(board, move):
+                    continue
+                searched = True
+                self.make_move(board, move)
+                _, value = self.search(board, eval_func, depth - 1,
+                                       alpha, beta)
+                self.unmake_move(board)
                 if value > alpha:
                     alpha = value
                     best_move = move
 
                 if self.pruner.should_prune(alpha, beta):
+                    cutoff = True
                     break
-
-            return (best_move, alpha)
+            score = alpha
 
         else:
             for move in legal_moves:
-                board.push(move)
-                _, value = self.search(board, eval_func, depth - 1)
-                board.pop()
+                if futile and searched and self.pruner.can_skip(board, move):
+                    continue
+                searched = True
+                self.make_move(board, move)
+                _, value = self.search(board, eval_func, depth - 1,
+                                       alpha, beta)
+                self.unmake_move(board)
                 if value < beta:
                     beta = value
                     best_move = move
 
                 if self.pruner.should_prune(alpha, beta):
+                    cutoff = True
                     break
+            score = beta
+
+        if not searched:
+            # Move generation found no moves, so it is checkmate or stalemate
+            return (None, self.no_moves_score(board))
+        if hints and best_move is not None:
+            self.store_hints(board, key, ply, best_move, cutoff)
+        if self.table is not None:
+            if score <= alpha_start:
+                bound = UPPER
+            elif score >= beta_start:
+                bound = LOWER
+            else:
+                bound = EXACT
+            self.table.store(table_key, depth, score, bound,
+                             encode_move(best_move))
+        return (best_move, score)
+
+    def iter_root(self, board, eval_func, depth=2, alpha=-np.inf,
+                  beta=np.inf):
+        """
+        Search the root of the tree, yielding each new best move.
+
+        This searches the same tree as search, in the same order, but yields
+        whenever a root move becomes the best so far. Callers can show
+        progress or stop iterating early and keep the latest best move.
+
+        Arguments
+        ---------
+        board: the current board space.
+        eval_func: the function which scores a given position. It is called
+                   with the board, alpha and beta.
+        depth: how many ply deep the search goes.
+        alpha: the score white is already guaranteed.
+        beta: the score black is already guaranteed.
+
+        Returns
+        -------
+        updates: a generator of (best move, score) tuples. Its return value is
+                 the final (best move, score), as search would return.
+        """
+        white = True
+        best_move = None
+        self.nodes += 1
+        self.terminal.reset(board)
+        if depth == 0:
+            return (None, self.leaf_score(board, eval_func, alpha, beta))
+
+        hints = self.orderer.uses_hints
+        key, ply, legal_moves = self.hinted_moves(board)
+
+        searched = False
+        maximizing = board.turn is white
+        for move in legal_moves:
+            searched = True
+            self.make_move(board, move)
+            _, value = self.search(board, eval_func, depth - 1, alpha, beta)
+            self.unmake_move(board)
+            if maximizing and value > alpha:
+                alpha = value
+                best_move = move
+                yield (best_move, alpha)
+            elif not maximizing and value < beta:
+                beta = value
+                best_move = move
+                yield (best_move, beta)
+
+            if self.pruner.should_prune(alpha, beta):
+                break
+
+        if not searched:
+            # Move generation found no moves, so it is checkmate or stalemate
+            return (None, self.no_moves_score(board))
+        if hints and best_move is not None:
+            self.store_hints(board, key, ply, best_move, False)
+        return (best_move, alpha if maximizing else beta)
+
+    def search_multipv(self, board, eval_func, depth=2, count=3):
+        """
+        Search for the best few moves and their scores.
+
+        Every root move is searched with a window bounded by the score of the
+        current Nth best move, so moves which cannot make the top N fail low
+        quickly. With a window that narrow, the extra lines cost a fraction of
+        one more search. The orderer's hash moves and killers are shared by
+        all the lines.
+
+        Arguments
+        ---------
+        board: the current board space.
+        eval_func: the function which scores a given position. It is called
+                   with the board, alpha and beta.
+        depth: how many ply deep the search goes.
+        count: how many moves to return.
+
+        Returns
+        -------
+        lines: a list of up to count (move, score) tuples, best first.
+        """
+        white = True
+        self.nodes += 1
+        maximizing = board.turn is white
+        self.terminal.reset(board)
+        if depth == 0:
+            return []
+
+        hints = self.orderer.uses_hints
+        key, ply, legal_moves = self.hinted_moves(board)
+
+        lines = []
+        for move in legal_moves:
+            # Only the score of the Nth best move bounds the window
+            bound = lines[-1][1] if len(lines) == count else None
+            alpha = bound if maximizing and bound is not None else -np.inf
+            beta = bound if not maximizing and bound is not None else np.inf
+            self.make_move(board, move)
+            _, value = self.search(board, eval_func, depth - 1, alpha, beta)
+            self.unmake_move(board)
+            if bound is None or (value > bound if maximizing
+                                 else value < bound):
+                lines.append((move, value))
+                lines.sort(key=lambda line: line[1], reverse=maximizing)
+                del lines[count:]
 
-            return (best_move, beta)
+        if hints and lines:
+            self.store_hints(board, key, ply, lines[0][0], False)
+        return lines
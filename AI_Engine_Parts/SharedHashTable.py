@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 26 19:44:15 2026
+
+@author: Prior_Bayes
+"""
+
+# Imports
+from multiprocessing import shared_memory
+import numpy as np
+from .HeuristicEval import inf, neg_inf
+
+# Bound types of a stored score
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+# One table entry. lock is the position hash XORed with the other two words,
+# so an entry torn by two processes writing at once fails verification.
+ENTRY_DTYPE = np.dtype([('lock', '<u8'), ('score', '<f8'), ('info', '<u8')])
+
+# Scores beyond this are mate scores, stored as floating point infinity
+MATE_BOUND = 2**62
+
+
+class SharedHashTable:
+    """
+    A lock-free transposition table shared between processes.
+
+    The entries live in a structured NumPy array backed by
+    multiprocessing.shared_memory, so several processes searching the same
+    position can use each other's results. No locks are taken. Instead, each
+    entry stores the position hash XORed with its data, and a probe only
+    accepts an entry whose data XORs back to the hash being looked up. The
+    newest entry always replaces the old one.
+
+    Each entry holds the best move packed into 16 bits, the search depth,
+    the bound type (EXACT, LOWER or UPPER) and the score from white's point
+    of view.
+
+    Methods
+    -------
+        probe: looks up the entry for a position hash.
+        store: saves the entry for a position hash.
+        clear: empties the table.
+        close: detaches from the shared memory, removing it if owned.
+    """
+
+    def __init__(self, size=2**20, name=None):
+        """
+        Create a new table, or attach to one made by another process.
+
+        Arguments
+        ---------
+        size: the number of entries, rounded up to a power of two.
+        name: the shared memory name of an existing table, or None to create
+              a new one.
+        """
+        self.size = 1 << max(size - 1, 1).bit_length()
+        self.mask = self.size - 1
+        nbytes = self.size * ENTRY_DTYPE.itemsize
+        self.owner = name is None
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+        self.entries = np.ndarray(self.size, dtype=ENTRY_DTYPE,
+                                  buffer=self.shm.buf)
+        if self.owner:
+            self.entries.fill(0)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        """Return the number of filled entries."""
+        return int(np.count_nonzero(self.entries['info']))
+
+    @property
+    def nbytes(self):
+        """Return the size of the table in bytes."""
+        return self.entries.nbytes
+
+    def probe(self, key: int):
+        """
+        Look up the entry for a position hash.
+
+        Arguments
+        ---------
+        key: the 64-bit position hash.
+
+        Returns
+        -------
+        entry: a tuple of (depth, score, bound, move), or None if the position
+               is not in the table. move is packed by encode_move, and is 0
+               if there was none.
+        """
+        lock, score, info = self.entries[key & self.mask].item()
+        score_bits = int(np.float64(score).view(np.uint64))
+        if not info or lock ^ score_bits ^ info != key:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if score >= MATE_BOUND:
+            score = inf
+        elif score <= -MATE_BOUND:
+            score = neg_inf
+        return (info >> 16 & 0xFF, score, info >> 24 & 3,
+                info & 0xFFFF)
+
+    def store(self, key: int, depth: int, score, bound: int, move: int):
+        """
+        Save the entry for a position hash.
+
+        Arguments
+        ---------
+        key: the 64-bit position hash.
+        depth: the depth the position was searched to.
+        score: the score from white's point of view.
+        bound: EXACT, LOWER or UPPER.
+        move: the best move found, packed by encode_move, or 0.
+        """
+        score = float(score)
+        # Set bit 26 so that a filled entry never has info equal to 0
+        info = (move | min(depth, 255) << 16 | bound << 24
+                | 1 << 26)
+        score_bits = int(np.float64(score).view(np.uint64))
+        self.entries[key & self.mask] = (key ^ score_bits ^ info, score, info)
+
+    def clear(self):
+        """Empty the table and reset the hit counters."""
+        self.entries.fill(0)
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        """Detach from the shared memory, and remove it if this made it."""
+        self.entries = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
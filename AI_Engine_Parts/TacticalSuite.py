@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Nov  3 19:22:36 2026
+
+@author: Prior_Bayes
+"""
+
+# Imports
+import argparse
+import json
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import chess
+from .EngineService import default_engine
+
+# A test position. best and avoid hold the UCI moves of its bm and am
+# operations, either of which may be empty.
+SuitePosition = namedtuple('SuitePosition', ['id', 'fen', 'best', 'avoid'])
+
+# The outcome of one position. seconds and nodes measure how long the search
+# took to settle on a solving move for good, and are None when unsolved.
+SuiteResult = namedtuple('SuiteResult', ['id', 'move', 'solved', 'seconds',
+                                         'nodes', 'depth'])
+
+
+def load_epd(lines) -> list:
+    """
+    Read test positions in EPD format.
+
+    Blank lines and lines starting with # are skipped. A position without an
+    id operation is named after its line number.
+
+    Arguments
+    ---------
+    lines: an iterable of EPD lines, such as an open file.
+
+    Returns
+    -------
+    positions: a list of SuitePosition tuples.
+
+    Raises
+    ------
+    ValueError: if a position has neither a bm nor an am operation.
+    """
+    positions = []
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        board, operations = chess.Board.from_epd(line)
+        best = tuple(move.uci() for move in operations.get('bm', []))
+        avoid = tuple(move.uci() for move in operations.get('am', []))
+        if not best and not avoid:
+            raise ValueError(f'line {number} has no bm or am operation')
+        positions.append(SuitePosition(
+            str(operations.get('id', f'line {number}')), board.fen(), best,
+            avoid))
+    return positions
+
+
+def is_solution(position: SuitePosition, move) -> bool:
+    """
+    Check whether a move solves a test position.
+
+    Arguments
+    ---------
+    position: the test position.
+    move: the move played, or None.
+
+    Returns
+    -------
+    solved: True if the move is one of the best moves, when there are any,
+            and none of the moves to avoid.
+    """
+    if move is None:
+        return False
+    uci = move.uci()
+    if position.best and uci not in position.best:
+        return False
+    return uci not in position.avoid
+
+
+def solve_position(position: SuitePosition, engine_factory=default_engine,
+                   time_limit=1.0, node_limit=None,
+                   max_depth=32) -> SuiteResult:
+    """
+    Search a test position with a fresh engine.
+
+    The search deepens until the depth, time or node budget runs out. The
+    time and nodes to solution are those of the first update after which
+    every later update played a solving move. A search to max_depth alone
+    could run for hours, so a time or node limit is required.
+
+    Arguments
+    ---------
+    position: the test position.
+    engine_factory: a picklable function building a new ChessEngine.
+    time_limit: the seconds each position may take, or None.
+    node_limit: the nodes each position may take, or None.
+    max_depth: the deepest search to run.
+
+    Returns
+    -------
+    result: a SuiteResult.
+
+    Raises
+    ------
+    ValueError: if time_limit and node_limit are both None.
+    """
+    if time_limit is None and node_limit is None:
+        raise ValueError('a time or node limit is required')
+    engine = engine_factory()
+    updates = list(engine.iter_search(chess.Board(position.fen), max_depth,
+                                      time_limit, node_limit))
+    if not updates:
+        return SuiteResult(position.id, None, False, None, None, 0)
+    settled = None
+    for update in reversed(updates):
+        if not is_solution(position, update.move):
+            break
+        settled = update
+    final = updates[-1]
+    move = None if final.move is None else final.move.uci()
+    if settled is None:
+        return SuiteResult(position.id, move, False, None, None,
+                           engine.completed_depth)
+    return SuiteResult(position.id, move, True, settled.elapsed,
+                       settled.nodes, engine.completed_depth)
+
+
+def _solve(args):
+    """Unpack the arguments of solve_position in a worker process."""
+    return solve_position(*args)
+
+
+class TacticalSuite:
+    """
+    TacticalSuite measures how many test positions an engine solves.
+
+    Raw speed does not show whether an optimization helps the engine find
+    moves. The suite runs an engine on EPD positions with bm (best move) and
+    am (avoid move) operations under a fixed time or node budget, and
+    records which are solved and how much time and how many nodes the
+    search took to settle on the solution. Positions are spread over a
+    process pool, each searched by a fresh engine, so results do not depend
+    on the order they run in. Results can be saved and compared with a
+    previous run to see which speedups turn into more tactics found.
+
+    A node budget gives the same results on any machine and under any load,
+    so it isolates changes to the search itself. A time budget also rewards
+    changes which make each node cheaper.
+
+    Methods
+    -------
+        from_epd: builds a suite from an EPD file.
+        run: searches every position.
+        diff: compares results with those of a previous run.
+        report: formats results, and their changes, as a table.
+        save: writes results to a JSON file.
+        load: reads results written by save.
+    """
+
+    def __init__(self, positions, engine_factory=default_engine,
+                 time_limit=1.0, node_limit=None, max_depth=32, workers=None):
+        """
+        Initialize the suite.
+
+        Arguments
+        ---------
+        positions: a list of SuitePosition tuples.
+        engine_factory: a picklable function building a new ChessEngine.
+        time_limit: the seconds each position may take, or None.
+        node_limit: the nodes each position may take, or None.
+        max_depth: the deepest search to run.
+        workers: the number of worker processes, by default one per CPU.
+                 With 1, positions are searched in this process.
+
+        Raises
+        ------
+        ValueError: if time_limit and node_limit are both None.
+        """
+        if time_limit is None and node_limit is None:
+            raise ValueError('a time or node limit is required')
+        self.positions = list(positions)
+        self.engine_factory = engine_factory
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.max_depth = max_depth
+        self.workers = workers or os.cpu_count() or 1
+
+    @classmethod
+    def from_epd(cls, path, **settings):
+        """
+        Build a suite from an EPD file.
+
+        Arguments
+        ---------
+        path: the EPD file.
+        settings: the keyword arguments of TacticalSuite.
+
+        Returns
+        -------
+        suite: a TacticalSuite.
+        """
+        with open(path) as epd:
+            return cls(load_epd(epd), **settings)
+
+    def run(self) -> list:
+        """
+        Search every position.
+
+        Returns
+        -------
+        results: a list of SuiteResult tuples, in the order of the positions.
+        """
+        jobs = [(position, self.engine_factory, self.time_limit,
+                 self.node_limit, self.max_depth)
+                for position in self.positions]
+        if self.workers == 1 or len(jobs) < 2:
+            return [_solve(job) for job in jobs]
+        with ProcessPoolExecutor(min(self.workers, len(jobs))) as pool:
+            return list(pool.map(_solve, jobs))
+
+    @staticmethod
+    def diff(results, previous, tolerance=0.1) -> dict:
+        """
+        Compare results with those of a previous run.
+
+        Arguments
+        ---------
+        results: the SuiteResult tuples of this run.
+        previous: the SuiteResult tuples of the previous run.
+        tolerance: the relative change in time or nodes to solution below
+                   which a position counts as unchanged.
+
+        Returns
+        -------
+        changes: a dictionary of lists of position ids. gained and lost hold
+                 positions solved in only one of the runs, faster and slower
+                 those solved in both whose time to solution changed, and
+                 fewer_nodes and more_nodes those whose nodes changed.
+                 new holds positions missing from the previous run.
+        """
+        before = {result.id: result for result in previous}
+        changes = {'gained': [], 'lost': [], 'faster': [], 'slower': [],
+                   'fewer_nodes': [], 'more_nodes': [], 'new': []}
+        for result in results:
+            old = before.get(result.id)
+            if old is None:
+                changes['new'].append(result.id)
+            elif result.solved and not old.solved:
+                changes['gained'].append(result.id)
+            elif old.solved and not result.solved:
+                changes['lost'].append(result.id)
+            elif result.solved:
+                for field, down, up in [('seconds', 'faster', 'slower'),
+                                        ('nodes', 'fewer_nodes',
+                                         'more_nodes')]:
+                    now = getattr(result, field)
+                    then = getattr(old, field)
+                    if now < then * (1 - tolerance):
+                        changes[down].append(result.id)
+                    elif now > then * (1 + tolerance):
+                        changes[up].append(result.id)
+        return changes
+
+    @staticmethod
+    def report(results, previous=None) -> str:
+        """
+        Format results as a table, with the previous run alongside if given.
+
+        Arguments
+        ---------
+        results: the SuiteResult tuples of this run.
+        previous: the SuiteResult tuples of a previous run, or None.
+
+        Returns
+        -------
+        table: the report, one line per position and a summary.
+        """
+        before = {result.id: result for result in previous or []}
+        lines = [f"{'position':<16}{'move':<8}{'solved':>7}{'seconds':>10}"
+                 f"{'nodes':>10}{'depth':>7}"
+                 + (f"{'was':>8}{'seconds':>10}{'nodes':>10}"
+                    if previous is not None else '')]
+        for result in results:
+            line = (f'{result.id:<16}{result.move or "-":<8}'
+                    f'{"yes" if result.solved else "no":>7}'
+                    f'{_format(result.seconds, ".3f"):>10}'
+                    f'{_format(result.nodes, "d"):>10}{result.depth:>7}')
+            if previous is not None:
+                old = before.get(result.id)
+                if old is None:
+                    line += f"{'new':>8}"
+                else:
+                    line += (f'{"yes" if old.solved else "no":>8}'
+                             f'{_format(old.seconds, ".3f"):>10}'
+                             f'{_format(old.nodes, "d"):>10}')
+            lines.append(line)
+        solved = sum(result.solved for result in results)
+        summary = f'solved {solved}/{len(results)}'
+        if previous is not None:
+            changes = TacticalSuite.diff(results, previous)
+            summary += (f" (was {sum(old.solved for old in previous)}"
+                        f"/{len(previous)})")
+            for name, ids in changes.items():
+                if ids:
+                    summary += f"\n{name}: {', '.join(ids)}"
+        lines.append(summary)
+        return '\n'.join(lines)
+
+    @staticmethod
+    def save(results, path):
+        """Write results to a JSON file."""
+        with open(path, 'w') as output:
+            json.dump([result._asdict() for result in results], output,
+                      indent=1)
+
+    @staticmethod
+    def load(path) -> list:
+        """Read results written by save."""
+        with open(path) as saved:
+            return [SuiteResult(**result) for result in json.load(saved)]
+
+
+def _format(value, spec) -> str:
+    """Format a number of a result, or a dash if there is none."""
+    return '-' if value is None else format(value, spec)
+
+
+def _main(argv=None):
+    """Run a suite from the command line and print the report."""
+    parser = argparse.ArgumentParser(
+        description='Count the positions of an EPD suite the engine solves.')
+    parser.add_argument('epd', help='EPD file with bm or am operations')
+    parser.add_argument('--time', type=float, default=None,
+                        help='seconds per position')
+    parser.add_argument('--nodes', type=int, default=None,
+                        help='nodes per position')
+    parser.add_argument('--depth', type=int, default=32,
+                        help='deepest search per position')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='worker processes, by default one per CPU')
+    parser.add_argument('--previous', help='results of an earlier run')
+    parser.add_argument('--save', help='file to save the results in')
+    args = parser.parse_args(argv)
+    time_limit = args.time
+    if time_limit is None and args.nodes is None:
+        time_limit = 1.0
+    suite = TacticalSuite.from_epd(args.epd, time_limit=time_limit,
+                                   node_limit=args.nodes,
+                                   max_depth=args.depth, workers=args.workers)
+    results = suite.run()
+    previous = None if args.previous is None else TacticalSuite.load(
+        args.previous)
+    print(TacticalSuite.report(results, previous))
+    if args.save is not None:
+        TacticalSuite.save(results, args.save)
+
+
+if __name__ == '__main__':
+    _main()
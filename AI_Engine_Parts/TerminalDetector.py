@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Oct 29 19:34:08 2026
+
+@author: Prior_Bayes
+"""
+
+import chess
+from .AI_Engine_Functions import position_hash
+
+
+class TerminalDetector:
+    """
+    TerminalDetector spots drawn positions during a search in constant time.
+
+    python-chess's is_game_over generates the legal moves and walks back
+    through the move stack to look for repetitions. TerminalDetector instead
+    keeps a stack of position hashes in step with the search's push/pop,
+    along with a count of how often each hash has occurred, so a repetition
+    check is one dictionary lookup. The fifty-move counter is the board's
+    halfmove clock, which python-chess keeps up to date on push/pop.
+
+    Checkmate and stalemate are not detected here. The search finds them when
+    move generation produces no moves.
+
+    Methods
+    -------
+        reset: starts tracking a board, including its game history.
+        push: records the position after a move.
+        pop: forgets the position of a move taken back.
+        depth: returns how many moves have been pushed since reset.
+        is_repetition: checks whether the position has occurred often enough.
+        is_draw: checks for a draw by repetition, the fifty-move rule or
+                 insufficient material.
+    """
+
+    # Attributes which change what is a draw, for engine_fingerprint
+    settings = ('repetitions', 'halfmove_limit')
+
+    def __init__(self, repetitions=3, halfmove_limit=100):
+        """
+        Initialize the detector.
+
+        Arguments
+        ---------
+        repetitions: how many times a position must occur to be a draw.
+        halfmove_limit: how many plies without a capture or pawn move make a
+                        draw.
+        """
+        self.repetitions = repetitions
+        self.halfmove_limit = halfmove_limit
+        self.board = None
+        self.root_ply = 0
+        self.hashes = []
+        self.counts = {}
+        self.root_size = 0
+
+    def reset(self, board: chess.Board):
+        """
+        Start tracking a board, usually the root of a search.
+
+        The positions of the game before the root are hashed once, so
+        repetitions of earlier positions in the game are seen.
+
+        Arguments
+        ---------
+        board: the board that will be pushed and popped during the search.
+        """
+        self.board = board
+        self.root_ply = len(board.move_stack)
+        self.hashes = []
+        self.counts = {}
+        history = board.copy()
+        while True:
+            key = position_hash(history)
+            self.hashes.append(key)
+            self.counts[key] = self.counts.get(key, 0) + 1
+            # Positions before a capture or pawn move can never repeat
+            if not history.move_stack or not history.halfmove_clock:
+                break
+            history.pop()
+        self.hashes.reverse()
+        self.root_size = len(self.hashes)
+
+    def push(self, board: chess.Board):
+        """
+        Record the position reached after a move.
+
+        Arguments
+        ---------
+        board: the board after the move was pushed.
+        """
+        key = position_hash(board)
+        self.hashes.append(key)
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+    def pop(self):
+        """Forget the position of a move which was taken back."""
+        key = self.hashes.pop()
+        self.counts[key] -= 1
+
+    def depth(self) -> int:
+        """Return how many moves have been pushed since reset."""
+        return len(self.hashes) - self.root_size
+
+    def is_repetition(self, count=None) -> bool:
+        """
+        Check whether the current position has occurred count times.
+
+        Arguments
+        ---------
+        count: the number of occurrences, by default the draw threshold.
+
+        Returns
+        -------
+        repeated: True if the position has occurred at least count times.
+        """
+        return (self.counts[self.hashes[-1]]
+                >= (self.repetitions if count is None else count))
+
+    def is_draw(self, board: chess.Board) -> bool:
+        """
+        Check whether a position below the root is drawn.
+
+        The root is never reported as drawn, so the search always has a move
+        to return. If the board is not the one being tracked, or has moved
+        without the detector, tracking restarts from it.
+
+        Arguments
+        ---------
+        board: the current board state.
+
+        Returns
+        -------
+        draw: True if the position is drawn by repetition, the fifty-move
+              rule or insufficient material.
+        """
+        ply = len(board.move_stack)
+        if board is not self.board or ply - self.root_ply != self.depth():
+            self.reset(board)
+        if ply == self.root_ply:
+            return False
+        if board.halfmove_clock >= self.halfmove_limit:
+            return True
+        if self.counts[self.hashes[-1]] >= self.repetitions:
+            return True
+        # Only positions without pawns, rooks and queens can lack material
+        if not (board.pawns | board.rooks | board.queens):
+            return board.is_insufficient_material()
+        return False
@@ -7,12 +7,27 @@ Created on Sun Jul 27 19:18:46 2025
 
 from .AI_Engine_Functions import *
 from .AlphaBetaPruner import *
+from .AnalysisCache import *
+from .AttackMap import *
 from .AttackOrderer import *
 from .BBHeuristicEval import *
 from .ChessEngine import *
+from .EngineService import *
 from .EvalEng import *
+from .FutilityPruner import *
+from .GameSession import *
 from .GreedyOrderer import *
 from .HeuristicEval import *
+from .IterativeSearchEng import *
+from .LazySMP import *
+from .MateSolver import *
+from .MemoryProfiler import *
+from .MovePicker import *
 from .Orderer import *
+from .PawnHashTable import *
 from .Pruner import *
+from .PSTEval import *
 from .SearchEng import *
+from .SharedHashTable import *
+from .TacticalSuite import *
+from .TerminalDetector import *
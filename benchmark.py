@@ -12,7 +12,7 @@ import AI_Engine_Parts as AI
 Eng = AI.ChessEngine(AI.SearchEng(AI.Pruner(),
                                   AI.AttackOrderer()),
                      AI.HeuristicEval())
-abEng = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaSearch(),
+abEng = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
                                     AI.AttackOrderer()),
                        AI.HeuristicEval())
 
@@ -35,7 +35,7 @@ def tictoc(func, arg1=None, arg2=None):
     if (arg1 is None) & (arg2 is None):
         t0 = time.perf_counter()
         func()
-        t1 = time.t()
+        t1 = time.perf_counter()
     elif (arg2 is None):
         t0 = time.perf_counter()
         func(arg1)
@@ -81,6 +81,144 @@ useful_positions = [
     mateInTwo]
 
 for pos in useful_positions:
-    print(f"{pos=}", "/n",
+    print(f"{pos=}", "\n",
           "Alpha-Beta Search: ", tictoc(abEng.find_best_move, pos, 4),
           "Default Search: ", tictoc(Eng.find_best_move, pos, 4))
+
+
+def see_cost(positions, repeats=100):
+    """
+    See_cost measures the average time of one static exchange evaluation.
+
+    Arguments
+    ---------
+    positions: The positions whose captures are evaluated.
+    repeats: How many times each capture is evaluated.
+
+    Returns
+    -------
+    cost: The seconds per evaluation.
+    """
+    captures = [(pos, move) for pos in positions
+                for move in pos.generate_legal_captures()]
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        for pos, move in captures:
+            AI.static_exchange(pos, move)
+    t1 = time.perf_counter()
+    return (t1 - t0) / (repeats * len(captures))
+
+
+def see_savings(positions, depth=3, quiescence_depth=4):
+    """
+    See_savings compares searches with and without static exchange evaluation.
+
+    With SEE, MovePicker holds back losing captures and the quiescence search
+    skips them.
+
+    Arguments
+    ---------
+    positions: The positions to search.
+    depth: How many ply deep each search goes.
+    quiescence_depth: How many plies of captures follow the horizon.
+
+    Returns
+    -------
+    results: A dictionary of total nodes and seconds, with and without SEE.
+    """
+    results = {}
+    for use_see in [False, True]:
+        eng = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                          AI.MovePicker(use_see=use_see),
+                                          quiescence_depth=quiescence_depth,
+                                          see_pruning=use_see),
+                             AI.HeuristicEval(lazy=True))
+        nodes = 0
+        elapsed = 0
+        for pos in positions:
+            elapsed += tictoc(eng.find_best_move, pos, depth)
+            nodes += eng.searchEng.nodes
+        results[use_see] = (nodes, elapsed)
+    return results
+
+
+see_positions = [italian, mateInTwo, forced, castling]
+print("SEE cost: ", f"{see_cost(see_positions) * 1e6:.1f} us per capture")
+savings = see_savings(see_positions)
+for use_see, (nodes, elapsed) in savings.items():
+    print(f"SEE {'on' if use_see else 'off'}: ", f"{nodes} nodes",
+          f"{elapsed:.2f} s")
+print("Nodes saved by SEE: ",
+      f"{1 - savings[True][0] / savings[False][0]:.0%}")
+
+
+def greedy_cost(positions, repeats=100):
+    """
+    Greedy_cost measures the average time GreedyOrderer takes to score a move.
+
+    Arguments
+    ---------
+    positions: The positions whose moves are scored.
+    repeats: How many times each position is scored.
+
+    Returns
+    -------
+    cost: The seconds per scored move.
+    """
+    orderer = AI.GreedyOrderer()
+    moves = [(pos, list(pos.legal_moves)) for pos in positions]
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        for pos, pos_moves in moves:
+            orderer.child_totals(pos, pos_moves)
+    t1 = time.perf_counter()
+    scored = sum(len(pos_moves) for _, pos_moves in moves)
+    return (t1 - t0) / (repeats * scored)
+
+
+def greedy_savings(positions, depth=4):
+    """
+    Greedy_savings compares the nodes and time of searches by move orderer.
+
+    Every search uses PSTEval. The shared GreedyOrderer scores with the
+    engine's own evaluator, so its scores also stand in for the evaluation
+    of horizon nodes.
+
+    Arguments
+    ---------
+    positions: The positions to search.
+    depth: How many ply deep each search goes.
+
+    Returns
+    -------
+    results: A dictionary of total nodes and seconds for each orderer.
+    """
+    results = {}
+    for name in ['Orderer', 'MovePicker', 'GreedyOrderer', 'shared Greedy']:
+        evaluator = AI.PSTEval()
+        orderer = {'Orderer': AI.Orderer,
+                   'MovePicker': AI.MovePicker,
+                   'GreedyOrderer': AI.GreedyOrderer,
+                   'shared Greedy': lambda: AI.GreedyOrderer(evaluator)}[name]
+        eng = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(), orderer()),
+                             evaluator)
+        nodes = 0
+        elapsed = 0
+        for pos in positions:
+            elapsed += tictoc(eng.find_best_move, pos, depth)
+            nodes += eng.searchEng.nodes
+        results[name] = (nodes, elapsed)
+    return results
+
+
+greedy_positions = [italian, mateInTwo, forced, castling]
+print("Greedy cost: ",
+      f"{greedy_cost(greedy_positions) * 1e6:.1f} us per scored move")
+orderings = greedy_savings(greedy_positions)
+for name, (nodes, elapsed) in orderings.items():
+    print(f"{name}: ", f"{nodes} nodes", f"{elapsed:.2f} s")
+for baseline in ['Orderer', 'MovePicker']:
+    nodes, elapsed = orderings[baseline]
+    print(f"Greedy vs {baseline}: ",
+          f"{1 - orderings['shared Greedy'][0] / nodes:.0%} nodes saved,",
+          f"{orderings['shared Greedy'][1] - elapsed:+.2f} s")
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 30 20:31:55 2026
+
+@author: Prior_Bayes
+"""
+
+import chess
+import AI_Engine_Parts as AI
+
+italian = chess.Board(
+    fen='r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b')
+mateInTwo = chess.Board(
+    fen='r1bq2r1/b4pk1/p1pp1p2/1p2pP2/1P2P1PB/3P4/1PPQ2P1/R3K2R w')
+
+
+def make_engine(cache=None, lazy=True):
+    return AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(), AI.MovePicker()),
+                          AI.HeuristicEval(lazy=lazy), cache=cache)
+
+
+class TestAnalysisCache:
+    def setup_method(self):
+        self.cache = AI.AnalysisCache(':memory:')
+        self.move = chess.Move.from_uci('g8f6')
+
+    def teardown_method(self):
+        self.cache.close()
+
+    def test_deeper_result_satisfies_shallower(self):
+        self.cache.store(italian, 'a', 4, self.move, 0.5, [self.move])
+        assert self.cache.probe(italian, 'a', 3) == (self.move, 0.5, 4,
+                                                     [self.move])
+        assert self.cache.probe(italian, 'a', 5) is None
+        assert self.cache.probe(italian, 'b', 3) is None
+        self.cache.store(italian, 'a', 2, None, 0.0)
+        assert self.cache.probe(italian, 'a', 1).depth == 4
+        assert len(self.cache) == 1
+
+    def test_mate_scores(self):
+        self.cache.store(mateInTwo, 'a', 3, chess.Move.from_uci('h4f6'),
+                         AI.inf)
+        self.cache.store(italian, 'a', 3, None, AI.neg_inf)
+        assert self.cache.probe(mateInTwo, 'a', 3).score == AI.inf
+        assert self.cache.probe(italian, 'a', 3).score == AI.neg_inf
+
+    def test_colliding_position_misses(self):
+        self.cache.store(italian, 'a', 4, self.move, 0.5, [self.move])
+        # Give the cached result the hash of another position
+        self.cache.connection.execute('UPDATE analysis SET hash = ?',
+                                      (self.cache.key(mateInTwo),))
+        assert self.cache.probe(mateInTwo, 'a', 1) is None
+        self.cache.store(mateInTwo, 'a', 1, None, 0.0)
+        assert self.cache.probe(mateInTwo, 'a', 1).depth == 1
+        assert len(self.cache) == 1
+
+    def test_illegal_move_misses(self):
+        self.cache.store(italian, 'a', 4, chess.Move.from_uci('e1g1'), 0.5)
+        assert self.cache.probe(italian, 'a', 4) is None
+        assert self.cache.misses == 1
+
+    def test_old_schema_is_replaced(self, tmp_path):
+        path = str(tmp_path / 'analysis.db')
+        old = AI.AnalysisCache(path)
+        old.connection.execute('DROP TABLE analysis')
+        old.connection.execute(
+            'CREATE TABLE analysis (hash INTEGER NOT NULL, '
+            'config TEXT NOT NULL, depth INTEGER NOT NULL, move TEXT, '
+            'score REAL NOT NULL, pv TEXT NOT NULL, used INTEGER NOT NULL, '
+            'PRIMARY KEY (hash, config))')
+        old.connection.execute(
+            "INSERT INTO analysis VALUES (1, 'a', 4, NULL, 0.0, '', 1)")
+        old.close()
+        cache = AI.AnalysisCache(path)
+        assert len(cache) == 0
+        cache.store(italian, 'a', 4, self.move, 0.5)
+        assert cache.probe(italian, 'a', 4).move == self.move
+        cache.close()
+
+    def test_evicts_least_recently_used(self):
+        self.cache.max_entries = 10
+        boards = []
+        board = chess.Board()
+        for move in list(board.legal_moves)[:11]:
+            board.push(move)
+            boards.append(board.copy())
+            board.pop()
+        for board in boards[:10]:
+            self.cache.store(board, 'a', 1, None, 0.0)
+        self.cache.probe(boards[0], 'a', 1)
+        self.cache.store(boards[10], 'a', 1, None, 0.0)
+        assert len(self.cache) == 9
+        assert self.cache.probe(boards[0], 'a', 1) is not None
+        assert self.cache.probe(boards[1], 'a', 1) is None
+        assert self.cache.probe(boards[10], 'a', 1) is not None
+
+    def test_persists_between_runs(self, tmp_path):
+        path = str(tmp_path / 'analysis.db')
+        first = make_engine(AI.AnalysisCache(path))
+        result = first.find_best_move(italian, 3)
+        first.cache.close()
+
+        second = make_engine(AI.AnalysisCache(path))
+        assert second.find_best_move(italian, 2) == result
+        assert second.searchEng.nodes == 0
+        assert second.pv[0] == result[0]
+        assert second.cache.hits == 1
+        second.cache.close()
+
+    def test_fingerprint_depends_on_configuration(self):
+        assert make_engine().fingerprint() == make_engine().fingerprint()
+        assert (make_engine().fingerprint()
+                != make_engine(lazy=False).fingerprint())
+        engine = make_engine()
+        before = engine.fingerprint()
+        engine.find_best_move(italian, 2)
+        assert engine.fingerprint() == before
+
+    def test_fingerprint_ignores_counters(self):
+        engine = make_engine()
+        before = engine.fingerprint()
+        engine.searchEng.new_counter = 1
+        engine.evalEng.new_counter = 1
+        assert engine.fingerprint() == before
+        engine.searchEng.quiescence_depth = 2
+        assert engine.fingerprint() != before
+
+    def test_repeated_quiescence_search_hits(self):
+        engine = AI.ChessEngine(
+            AI.SearchEng(AI.AlphaBetaPruner(), AI.MovePicker(use_see=True),
+                         quiescence_depth=4),
+            AI.HeuristicEval(lazy=True), cache=self.cache)
+        result = engine.find_best_move(italian, 2)
+        assert engine.searchEng.see_skips > 0
+        assert engine.find_best_move(italian, 2) == result
+        assert engine.searchEng.nodes == 0
+        assert self.cache.hits == 1
+
+    def test_principal_variation(self):
+        engine = make_engine()
+        move, _ = engine.find_best_move(italian, 3)
+        assert engine.pv[0] == move
+        board = italian.copy()
+        for pv_move in engine.pv:
+            assert board.is_legal(pv_move)
+            board.push(pv_move)
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Nov  2 20:15:48 2026
+
+@author: Prior_Bayes
+"""
+
+import random
+import chess
+import AI_Engine_Parts as AI
+
+italian = chess.Board(
+    fen='r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b')
+kiwipete = chess.Board(
+    fen='r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - '
+        '0 1')
+en_passant = chess.Board(fen='4k3/8/8/3pP3/8/8/8/R3K3 w Q d6 0 1')
+promotion = chess.Board(fen='1n2k3/P7/8/8/8/8/8/4K2R w K - 0 1')
+
+
+def fresh(board):
+    attack_map = AI.AttackMap()
+    attack_map.reset(board.copy())
+    return attack_map
+
+
+def assert_matches(attack_map, board):
+    expected = fresh(board)
+    assert attack_map.attacks == expected.attacks
+    assert attack_map.counts == expected.counts
+    assert attack_map.attacked == expected.attacked
+
+
+class TestAttackMap:
+    def setup_method(self):
+        self.map = AI.AttackMap()
+
+    def test_matches_python_chess(self):
+        self.map.reset(kiwipete)
+        for square in chess.SQUARES:
+            assert (self.map.attacks_from(square)
+                    == (kiwipete.attacks_mask(square)
+                        if kiwipete.piece_at(square) else 0))
+            for color in chess.COLORS:
+                assert (self.map.attackers(color, square)
+                        == kiwipete.attackers_mask(color, square))
+                assert (self.map.counts[color][square]
+                        == chess.popcount(kiwipete.attackers_mask(color,
+                                                                  square)))
+
+    def test_special_moves(self):
+        for board in [kiwipete, en_passant, promotion]:
+            board = board.copy()
+            self.map.reset(board)
+            for move in list(board.legal_moves):
+                self.map.push(board, move)
+                board.push(move)
+                assert_matches(self.map, board)
+                self.map.pop()
+                board.pop()
+                assert_matches(self.map, board)
+
+    def test_random_games(self):
+        rng = random.Random(7)
+        for _ in range(10):
+            board = chess.Board()
+            self.map.reset(board)
+            for _ in range(60):
+                moves = list(board.legal_moves)
+                if not moves:
+                    break
+                move = rng.choice(moves)
+                self.map.push(board, move)
+                board.push(move)
+            assert_matches(self.map, board)
+            while board.move_stack:
+                self.map.pop()
+                board.pop()
+            assert_matches(self.map, board)
+
+    def test_resyncs_with_untracked_board(self):
+        board = italian.copy()
+        self.map.reset(board)
+        board.push_san('Nf6')
+        assert_matches(self.map.sync(board), board)
+
+    def test_space_and_attackers_match_recomputation(self):
+        plain = AI.HeuristicEval()
+        mapped = AI.HeuristicEval(attack_map=self.map)
+        for board in [chess.Board(), italian, kiwipete, en_passant]:
+            assert mapped.current_space(board) == plain.current_space(board)
+            assert (AI.AttackOrderer(attack_map=self.map).get_attackers(board)
+                    == AI.AttackOrderer().get_attackers(board))
+
+    def test_king_safety(self):
+        board = chess.Board(fen='6k1/5ppp/8/8/8/8/5PPP/R5K1 w - - 0 1')
+        # The rook and pawns attack nothing near the black king
+        assert AI.HeuristicEval().current_king_safety(board) == (0, 0)
+        board.push_san('Ra8+')
+        white, black = AI.HeuristicEval().current_king_safety(board)
+        # Ra8 attacks f8 and the king on g8
+        assert white == 2 and black == 0
+
+    def test_search_weighs_king_safety(self):
+        weights = (1, 0.2, 0.2, 0, 0.5)
+        evaluation = AI.HeuristicEval(attack_map=self.map, weights=weights)
+        calls = []
+        king_safety = evaluation.current_king_safety
+        evaluation.current_king_safety = (
+            lambda board: calls.append(board) or king_safety(board))
+        mapped = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                             AI.MovePicker()), evaluation)
+        plain = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                            AI.MovePicker()),
+                               AI.HeuristicEval(weights=weights))
+        assert (mapped.find_best_move(italian, 2)
+                == plain.find_best_move(italian, 2))
+        assert calls
+        unweighted = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                                 AI.MovePicker()),
+                                    AI.HeuristicEval())
+        assert mapped.fingerprint() != unweighted.fingerprint()
+
+    def test_search_results_unchanged(self):
+        plain = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                            AI.AttackOrderer()),
+                               AI.HeuristicEval())
+        mapped = AI.ChessEngine(
+            AI.SearchEng(AI.AlphaBetaPruner(),
+                         AI.AttackOrderer(attack_map=self.map)),
+            AI.HeuristicEval(attack_map=self.map))
+        assert (mapped.find_best_move(italian, 2)
+                == plain.find_best_move(italian, 2))
+        assert mapped.searchEng.nodes == plain.searchEng.nodes
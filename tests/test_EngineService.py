@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Oct 22 21:48:03 2026
+
+@author: Prior_Bayes
+"""
+
+import asyncio
+import time
+import chess
+import AI_Engine_Parts as AI
+
+italian = 'r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b'
+forced = 'rnb1kbnr/ppppp1pp/5p2/8/5P1q/2N5/PPPPP1PP/R1BQKBNR w'
+checkmate = 'rnb1kbnr/ppppp1pp/5p2/8/5PPq/8/PPPPP2P/RNBQKBNR w'
+
+
+class StallingEval(AI.HeuristicEval):
+    """An evaluator whose first evaluation stalls past any deadline."""
+
+    def __init__(self):
+        super().__init__()
+        self.stalled = False
+
+    def score_window(self, board, alpha, beta, weights=None):
+        if not self.stalled:
+            self.stalled = True
+            time.sleep(3.0)
+        return super().score_window(board, alpha, beta, weights)
+
+
+def stalling_engine():
+    return AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                       AI.MovePicker()), StallingEval())
+
+
+async def serve(service, requests):
+    """Start the service, send requests from one client and stop it."""
+    host, port = await service.start()
+    client = AI.EngineClient()
+    try:
+        await client.connect(host, port)
+        replies = await asyncio.gather(
+            *[client.request_move(*request) for request in requests])
+        await client.close()
+    finally:
+        await service.close()
+    return replies
+
+
+class TestEngineService:
+    def test_many_games(self):
+        service = AI.EngineService(workers=2)
+        requests = [(f'game{i}', fen, 2, 10.0)
+                    for i, fen in enumerate([italian, forced, checkmate,
+                                             chess.STARTING_FEN])]
+        replies = asyncio.run(serve(service, requests))
+        assert [reply['game'] for reply in replies] == [
+            'game0', 'game1', 'game2', 'game3']
+        assert replies[1]['move'] == 'g2g3'
+        assert replies[2]['move'] is None
+        assert all(reply['depth'] == 2 for reply in replies)
+        assert service.stats['served'] == 4
+
+    def test_deadline_returns_shallower_move(self):
+        service = AI.EngineService(workers=1)
+        replies = asyncio.run(serve(service, [('g', italian, 30, 0.5)]))
+        assert replies[0]['move'] is not None
+        assert 1 <= replies[0]['depth'] < 30
+
+    def test_backpressure_rejects_when_full(self):
+        service = AI.EngineService(workers=1, max_pending=1)
+        requests = [('a', chess.STARTING_FEN, 30, 1.0),
+                    ('b', chess.STARTING_FEN, 30, 0.2)]
+        replies = asyncio.run(serve(service, requests))
+        assert 'move' in replies[0]
+        assert replies[1]['error'] == 'busy'
+
+    def test_bad_request(self):
+        service = AI.EngineService(workers=1)
+        replies = asyncio.run(serve(service, [('g', 'not a fen', 2, 1.0)]))
+        assert replies[0]['error'].startswith('bad request')
+
+    def test_wait_for_worker_respects_deadline(self):
+        service = AI.EngineService(workers=1)
+        requests = [('a', chess.STARTING_FEN, 30, 2.0),
+                    ('b', chess.STARTING_FEN, 30, 0.2)]
+
+        async def timed(request):
+            start = time.perf_counter()
+            reply = await request
+            return reply, time.perf_counter() - start
+
+        async def run():
+            host, port = await service.start()
+            client = AI.EngineClient()
+            try:
+                await client.connect(host, port)
+                replies = await asyncio.gather(
+                    *[timed(client.request_move(*request))
+                      for request in requests])
+                await client.close()
+            finally:
+                await service.close()
+            return replies
+
+        (first, _), (second, waited) = asyncio.run(run())
+        assert 'move' in first
+        assert second['error'] == 'busy'
+        assert waited < 1.0
+
+    def test_new_games_use_free_workers(self):
+        service = AI.EngineService(workers=2)
+        requests = [('g', chess.STARTING_FEN, 30, 1.0),
+                    ('h', italian, 30, 1.0)]
+        start = time.perf_counter()
+        replies = asyncio.run(serve(service, requests))
+        # Queued on one worker, the two searches would take two seconds
+        assert time.perf_counter() - start < 1.9
+        assert all('move' in reply for reply in replies)
+        assert service.free == {0, 1}
+        assert service.homes['g'] != service.homes['h']
+
+    def test_game_keeps_its_worker(self):
+        service = AI.EngineService(workers=2)
+
+        async def run():
+            service.free = {0, 1}
+            service.freed = asyncio.Condition()
+            first = await service.acquire_worker('g', 1.0)
+            # The other worker is free, but holds none of the game's state
+            try:
+                await service.acquire_worker('g', 0.1)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                raise AssertionError('the game was split between workers')
+            other = await service.acquire_worker('h', 1.0)
+            assert other != first
+            await service.release_worker(first)
+            assert await service.acquire_worker('g', 1.0) == first
+
+        asyncio.run(run())
+
+    def test_overrun_is_answered_at_the_deadline(self):
+        service = AI.EngineService(stalling_engine, workers=1)
+
+        async def run():
+            host, port = await service.start()
+            client = AI.EngineClient()
+            try:
+                await client.connect(host, port)
+                start = time.perf_counter()
+                reply = await client.request_move('g', italian, 4, 0.2)
+                waited = time.perf_counter() - start
+                busy = set(service.free)
+                await asyncio.sleep(3.0)
+                await client.close()
+            finally:
+                await service.close()
+            return reply, waited, busy
+
+        reply, waited, busy = asyncio.run(run())
+        assert reply['error'] == 'deadline'
+        assert waited < 2.5
+        assert busy == set()
+        assert service.free == {0}
+
+    def test_close_drops_clients(self):
+        service = AI.EngineService(workers=1)
+
+        async def run():
+            host, port = await service.start()
+            client = AI.EngineClient()
+            await client.connect(host, port)
+            request = asyncio.create_task(
+                client.request_move('g', chess.STARTING_FEN, 30, 2.0))
+            await asyncio.sleep(0.5)
+            await service.close()
+            try:
+                await request
+            except ConnectionError:
+                pass
+            await client.close()
+
+        asyncio.run(run())
+        assert not service.clients
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Nov  1 19:02:37 2026
+
+@author: Prior_Bayes
+"""
+
+import pytest
+import chess
+import AI_Engine_Parts as AI
+
+# Forced mates within the reach of a 3 ply search
+mates = [
+    chess.Board(
+        fen='r1bq2r1/b4pk1/p1pp1p2/1p2pP2/1P2P1PB/3P4/1PPQ2P1/R3K2R w'),
+    chess.Board(fen='6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1'),
+    chess.Board(fen='4kb1r/p2n1ppp/4q3/4p1B1/4P3/1Q6/PPP2PPP/2KR4 w k - 1 0'),
+    chess.Board(fen='r2qkb1r/pp2nppp/3p4/2pNN1B1/2BnP3/3P4/PPP2PPP/R2bK2R w '
+                    'KQkq - 1 0')]
+italian = chess.Board(
+    fen='r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b')
+
+
+def make_engine(pruner, search=AI.SearchEng, quiescence_depth=0):
+    return AI.ChessEngine(search(pruner, AI.MovePicker(),
+                                 quiescence_depth=quiescence_depth),
+                          AI.HeuristicEval(lazy=True))
+
+
+class TestFutilityPruner:
+    def setup_method(self):
+        self.pruner = AI.FutilityPruner()
+
+    def test_margins(self):
+        pruner = AI.FutilityPruner(margins=(1, 2, 4))
+        assert [pruner.futility_margin(depth) for depth in range(5)] == [
+            None, 1, 2, 4, None]
+        assert AI.AlphaBetaPruner().futility_margin(1) is None
+
+    def test_never_skips_tactical_moves(self):
+        board = chess.Board(fen='6k1/5ppp/8/8/8/8/8/R1p3K1 w - - 0 1')
+        assert not self.pruner.can_skip(board, chess.Move.from_uci('a1a8'))
+        assert not self.pruner.can_skip(board, chess.Move.from_uci('a1c1'))
+        assert self.pruner.can_skip(board, chess.Move.from_uci('a1a6'))
+        assert self.pruner.pruned['futility'] == 1
+
+    def test_delta_pruning(self):
+        capture = chess.Move.from_uci('d5d4')
+        board = chess.Board(fen='4k3/8/8/3p4/3Q4/8/8/4K3 b - - 0 1')
+        # Winning the queen brings black from 8 down to beta, but not from 20
+        assert not self.pruner.delta_prune(board, capture, 8, AI.neg_inf, 0)
+        assert self.pruner.delta_prune(board, capture, 20, AI.neg_inf, 0)
+        assert not AI.FutilityPruner(delta_margin=None).delta_prune(
+            board, capture, 20, AI.neg_inf, 0)
+
+    @pytest.mark.parametrize('quiescence_depth', [0, 4])
+    def test_mates_are_not_missed(self, quiescence_depth):
+        for board in mates:
+            plain = make_engine(AI.AlphaBetaPruner(),
+                                quiescence_depth=quiescence_depth)
+            futile = make_engine(AI.FutilityPruner(),
+                                 quiescence_depth=quiescence_depth)
+            assert futile.find_best_move(board, 3) == plain.find_best_move(
+                board, 3)
+            assert futile.find_best_move(board, 3)[1] == AI.inf
+
+    def test_fewer_nodes(self):
+        plain = make_engine(AI.AlphaBetaPruner())
+        futile = make_engine(self.pruner)
+        assert (futile.find_best_move(italian, 3)
+                == plain.find_best_move(italian, 3))
+        assert futile.searchEng.nodes < plain.searchEng.nodes
+        assert self.pruner.pruned['futility'] > 0
+
+    def test_iterative_matches_recursive(self):
+        recursive = make_engine(AI.FutilityPruner())
+        iterative = make_engine(AI.FutilityPruner(), AI.IterativeSearchEng)
+        assert (iterative.find_best_move(italian, 3)
+                == recursive.find_best_move(italian, 3))
+        assert iterative.searchEng.nodes == recursive.searchEng.nodes
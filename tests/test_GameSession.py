@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Nov  7 20:31:17 2026
+
+@author: Prior_Bayes
+"""
+
+import chess
+import AI_Engine_Parts as AI
+
+italian = chess.Board(
+    fen='r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b')
+exchange = chess.Board(
+    fen='r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - '
+        '4 4')
+
+
+def session_engine(session=None):
+    return AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                       AI.MovePicker(), quiescence_depth=4),
+                          AI.PSTEval(), session=session)
+
+
+class TestGameSession:
+    def setup_method(self):
+        self.session = AI.GameSession()
+        self.engine = session_engine(self.session)
+
+    def test_reachable(self):
+        board = exchange.copy()
+        before = AI.position_key(board)
+        board.push_san('Nxe5')
+        after = AI.position_key(board)
+        assert AI.reachable(after, before)
+        # A pawn was captured, so the earlier position cannot come back
+        assert not AI.reachable(before, after)
+        board = exchange.copy()
+        board.push_san('Ke2')
+        assert not AI.reachable(before, AI.position_key(board))
+
+    def test_warm_search_reuses_line(self):
+        board = italian.copy()
+        move, score = self.engine.find_best_move(board, 3)
+        line = self.engine.pv
+        assert self.session.pv == line and len(line) >= 3
+        board.push(line[0])
+        board.push(line[1])
+        assert self.session.expected_line(board) == line[2:]
+        warm = self.engine.find_best_move(board, 3)
+        assert self.session.reused == len(line) - 2
+        cold_engine = session_engine()
+        cold = cold_engine.find_best_move(board, 3)
+        assert warm[1] == cold[1]
+        assert self.engine.searchEng.nodes < cold_engine.searchEng.nodes
+
+    def test_left_line_is_not_reused(self):
+        board = italian.copy()
+        self.engine.find_best_move(board, 2)
+        board.push(next(move for move in board.legal_moves
+                        if move != self.engine.pv[0]))
+        assert self.session.expected_line(board) == []
+
+    def test_aging(self):
+        board = exchange.copy()
+        self.engine.find_best_move(board, 2)
+        hash_moves = self.engine.searchEng.hash_moves
+        assert AI.position_key(board) in hash_moves
+        board.push_san('Nxe5')
+        self.engine.find_best_move(board, 2)
+        assert self.session.aged > 0
+        root = AI.position_key(board)
+        assert all(AI.reachable(key, root) for key in hash_moves)
+        ply = len(board.move_stack) - 1
+        assert list(self.engine.searchEng.killers[ply]) == [0, 0]
+
+    def test_save_and_load(self, tmp_path):
+        path = str(tmp_path / 'session.json')
+        board = italian.copy()
+        self.engine.find_best_move(board, 3)
+        self.session.save(self.engine, path)
+        restarted = session_engine(AI.GameSession(path))
+        search = self.engine.searchEng
+        assert restarted.searchEng.hash_moves == search.hash_moves
+        assert restarted.searchEng.killers == search.killers
+        assert restarted.session.pv == self.session.pv
+        assert restarted.session.root == self.session.root
+        board.push(self.session.pv[0])
+        board.push(self.session.pv[1])
+        assert (restarted.session.expected_line(board)
+                == self.session.expected_line(board))
+        assert not AI.GameSession().load(restarted, str(tmp_path / 'none'))
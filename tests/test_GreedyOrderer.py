@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Nov  4 19:48:13 2026
+
+@author: Prior_Bayes
+"""
+
+import chess
+import AI_Engine_Parts as AI
+
+italian = chess.Board(
+    fen='r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b')
+queen_hangs = chess.Board(fen='4k3/8/8/3q4/8/8/8/3RK3 w - - 0 1')
+special = chess.Board(fen='r3k2r/1P6/8/3pP3/8/8/8/R3K2R w KQkq d6 0 1')
+mateInTwo = chess.Board(
+    fen='r1bq2r1/b4pk1/p1pp1p2/1p2pP2/1P2P1PB/3P4/1PPQ2P1/R3K2R w')
+
+
+def make_engine(orderer, evaluator, search=AI.SearchEng):
+    return AI.ChessEngine(search(AI.AlphaBetaPruner(), orderer), evaluator)
+
+
+class TestGreedyOrderer:
+    def setup_method(self):
+        self.orderer = AI.GreedyOrderer()
+
+    def test_orders_every_move_best_first(self):
+        moves = self.orderer.order_search(queen_hangs)
+        assert sorted(moves, key=str) == sorted(queen_hangs.legal_moves,
+                                                key=str)
+        assert moves[0] == chess.Move.from_uci('d1d5')
+        # Black picks the move best for black
+        assert self.orderer.order_search(italian)[0] in italian.legal_moves
+
+    def test_scores_match_move_delta(self):
+        evaluator = AI.PSTEval()
+        for board in [special, italian, queen_hangs]:
+            moves = list(board.legal_moves)
+            totals = evaluator.full_scan(board)
+            assert self.orderer.child_totals(board, moves) == [
+                evaluator.move_delta(board, move, totals) for move in moves]
+
+    def test_hash_move_first(self):
+        hash_move = chess.Move.from_uci('e1e2')
+        moves = list(self.orderer.pick_moves(queen_hangs,
+                                             AI.encode_move(hash_move)))
+        assert moves[0] == hash_move
+        assert moves.count(hash_move) == 1
+        assert len(moves) == queen_hangs.legal_moves.count()
+
+    def test_reuses_scores_at_the_horizon(self):
+        evaluator = AI.PSTEval()
+        private = make_engine(AI.GreedyOrderer(), AI.PSTEval())
+        shared = make_engine(AI.GreedyOrderer(evaluator), evaluator)
+        assert (shared.find_best_move(italian, 3)
+                == private.find_best_move(italian, 3))
+        assert shared.searchEng.nodes == private.searchEng.nodes
+        assert shared.searchEng.orderer.leaf_hits > 0
+        assert private.searchEng.orderer.leaf_hits == 0
+
+    def test_fewer_nodes_than_unordered(self):
+        plain = make_engine(AI.Orderer(), AI.PSTEval())
+        greedy = make_engine(self.orderer, AI.PSTEval())
+        assert (greedy.find_best_move(italian, 3)[1]
+                == plain.find_best_move(italian, 3)[1])
+        assert greedy.searchEng.nodes < plain.searchEng.nodes
+        assert greedy.find_best_move(mateInTwo, 3)[1] == AI.inf
+
+    def test_iterative_matches_recursive(self):
+        evaluator = AI.PSTEval()
+        recursive = make_engine(AI.GreedyOrderer(evaluator), evaluator)
+        evaluator = AI.PSTEval()
+        iterative = make_engine(AI.GreedyOrderer(evaluator), evaluator,
+                                AI.IterativeSearchEng)
+        assert (iterative.find_best_move(italian, 3)
+                == recursive.find_best_move(italian, 3))
+        assert iterative.searchEng.nodes == recursive.searchEng.nodes
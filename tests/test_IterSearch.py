@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 23 19:15:36 2026
+
+@author: Prior_Bayes
+"""
+
+import chess
+import AI_Engine_Parts as AI
+
+checkmate = chess.Board(
+    fen='rnb1kbnr/ppppp1pp/5p2/8/5PPq/8/PPPPP2P/RNBQKBNR w')
+italian = chess.Board(
+    fen='r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b')
+
+
+def make_engine():
+    return AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                       AI.MovePicker()),
+                          AI.HeuristicEval(lazy=True))
+
+
+class TestIterSearch:
+    def setup_method(self):
+        self.engine = make_engine()
+
+    def test_updates_per_depth(self):
+        updates = list(self.engine.iter_search(italian, 3))
+        complete = [update for update in updates if update.complete]
+        assert [update.depth for update in complete] == [1, 2, 3]
+        nodes = [update.nodes for update in updates]
+        assert nodes == sorted(nodes)
+        assert self.engine.completed_depth == 3
+
+    def test_final_update_matches_find_best_move(self):
+        final = list(self.engine.iter_search(italian, 3))[-1]
+        assert (final.move, final.score) == make_engine().find_best_move(
+            italian, 3)
+
+    def test_best_move_changes_are_reported(self):
+        updates = list(self.engine.iter_search(italian, 2))
+        partial = [update for update in updates if not update.complete]
+        assert len(partial) > 1
+        assert all(earlier.move != later.move
+                   for earlier, later in zip(partial, partial[1:]))
+
+    def test_cancel_keeps_latest(self):
+        latest = None
+        for update in self.engine.iter_search(italian, 10):
+            latest = update
+            if update.depth == 2 and update.complete:
+                break
+        assert latest.move in italian.legal_moves
+        assert self.engine.searchEng.deadline is None
+        assert self.engine.completed_depth == 2
+
+    def test_time_limit(self):
+        updates = list(self.engine.iter_search(italian, 30, time_limit=0.3))
+        assert updates[-1].move is not None
+        assert updates[-1].depth < 30
+
+    def test_no_moves(self):
+        update = list(self.engine.iter_search(checkmate, 2))[-1]
+        assert update.move is None
+        assert update.score == AI.neg_inf
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 25 18:31:07 2026
+
+@author: Prior_Bayes
+"""
+
+import pytest
+import chess
+import AI_Engine_Parts as AI
+
+starting_position = chess.Board()
+checkmate = chess.Board(
+    fen='rnb1kbnr/ppppp1pp/5p2/8/5PPq/8/PPPPP2P/RNBQKBNR w')
+forced = chess.Board(
+    fen='rnb1kbnr/ppppp1pp/5p2/8/5P1q/2N5/PPPPP1PP/R1BQKBNR w')
+italian = chess.Board(
+    fen='r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b')
+mateInTwo = chess.Board(
+    fen='r1bq2r1/b4pk1/p1pp1p2/1p2pP2/1P2P1PB/3P4/1PPQ2P1/R3K2R w')
+
+
+def make_engine(search, orderer=AI.MovePicker):
+    return AI.ChessEngine(search(AI.AlphaBetaPruner(), orderer()),
+                          AI.HeuristicEval(lazy=True))
+
+
+class TestIterativeSearchEng:
+    @pytest.mark.parametrize('orderer', [AI.MovePicker, AI.AttackOrderer])
+    def test_matches_recursive_search(self, orderer):
+        for board in [starting_position, checkmate, forced, italian,
+                      mateInTwo]:
+            recursive = make_engine(AI.SearchEng, orderer)
+            iterative = make_engine(AI.IterativeSearchEng, orderer)
+            assert (iterative.find_best_move(board, 3)
+                    == recursive.find_best_move(board, 3))
+            assert iterative.searchEng.nodes == recursive.searchEng.nodes
+
+    def test_suspend_and_resume(self):
+        engine = make_engine(AI.IterativeSearchEng)
+        board = italian.copy()
+        task = engine.searchEng.start(board, engine.evaluate, 3)
+        steps = 0
+        while task.step(100) is None:
+            steps += 1
+        assert steps > 1
+        assert task.result == make_engine(AI.SearchEng).find_best_move(
+            italian, 3)
+        assert board == italian
+
+    def test_interleaved_tasks(self):
+        engine = make_engine(AI.IterativeSearchEng)
+        boards = [italian.copy(), forced.copy(), mateInTwo.copy()]
+        tasks = [engine.searchEng.start(board, engine.evaluate, 2)
+                 for board in boards]
+        while not all(task.done for task in tasks):
+            for task in tasks:
+                task.step(50)
+        for board, task in zip([italian, forced, mateInTwo], tasks):
+            expected = make_engine(AI.SearchEng).find_best_move(board, 2)
+            assert task.result[1] == expected[1]
+
+    @pytest.mark.parametrize('evaluator', [
+        AI.PSTEval, lambda: AI.HeuristicEval(attack_map=AI.AttackMap())])
+    def test_interleaved_tasks_with_trackers(self, evaluator):
+        engine = AI.ChessEngine(AI.IterativeSearchEng(AI.AlphaBetaPruner(),
+                                                      AI.Orderer()),
+                                evaluator())
+        boards = [italian.copy(), forced.copy(), mateInTwo.copy()]
+        tasks = [engine.searchEng.start(board, engine.evaluate, 3)
+                 for board in boards]
+        while not all(task.done for task in tasks):
+            for task in tasks:
+                task.step(37)
+        for board, task in zip([italian, forced, mateInTwo], tasks):
+            alone = AI.ChessEngine(
+                AI.IterativeSearchEng(AI.AlphaBetaPruner(), AI.Orderer()),
+                evaluator())
+            assert task.result == alone.find_best_move(board, 3)
+            assert task.nodes == alone.searchEng.nodes
+
+    @pytest.mark.parametrize('evaluator', [
+        AI.PSTEval, lambda: AI.HeuristicEval(attack_map=AI.AttackMap())])
+    def test_nested_searches_keep_trackers(self, evaluator):
+        engines = [AI.ChessEngine(search(AI.AlphaBetaPruner(),
+                                         AI.MovePicker()), evaluator())
+                   for search in [AI.IterativeSearchEng, AI.SearchEng]]
+        iterative, recursive = engines
+        assert (iterative.find_best_move(italian, 3, time_limit=30)
+                == recursive.find_best_move(italian, 3, time_limit=30))
+        assert iterative.completed_depth == 3
+        assert (iterative.find_best_moves(italian, 3)
+                == recursive.find_best_moves(italian, 3))
+
+    def test_tracker_without_suspend_is_refused(self):
+        class Counter:
+            def push(self, board, move):
+                pass
+
+            def pop(self):
+                pass
+
+        engine = make_engine(AI.IterativeSearchEng)
+        engine.searchEng.add_tracker(Counter())
+        first = engine.searchEng.start(italian.copy(), engine.evaluate, 3)
+        second = engine.searchEng.start(forced.copy(), engine.evaluate, 3)
+        first.step(10)
+        second.step(10)
+        with pytest.raises(RuntimeError):
+            first.step(10)
+
+    def test_transposition_table(self):
+        table = AI.SharedHashTable(2**12)
+        other = AI.SharedHashTable(2**12)
+        try:
+            recursive = AI.ChessEngine(
+                AI.SearchEng(AI.AlphaBetaPruner(), AI.MovePicker(),
+                             table=table), AI.HeuristicEval(lazy=True))
+            iterative = AI.ChessEngine(
+                AI.IterativeSearchEng(AI.AlphaBetaPruner(), AI.MovePicker(),
+                                      table=other),
+                AI.HeuristicEval(lazy=True))
+            for depth in [2, 3]:
+                assert (iterative.find_best_move(italian, depth)
+                        == recursive.find_best_move(italian, depth))
+                assert (iterative.searchEng.nodes
+                        == recursive.searchEng.nodes)
+            assert len(other) == len(table) > 0
+            assert other.hits == table.hits > 0
+        finally:
+            table.close()
+            other.close()
+
+    def test_timeout(self):
+        engine = make_engine(AI.IterativeSearchEng)
+        update = list(engine.iter_search(italian, 30, time_limit=0.3))[-1]
+        assert update.move is not None
+        assert engine.completed_depth < 30
+
+
+class TestMinimax:
+    def test_minimax_forced(self):
+        search = AI.SearchEng(AI.Pruner(), AI.Orderer())
+        move, _ = search.minimax(forced, AI.HeuristicEval().score_pos)
+        assert move == chess.Move.from_uci('g2g3')
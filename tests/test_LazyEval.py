@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 22:31:47 2026
+
+@author: Prior_Bayes
+"""
+
+import chess
+import AI_Engine_Parts as AI
+
+italian = chess.Board(
+    fen='r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b')
+checkmate = chess.Board(
+    fen='rnb1kbnr/ppppp1pp/5p2/8/5PPq/8/PPPPP2P/RNBQKBNR w')
+up_a_queen = chess.Board(
+    fen='rnb1kbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 1')
+
+
+class TestLazyEval:
+    def setup_method(self):
+        self.eval = AI.HeuristicEval(lazy=True)
+
+    def test_full_window_matches_score_pos(self):
+        score = self.eval.score_window(italian, AI.neg_inf, AI.inf)
+        assert score == AI.HeuristicEval().score_pos(italian)
+        assert self.eval.lazy_exits['space'] == 1
+
+    def test_not_lazy_ignores_window(self):
+        full = AI.HeuristicEval()
+        assert (full.score_window(up_a_queen, -1, 1)
+                == full.score_pos(up_a_queen))
+
+    def test_material_exit_skips_space(self):
+        score = self.eval.score_window(up_a_queen, -1, 1)
+        assert score == 9
+        assert self.eval.lazy_exits['material'] == 1
+        assert self.eval.lazy_exits['space'] == 0
+
+    def test_checkmate(self):
+        assert self.eval.score_pos(checkmate) == AI.neg_inf
+        engine = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                             AI.MovePicker()), self.eval)
+        assert engine.evaluate(checkmate, -1, 1) == AI.neg_inf
+        assert engine.find_best_move(checkmate, 2) == (None, AI.neg_inf)
+        # The search finds mate itself, so the window score does not look
+        assert self.eval.score_window(checkmate, AI.neg_inf, AI.inf) > -10
+
+    def test_search_matches_full_eval(self):
+        lazy_eng = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                               AI.AttackOrderer()),
+                                  self.eval)
+        full_eng = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                               AI.AttackOrderer()),
+                                  AI.HeuristicEval())
+        assert (lazy_eng.find_best_move(italian, 2)
+                == full_eng.find_best_move(italian, 2))
+        assert (self.eval.lazy_exits['space']
+                < sum(self.eval.lazy_exits.values()))
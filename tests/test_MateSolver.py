@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 28 21:26:45 2026
+
+@author: Prior_Bayes
+"""
+
+import time
+import chess
+import AI_Engine_Parts as AI
+
+end_game = chess.Board(
+    fen='8/8/8/8/8/5k2/7P/7K w - - 0 1')
+mateInTwo = chess.Board(
+    fen='r1bq2r1/b4pk1/p1pp1p2/1p2pP2/1P2P1PB/3P4/1PPQ2P1/R3K2R w')
+back_rank = chess.Board(
+    fen='6k1/5ppp/8/8/8/8/5PPP/3R2K1 w - - 0 1')
+fools_mate = chess.Board(
+    fen='rnbqkbnr/pppp1ppp/8/4p3/6P1/5P2/PPPPP2P/RNBQKBNR b KQkq - 0 2')
+checkmate = chess.Board(
+    fen='rnb1kbnr/ppppp1pp/5p2/8/5PPq/8/PPPPP2P/RNBQKBNR w')
+
+
+class TestMateSolver:
+    def setup_method(self):
+        self.solver = AI.MateSolver(max_moves=3)
+
+    def test_mate_in_one(self):
+        line, moves = self.solver.solve(back_rank)
+        assert line == [chess.Move.from_uci('d1d8')]
+        assert moves == 1
+
+    def test_mate_in_one_black(self):
+        line, moves = self.solver.solve(fools_mate)
+        assert line == [chess.Move.from_uci('d8h4')]
+        assert moves == 1
+
+    def test_mate_in_two(self):
+        line, moves = self.solver.solve(mateInTwo)
+        assert moves == 2
+        assert len(line) == 3
+        board = mateInTwo.copy()
+        for move in line:
+            board.push(move)
+        assert board.is_checkmate()
+
+    def test_no_mate(self):
+        assert self.solver.solve(end_game) is None
+        assert self.solver.solve(checkmate) is None
+
+    def test_node_cap(self):
+        solver = AI.MateSolver(max_moves=3, max_nodes=50)
+        assert solver.solve(mateInTwo) is None
+        assert solver.nodes < 200
+
+    def test_limits(self):
+        assert self.solver.solve(mateInTwo, node_limit=50) is None
+        assert self.solver.nodes < 200
+        assert self.solver.solve(mateInTwo,
+                                 deadline=time.perf_counter()) is None
+        assert self.solver.nodes < 200
+        line, _ = self.solver.solve(mateInTwo,
+                                    deadline=time.perf_counter() + 60)
+        assert line[0] == chess.Move.from_uci('d2h6')
+
+
+class TestMateSolverPrePass:
+    def setup_method(self):
+        self.engine = AI.ChessEngine(
+            AI.SearchEng(AI.AlphaBetaPruner(), AI.MovePicker()),
+            AI.HeuristicEval(lazy=True), mate_solver=AI.MateSolver())
+
+    def test_find_best_move_skips_search(self):
+        move, score = self.engine.find_best_move(mateInTwo, 4)
+        assert move == chess.Move.from_uci('d2h6')
+        assert score == AI.inf
+        assert self.engine.searchEng.nodes == 0
+
+    def test_iter_search(self):
+        updates = list(self.engine.iter_search(fools_mate, 4))
+        assert len(updates) == 1
+        assert updates[0].move == chess.Move.from_uci('d8h4')
+        assert updates[0].score == AI.neg_inf
+
+    def test_timed_search_keeps_to_its_limit(self):
+        start = time.perf_counter()
+        move, _ = self.engine.find_best_move(chess.Board(), 3,
+                                             time_limit=0.5)
+        assert time.perf_counter() - start < 1.5
+        assert move in chess.Board().legal_moves
+
+    def test_searches_without_mate(self):
+        move, _ = self.engine.find_best_move(end_game, 2)
+        assert move in end_game.legal_moves
+        assert self.engine.searchEng.nodes > 0
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Nov  5 21:12:09 2026
+
+@author: Prior_Bayes
+"""
+
+import tracemalloc
+import chess
+import AI_Engine_Parts as AI
+
+italian = chess.Board(
+    fen='r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b')
+
+
+def heuristic_engine():
+    return AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                       AI.MovePicker()), AI.HeuristicEval())
+
+
+class TestMemoryProfiler:
+    def setup_method(self):
+        self.engine = heuristic_engine()
+
+    def test_profile_reports_components(self):
+        profiler = AI.MemoryProfiler(self.engine, interval=64)
+        report = profiler.profile(italian, 2)
+        assert not tracemalloc.is_tracing()
+        assert report.nodes == self.engine.searchEng.nodes
+        assert report.peak > 0
+        assert 'search' in report.at_peak
+        assert report.retained['search'][0] > 0
+        assert report.caches['hash moves'][0] == len(
+            self.engine.searchEng.hash_moves)
+        assert 'hash moves' in AI.MemoryProfiler.report(report)
+
+    def test_cap_shrinks_caches(self):
+        profiler = AI.MemoryProfiler(self.engine, cap=50000, interval=64)
+        move = self.engine.find_best_move(italian, 3)
+        assert profiler.shrinks > 0
+        assert profiler.enforce_cap()
+        assert profiler.shrinkable_bytes() <= 50000
+        assert self.engine.searchEng.max_hash_moves < 2**18
+        assert self.engine.evalEng.pawn_table.size < 2**14
+        # Shrinking the caches does not change what the search finds
+        assert move == heuristic_engine().find_best_move(italian, 3)
+
+    def test_cap_too_small_to_meet(self):
+        profiler = AI.MemoryProfiler(self.engine, cap=0)
+        self.engine.find_best_move(italian, 2)
+        assert not profiler.enforce_cap()
+        assert self.engine.searchEng.max_hash_moves == 1
+        assert self.engine.evalEng.pawn_table.size == 2
+
+    def test_pawn_table_resize(self):
+        table = AI.PawnHashTable(64)
+        # Keys in different slots of the small table, so none is overwritten
+        keys = {}
+        for pawns in range(200):
+            keys.setdefault(hash((pawns, 0)) & 63, pawns)
+        for pawns in keys.values():
+            table.store(pawns, 0, pawns)
+        assert len(table) == len(keys)
+        table.resize(1024)
+        assert len(table) == len(keys)
+        assert all(table.probe(pawns, 0) == pawns for pawns in keys.values())
+        # Shrinking keeps one entry for each slot of the smaller table
+        table.resize(16)
+        assert table.size == 16
+        assert len(table) == len({slot & 15 for slot in keys})
+        assert len(table) == sum(slot is not None for slot in table.slots)
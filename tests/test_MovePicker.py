@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 21 20:02:54 2026
+
+@author: Prior_Bayes
+"""
+
+import chess
+import AI_Engine_Parts as AI
+
+starting_position = chess.Board()
+stalemate = chess.Board(
+    fen='3k4/3P4/3K4/8/8/8/8/8 b')
+checkmate = chess.Board(
+    fen='rnb1kbnr/ppppp1pp/5p2/8/5PPq/8/PPPPP2P/RNBQKBNR w')
+italian = chess.Board(
+    fen='r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b')
+fried_liver = chess.Board(
+    fen='r1bqkb1r/ppp2Npp/2n5/3np3/2B5/8/PPPP1PPP/RNBQK2R b')
+en_passant = chess.Board(
+    fen='4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1')
+
+
+class TestMovePicker:
+    def setup_method(self):
+        self.picker = AI.MovePicker()
+
+    def test_yields_every_legal_move_once(self):
+        for board in [starting_position, italian, fried_liver, en_passant]:
+            moves = self.picker.order_search(board)
+            assert len(moves) == len(set(moves))
+            assert set(moves) == set(board.legal_moves)
+
+    def test_no_moves(self):
+        assert self.picker.order_search(stalemate) == []
+        assert self.picker.order_search(checkmate) == []
+
+    def test_captures_by_victim_value(self):
+        moves = self.picker.order_search(fried_liver)
+        # The king capturing the knight on f7 is the only capture
+        assert moves[0] == chess.Move.from_uci('e8f7')
+
+    def test_hash_move_and_killers_first(self):
+        hash_move = chess.Move.from_uci('g1f3')
+        killer = chess.Move.from_uci('e2e4')
+        moves = list(self.picker.pick_moves(starting_position,
+                                            AI.encode_move(hash_move),
+                                            [AI.encode_move(killer)]))
+        assert moves[:2] == [hash_move, killer]
+        assert len(moves) == 20
+
+    def test_illegal_hints_are_skipped(self):
+        hash_move = chess.Move.from_uci('e2e5')
+        code = AI.encode_move(hash_move)
+        moves = list(self.picker.pick_moves(starting_position, code, [code]))
+        assert hash_move not in moves
+        assert len(moves) == 20
+
+    def test_quiets_not_generated_after_cutoff(self):
+        next(self.picker.pick_moves(fried_liver))
+        assert self.picker.generated == {'captures': 1, 'quiets': 0}
+
+    def test_search_matches_attack_orderer(self):
+        picker_eng = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                                 self.picker),
+                                    AI.HeuristicEval())
+        attack_eng = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                                 AI.AttackOrderer()),
+                                    AI.HeuristicEval())
+        assert (picker_eng.find_best_move(italian, 3)
+                == attack_eng.find_best_move(italian, 3))
+        assert picker_eng.searchEng.hash_moves
+        assert (self.picker.generated['quiets']
+                < self.picker.generated['captures'])
+
+    def test_hints_are_packed(self):
+        search = AI.SearchEng(AI.AlphaBetaPruner(), self.picker)
+        AI.ChessEngine(search, AI.HeuristicEval()).find_best_move(italian, 3)
+        assert all(isinstance(code, int)
+                   for code in search.hash_moves.values())
+        killers = [code for pair in search.killers for code in pair if code]
+        assert killers
+        assert all(AI.decode_move(code) for code in killers)
+        search.clear_hints()
+        assert not any(code for pair in search.killers for code in pair)
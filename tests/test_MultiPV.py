@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 24 17:52:20 2026
+
+@author: Prior_Bayes
+"""
+
+import chess
+import AI_Engine_Parts as AI
+
+checkmate = chess.Board(
+    fen='rnb1kbnr/ppppp1pp/5p2/8/5PPq/8/PPPPP2P/RNBQKBNR w')
+end_game = chess.Board(
+    fen='8/8/8/8/8/5k2/7P/7K w - - 0 1')
+italian = chess.Board(
+    fen='r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b')
+
+
+def make_engine():
+    return AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                       AI.MovePicker()),
+                          AI.HeuristicEval())
+
+
+def exact_scores(board, depth):
+    """Score every root move with its own full-window search."""
+    engine = make_engine()
+    scores = []
+    for move in board.legal_moves:
+        child = board.copy()
+        child.push(move)
+        scores.append(engine.find_best_move(child, depth - 1)[1])
+    return sorted(scores, reverse=board.turn)
+
+
+class TestMultiPV:
+    def setup_method(self):
+        self.engine = make_engine()
+
+    def test_scores_match_separate_searches(self):
+        for board in [italian, end_game]:
+            lines = self.engine.find_best_moves(board, 2, 3)
+            assert ([score for _, score in lines]
+                    == exact_scores(board, 2)[:3])
+
+    def test_first_line_matches_find_best_move(self):
+        lines = self.engine.find_best_moves(italian, 3, 2)
+        assert lines[0][1] == make_engine().find_best_move(italian, 3)[1]
+
+    def test_fewer_moves_than_count(self):
+        lines = self.engine.find_best_moves(end_game, 2, 10)
+        assert len(lines) == 3
+
+    def test_no_moves(self):
+        assert self.engine.find_best_moves(checkmate, 2) == []
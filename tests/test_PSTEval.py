@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 21:05:10 2026
+
+@author: Prior_Bayes
+"""
+
+import random
+import chess
+import AI_Engine_Parts as AI
+
+starting_position = chess.Board()
+checkmate = chess.Board(
+    fen='rnb1kbnr/ppppp1pp/5p2/8/5PPq/8/PPPPP2P/RNBQKBNR w')
+castling = chess.Board(
+    fen='4k2r/8/8/8/8/8/8/R3K2R w KQk - 0 1')
+en_passant = chess.Board(
+    fen='4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1')
+promotion = chess.Board(
+    fen='1n2k3/P7/8/8/8/8/8/4K3 w - - 0 1')
+
+
+class TestPSTEval:
+    def setup_method(self):
+        self.eval = AI.PSTEval()
+
+    def test_starting_position_is_equal(self):
+        assert self.eval.score_pos(starting_position) == 0
+
+    def test_starting_position_full_phase(self):
+        assert self.eval.full_scan(starting_position)[2] == AI.MAX_PHASE
+
+    def test_checkmate(self):
+        assert self.eval.score_pos(checkmate) == AI.neg_inf
+
+    def test_mirrored_position_negates_score(self):
+        board = chess.Board(
+            'r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b')
+        mirrored = board.mirror()
+        assert (self.eval.score_pos(board)
+                == -self.eval.score_pos(mirrored))
+
+    def test_special_moves_match_full_scan(self):
+        for board in [castling, en_passant, promotion]:
+            board = board.copy()
+            totals = self.eval.full_scan(board)
+            for move in board.legal_moves:
+                after = self.eval.move_delta(board, move, totals)
+                board.push(move)
+                assert after == self.eval.full_scan(board), move.uci()
+                board.pop()
+
+    def test_incremental_matches_full_scan(self):
+        rng = random.Random(7)
+        board = chess.Board()
+        self.eval.reset(board)
+        for _ in range(120):
+            moves = list(board.legal_moves)
+            if not moves:
+                break
+            move = rng.choice(moves)
+            self.eval.push(board, move)
+            board.push(move)
+            assert self.eval.stack[-1] == self.eval.full_scan(board)
+
+    def test_engine_uses_incremental_path(self):
+        engine = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                             AI.AttackOrderer()),
+                                self.eval)
+        assert self.eval in engine.searchEng.trackers
+        move, _ = engine.find_best_move(promotion, 2)
+        assert move == chess.Move.from_uci('a7b8q')
+        assert len(self.eval.stack) == 1
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 20 20:14:09 2026
+
+@author: Prior_Bayes
+"""
+
+import pytest
+import chess
+import AI_Engine_Parts as AI
+
+empty_board = chess.Board(
+    fen='8/8/8/8/8/8/8/8')
+starting_position = chess.Board()
+end_game = chess.Board(
+    fen='8/8/8/8/8/5k2/7P/7K w - - 0 1')
+broken_pawns = chess.Board(
+    fen='4k3/p1p3p1/2p5/8/3P4/3P4/P5PP/4K3 w - - 0 1')
+
+
+class TestPawnStructure:
+    def setup_method(self):
+        self.eval = AI.HeuristicEval()
+
+    def structure(self, board):
+        return self.eval.pawn_structure(
+            board.pieces_mask(chess.PAWN, chess.WHITE),
+            board.pieces_mask(chess.PAWN, chess.BLACK))
+
+    def test_file_set(self):
+        assert AI.file_set(chess.BB_A2 | chess.BB_A3 | chess.BB_H7) == 0x81
+
+    def test_pawnisland_empty(self):
+        assert self.eval.current_pawnisland(empty_board) == (0, 0)
+
+    def test_pawnisland_starting(self):
+        assert self.eval.current_pawnisland(starting_position) == (1, 1)
+
+    def test_pawnisland_broken(self):
+        assert self.eval.current_pawnisland(broken_pawns) == (3, 3)
+
+    def test_structure_end_game(self):
+        assert self.structure(end_game) == ((1, 0, 1, 1), (0, 0, 0, 0))
+
+    def test_structure_broken(self):
+        assert self.structure(broken_pawns) == ((3, 1, 3, 0), (3, 1, 4, 0))
+
+    def test_structure_is_cached(self):
+        first = self.eval.current_pawn_structure(broken_pawns)
+        board = broken_pawns.copy()
+        board.push_san('Ke2')
+        assert self.eval.current_pawn_structure(board) == first
+        assert self.eval.pawn_table.hits == 1
+        assert self.eval.pawn_table.misses == 1
+
+    def test_weighted_only_when_asked(self):
+        plain = self.eval.score_pos(broken_pawns)
+        assert self.eval.pawn_table.misses == 0
+        white, black = self.eval.current_pawn_structure(broken_pawns)
+        assert (self.eval.score_pos(broken_pawns, [1, 0.2, 0.2, 1])
+                == pytest.approx(plain + white - black))
+
+    def test_search_uses_pawn_table(self):
+        evaluation = AI.HeuristicEval(lazy=True, weights=(1, 0.2, 0.2, 0.5))
+        engine = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                             AI.MovePicker()), evaluation)
+        engine.find_best_move(broken_pawns, 3)
+        assert len(evaluation.pawn_table) > 0
+        assert evaluation.pawn_table.hits > evaluation.pawn_table.misses
+        plain = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                            AI.MovePicker()),
+                               AI.HeuristicEval(lazy=True))
+        assert engine.fingerprint() != plain.fingerprint()
+
+
+class TestPawnHashTable:
+    def setup_method(self):
+        self.table = AI.PawnHashTable(100)
+
+    def test_size_is_power_of_two(self):
+        assert self.table.size == 128
+
+    def test_probe_missing(self):
+        assert self.table.probe(1, 2) is None
+
+    def test_store_and_probe(self):
+        self.table.store(1, 2, (0.5, -0.5))
+        assert self.table.probe(1, 2) == (0.5, -0.5)
+        assert self.table.probe(2, 1) is None
+        assert len(self.table) == 1
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 27 21:40:12 2026
+
+@author: Prior_Bayes
+"""
+
+import multiprocessing
+import chess
+import AI_Engine_Parts as AI
+
+italian = chess.Board(
+    fen='r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b')
+mateInTwo = chess.Board(
+    fen='r1bq2r1/b4pk1/p1pp1p2/1p2pP2/1P2P1PB/3P4/1PPQ2P1/R3K2R w')
+
+
+def store_from_child(name, size, key):
+    table = AI.SharedHashTable(size, name=name)
+    table.store(key, 3, -1.5, AI.LOWER,
+                AI.encode_move(chess.Move.from_uci('e7e8q')))
+    table.close()
+
+
+def make_engine(table=None):
+    return AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                       AI.MovePicker(), table),
+                          AI.HeuristicEval(lazy=True))
+
+
+class TestSharedHashTable:
+    def setup_method(self):
+        self.table = AI.SharedHashTable(1000)
+
+    def teardown_method(self):
+        self.table.close()
+
+    def test_size_is_power_of_two(self):
+        assert self.table.size == 1024
+        assert len(self.table) == 0
+
+    def test_store_and_probe(self):
+        key = AI.position_hash(italian)
+        move = AI.encode_move(chess.Move.from_uci('g8f6'))
+        self.table.store(key, 4, 0.25, AI.EXACT, move)
+        assert self.table.probe(key) == (4, 0.25, AI.EXACT, move)
+        assert self.table.probe(key ^ 1) is None
+
+    def test_mate_scores(self):
+        self.table.store(1, 2, AI.inf, AI.LOWER, 0)
+        self.table.store(2, 2, AI.neg_inf, AI.UPPER, 0)
+        assert self.table.probe(1) == (2, AI.inf, AI.LOWER, 0)
+        assert self.table.probe(2) == (2, AI.neg_inf, AI.UPPER, 0)
+
+    def test_torn_entry_is_rejected(self):
+        self.table.store(5, 2, 1.0, AI.EXACT, 0)
+        self.table.entries['score'][5] = 2.0
+        assert self.table.probe(5) is None
+
+    def test_shared_between_processes(self):
+        key = AI.position_hash(mateInTwo)
+        process = multiprocessing.Process(
+            target=store_from_child, args=(self.table.name, self.table.size,
+                                           key))
+        process.start()
+        process.join()
+        assert self.table.probe(key) == (
+            3, -1.5, AI.LOWER, AI.encode_move(chess.Move.from_uci('e7e8q')))
+
+    def test_search_with_table_matches_score(self):
+        engine = make_engine(self.table)
+        assert (engine.find_best_move(italian, 3)[1]
+                == make_engine().find_best_move(italian, 3)[1])
+        assert len(self.table) > 0
+        assert engine.find_best_move(mateInTwo, 3)[1] == AI.inf
+
+
+class TestLazySMP:
+    def test_find_best_move(self):
+        smp = AI.LazySMP(make_engine, helpers=1, table_size=2**12)
+        move, score = smp.find_best_move(mateInTwo, 3)
+        assert move in mateInTwo.legal_moves
+        assert score == AI.inf
+        assert smp.stats['nodes'] >= smp.stats['main_nodes']
+        assert sorted(smp.stats['time_to_depth']) == [1, 2, 3]
+
+    def test_scaling_report(self):
+        smp = AI.LazySMP(make_engine, table_size=2**12)
+        rows = smp.scaling(italian, 2, (0, 1))
+        assert [row['helpers'] for row in rows] == [0, 1]
+        assert len(smp.report_scaling(rows).splitlines()) == 3
+        assert smp.helpers == 3
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 31 18:24:09 2026
+
+@author: Prior_Bayes
+"""
+
+import chess
+import AI_Engine_Parts as AI
+
+rook_takes_pawn = chess.Board(
+    fen='1k1r4/1pp4p/p7/4p3/8/P5P1/1PP4P/2K1R3 w - - 0 1')
+knight_takes_pawn = chess.Board(
+    fen='1k1r3q/1ppn3p/p4b2/4p3/8/P2N2P1/1PP1R1BP/2K1Q3 w - - 0 1')
+doubled_rooks = chess.Board(fen='3rk3/3r4/8/3p4/8/8/3R4/3RK3 w - - 0 1')
+queen_takes_pawn = chess.Board(fen='4k3/8/2p5/3p4/8/8/3Q4/4K3 w - - 0 1')
+en_passant = chess.Board(fen='4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1')
+italian = chess.Board(
+    fen='r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b')
+
+
+def see(board, uci):
+    return AI.static_exchange(board, chess.Move.from_uci(uci))
+
+
+class TestStaticExchange:
+    def test_undefended_capture(self):
+        assert see(rook_takes_pawn, 'e1e5') == 100
+        assert see(en_passant, 'e5d6') == 100
+
+    def test_x_ray_attackers(self):
+        # The queen behind the bishop and the rook behind the knight join in
+        assert see(knight_takes_pawn, 'd3e5') == -220
+        assert see(doubled_rooks, 'd2d5') == -400
+
+    def test_losing_capture(self):
+        assert see(queen_takes_pawn, 'd2d5') == -800
+        assert AI.is_losing_capture(queen_takes_pawn,
+                                    chess.Move.from_uci('d2d5'))
+        assert not AI.is_losing_capture(rook_takes_pawn,
+                                        chess.Move.from_uci('e1e5'))
+
+
+class TestSEEOrdering:
+    def test_losing_captures_after_quiets(self):
+        queen_move = chess.Move.from_uci('d2d5')
+        moves = AI.MovePicker(use_see=True).order_search(queen_takes_pawn)
+        assert moves[-1] == queen_move
+        moves = AI.AttackOrderer(use_see=True).order_search(queen_takes_pawn)
+        assert moves[-1] == queen_move
+        assert AI.MovePicker().order_search(queen_takes_pawn)[0] == queen_move
+
+    def test_quiescence_skips_losing_captures(self):
+        search = AI.SearchEng(AI.AlphaBetaPruner(), AI.MovePicker(True),
+                              quiescence_depth=4)
+        engine = AI.ChessEngine(search, AI.PSTEval())
+        engine.find_best_move(queen_takes_pawn, 0)
+        assert search.see_skips == 1
+        assert search.nodes == 1
+
+    def test_quiescence_sees_recaptures(self):
+        plain = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                            AI.MovePicker()), AI.PSTEval())
+        quiet = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                            AI.MovePicker(),
+                                            quiescence_depth=4),
+                               AI.PSTEval())
+        # At depth 1, only the quiescence search sees QxP lose the queen
+        assert (plain.find_best_move(queen_takes_pawn, 1)[0]
+                == chess.Move.from_uci('d2d5'))
+        assert (quiet.find_best_move(queen_takes_pawn, 1)[0]
+                != chess.Move.from_uci('d2d5'))
+
+    def test_space_restores_turn(self):
+        board = italian.copy()
+        AI.HeuristicEval().current_space(board)
+        assert board.turn == chess.BLACK
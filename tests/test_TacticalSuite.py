@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Nov  3 21:04:52 2026
+
+@author: Prior_Bayes
+"""
+
+import pytest
+import chess
+import AI_Engine_Parts as AI
+
+epd = ['# Two short tactics',
+       '',
+       '6k1/5ppp/8/8/8/8/8/R5K1 w - - bm Ra8#; id "back rank";',
+       '4k3/8/2p5/3p4/8/8/3Q4/4K3 w - - am Qxd5; id "poisoned pawn";',
+       '4k3/8/8/8/8/8/8/4K2R w K - bm O-O;']
+italian = chess.Board(
+    fen='r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b')
+
+
+def quick_engine():
+    return AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(), AI.MovePicker(),
+                                       quiescence_depth=4), AI.PSTEval())
+
+
+class TestTacticalSuite:
+    def setup_method(self):
+        self.positions = AI.load_epd(epd)
+
+    def test_load_epd(self):
+        assert [position.id for position in self.positions] == [
+            'back rank', 'poisoned pawn', 'line 5']
+        assert self.positions[0].best == ('a1a8',)
+        assert self.positions[1].avoid == ('d2d5',)
+        assert self.positions[2].best == ('e1g1',)
+        with pytest.raises(ValueError):
+            AI.load_epd(['4k3/8/8/8/8/8/8/4K3 w - - id "no operation";'])
+
+    def test_is_solution(self):
+        back_rank, poisoned, _ = self.positions
+        assert AI.is_solution(back_rank, chess.Move.from_uci('a1a8'))
+        assert not AI.is_solution(back_rank, chess.Move.from_uci('a1a7'))
+        assert AI.is_solution(poisoned, chess.Move.from_uci('d2d3'))
+        assert not AI.is_solution(poisoned, chess.Move.from_uci('d2d5'))
+        assert not AI.is_solution(poisoned, None)
+
+    def test_run_and_diff(self):
+        suite = AI.TacticalSuite(self.positions, quick_engine,
+                                 time_limit=None, node_limit=2000,
+                                 max_depth=3, workers=1)
+        results = suite.run()
+        # The engine prefers Rh7 to castling
+        assert [result.solved for result in results] == [True, True, False]
+        assert results[2].nodes is None
+        assert results[0].move == 'a1a8'
+
+        earlier = [results[0]._replace(seconds=results[0].seconds * 10,
+                                       nodes=results[0].nodes * 10),
+                   results[1]._replace(solved=False, seconds=None,
+                                       nodes=None)]
+        changes = AI.TacticalSuite.diff(results, earlier)
+        assert changes['faster'] == ['back rank']
+        assert changes['fewer_nodes'] == ['back rank']
+        assert changes['gained'] == ['poisoned pawn']
+        assert changes['new'] == ['line 5']
+        report = AI.TacticalSuite.report(results, earlier)
+        assert 'solved 2/3 (was 1/2)' in report
+
+    def test_save_and_load(self, tmp_path):
+        results = [AI.SuiteResult('a', 'e2e4', True, 0.5, 100, 3),
+                   AI.SuiteResult('b', None, False, None, None, 0)]
+        path = str(tmp_path / 'results.json')
+        AI.TacticalSuite.save(results, path)
+        assert AI.TacticalSuite.load(path) == results
+
+    def test_limit_required(self):
+        with pytest.raises(ValueError):
+            AI.solve_position(self.positions[0], quick_engine,
+                              time_limit=None)
+        with pytest.raises(ValueError):
+            AI.TacticalSuite(self.positions, quick_engine, time_limit=None)
+        result = AI.solve_position(self.positions[0], quick_engine,
+                                   time_limit=0.5)
+        assert result.solved
+
+    def test_process_pool(self):
+        suite = AI.TacticalSuite(self.positions[:2], quick_engine,
+                                 time_limit=None, node_limit=500,
+                                 max_depth=2, workers=2)
+        serial = AI.TacticalSuite(self.positions[:2], quick_engine,
+                                  time_limit=None, node_limit=500,
+                                  max_depth=2, workers=1)
+        assert ([result.move for result in suite.run()]
+                == [result.move for result in serial.run()])
+
+
+class TestNodeLimit:
+    def test_iter_search_stops_at_node_limit(self):
+        engine = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                             AI.MovePicker()), AI.PSTEval())
+        updates = list(engine.iter_search(italian, 10, node_limit=3000))
+        # Depth 1 always finishes; deeper searches stop soon after the limit
+        assert updates[-1].depth < 10
+        assert engine.searchEng.nodes <= 3001
+        assert engine.searchEng.node_limit is None
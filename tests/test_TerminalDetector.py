@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Oct 29 20:52:16 2026
+
+@author: Prior_Bayes
+"""
+
+import chess
+import AI_Engine_Parts as AI
+
+stalemate = chess.Board(fen='k7/2Q5/1K6/8/8/8/8/8 b - - 0 1')
+fifty_moves = chess.Board(fen='4k3/8/8/8/8/8/4P3/R3K3 w - - 99 80')
+bishop_takes = chess.Board(fen='4k3/8/8/8/8/8/6r1/4K2B w - - 0 1')
+mateInOne = chess.Board(fen='6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1')
+
+
+def make_engine(search=AI.SearchEng):
+    return AI.ChessEngine(search(AI.AlphaBetaPruner(), AI.MovePicker()),
+                          AI.HeuristicEval(lazy=True))
+
+
+class TestTerminalDetector:
+    def setup_method(self):
+        self.detector = AI.TerminalDetector()
+
+    def test_repetition_includes_game_history(self):
+        board = chess.Board()
+        for san in ['Nf3', 'Nf6', 'Ng1', 'Ng8', 'Nf3', 'Nf6', 'Ng1']:
+            board.push_san(san)
+        self.detector.reset(board)
+        assert not self.detector.is_draw(board)
+        board.push_san('Ng8')
+        self.detector.push(board)
+        assert self.detector.is_draw(board)
+        board.pop()
+        self.detector.pop()
+        board.push_san('Nc6')
+        self.detector.push(board)
+        assert not self.detector.is_draw(board)
+        assert self.detector.depth() == 1
+
+    def test_fifty_move_rule(self):
+        board = fifty_moves.copy()
+        self.detector.reset(board)
+        board.push_san('Ra2')
+        self.detector.push(board)
+        assert self.detector.is_draw(board)
+        board.pop()
+        self.detector.pop()
+        board.push_san('e4')
+        self.detector.push(board)
+        assert not self.detector.is_draw(board)
+
+    def test_insufficient_material(self):
+        board = bishop_takes.copy()
+        self.detector.reset(board)
+        board.push_san('Bxg2')
+        self.detector.push(board)
+        assert self.detector.is_draw(board)
+
+    def test_root_is_never_drawn(self):
+        board = chess.Board(fen='4k3/8/8/8/8/8/8/4K3 w - - 0 1')
+        assert not self.detector.is_draw(board)
+
+
+class TestSearchTerminals:
+    def test_stalemate_scores_zero(self):
+        for search in [AI.SearchEng, AI.IterativeSearchEng]:
+            assert make_engine(search).find_best_move(stalemate, 2) == (None,
+                                                                        0)
+
+    def test_mate_at_horizon(self):
+        engine = make_engine()
+        assert engine.find_best_move(mateInOne, 1) == (
+            chess.Move.from_uci('a1a8'), AI.inf)
+
+    def test_stalemate_at_horizon(self):
+        engine = make_engine()
+        search = engine.searchEng
+        # White is a queen up, but black has no moves
+        assert search.leaf_score(stalemate, engine.evaluate, AI.neg_inf,
+                                 AI.inf) == 0
+        board = chess.Board(fen='k7/8/1K6/8/8/8/8/2Q5 w - - 0 1')
+        move, score = engine.find_best_move(board, 1)
+        assert move != chess.Move.from_uci('c1c7')
+        assert score > 0
+
+    def test_evaluate_scores_checkmate(self):
+        board = mateInOne.copy()
+        board.push_san('Ra8#')
+        for evaluation in [AI.HeuristicEval(), AI.HeuristicEval(lazy=True),
+                           AI.PSTEval()]:
+            engine = AI.ChessEngine(AI.SearchEng(AI.AlphaBetaPruner(),
+                                                 AI.MovePicker()), evaluation)
+            assert engine.evaluate(board) == AI.inf
+
+    def test_has_free_move(self):
+        assert AI.has_free_move(chess.Board())
+        assert not AI.has_free_move(stalemate)
+        # The rook shares a rank with its king, so it is not looked at
+        pinned = chess.Board(fen='k7/8/8/8/8/8/8/KR5r w - - 0 1')
+        assert not AI.has_free_move(pinned)
+        assert any(pinned.generate_legal_moves())
+        # Blocked pawns cannot be pushed
+        blocked = chess.Board(fen='7k/8/8/8/8/p7/P7/K7 w - - 0 1')
+        assert not AI.has_free_move(blocked)
+
+    def test_draw_by_fifty_moves_in_search(self):
+        for search in [AI.SearchEng, AI.IterativeSearchEng]:
+            move, score = make_engine(search).find_best_move(fifty_moves, 2)
+            # Every move but a pawn move draws, and the pawn move keeps the
+            # rook
+            assert move.from_square == chess.E2
+            assert score > 0